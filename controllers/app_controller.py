@@ -5,7 +5,8 @@ Este es el controlador maestro que coordina todos los demás controladores
 y gestiona el flujo general de la aplicación.
 """
 
-from typing import Optional, Dict, Any
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Dict, Any, Callable
 
 from models.learning_system import LearningSystem
 from services.persistence_service import PersistenceService
@@ -39,6 +40,9 @@ class AppController:
         # Inicializar controladores
         self._initialize_controllers()
         
+        # Ejecutor para trabajo pesado fuera del hilo de la interfaz
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        
         print("="*70)
         print("✅ Sistema inicializado correctamente\n")
     
@@ -114,6 +118,23 @@ class AppController:
         """
         return self.learning_system.get_statistics()
     
+    def submit_task(self, func: Callable, *args, **kwargs) -> Future:
+        """
+        Ejecuta una tarea en segundo plano.
+        
+        Las tareas se ejecutan de una en una, por lo que nunca acceden
+        al sistema de aprendizaje de forma concurrente entre sí.
+        
+        Args:
+            func: Función a ejecutar
+            *args: Argumentos posicionales
+            **kwargs: Argumentos nombrados
+            
+        Returns:
+            Future con el resultado de la tarea
+        """
+        return self._executor.submit(func, *args, **kwargs)
+    
     def save_system_state(self) -> bool:
         """
         Guarda el estado actual del sistema.
@@ -170,6 +191,9 @@ class AppController:
         """Cierra la aplicación guardando el estado."""
         print("\n🔄 Cerrando aplicación...")
         
+        # Esperar tareas en curso antes de guardar
+        self._executor.shutdown(wait=True)
+        
         # Guardar estado actual
         if self.save_system_state():
             print("✓ Estado guardado")
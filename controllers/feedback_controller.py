@@ -121,10 +121,11 @@ class FeedbackController:
         # Filtrar experiencias del usuario actual
         all_history = self.learning_service.learning_system.historico_usuarios
         
+        edad = user.perfil.edad
+        peso = user.perfil.peso
         user_history = [
             exp for exp in all_history
-            if exp.get('perfil', {}).get('edad') == user.perfil.edad and
-               exp.get('perfil', {}).get('peso') == user.perfil.peso
+            if exp.perfil.get('edad') == edad and exp.perfil.get('peso') == peso
         ]
         
         return user_history
@@ -10,6 +10,7 @@ from typing import Dict, Any, Optional, List
 from models.user import User
 from models.profile import Profile
 from models.routine import Routine
+from models.experience import Experience
 from services.inference_service import InferenceService
 from services.ai_service import AIService
 
@@ -38,7 +39,7 @@ class UserController:
         self.ai_service = ai_service
     
     def classify_user(self, user: User,
-                     user_history: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+                     user_history: Optional[List[Experience]] = None) -> Dict[str, Any]:
         """
         Clasifica al usuario según su experiencia.
         
@@ -5,6 +5,7 @@ Este archivo inicia la aplicación con interfaz gráfica (GUI)
 o en modo consola si no está disponible Tkinter.
 """
 
+import logging
 import sys
 import os
 
@@ -15,9 +16,8 @@ from controllers.app_controller import AppController
 from utils.constants import SYSTEM_NAME, SYSTEM_VERSION
 
 
-def print_banner():
-    """Imprime el banner de inicio."""
-    banner = f"""
+# Banner construido una sola vez al importar
+_BANNER = f"""
 ╔═══════════════════════════════════════════════════════════════════╗
 ║                                                                   ║
 ║   🏋️  {SYSTEM_NAME}                                    ║
@@ -28,7 +28,36 @@ def print_banner():
 ║                                                                   ║
 ╚═══════════════════════════════════════════════════════════════════╝
 """
-    print(banner)
+
+
+_MENU_PROMPT = "\n".join([
+    "\n" + "="*70,
+    "MENÚ PRINCIPAL",
+    "="*70,
+    "1. Crear usuario y generar rutina",
+    "2. Ver estadísticas del sistema",
+    "3. Exportar estadísticas",
+    "4. Reiniciar sistema",
+    "5. Salir",
+    "="*70
+])
+
+_NIVEL_PROMPT = "\nNivel de experiencia:\n1. Principiante\n2. Intermedio\n3. Avanzado"
+_NIVEL_MAP = {1: 'principiante', 2: 'intermedio', 3: 'avanzado'}
+
+_OBJETIVO_PROMPT = ("\nObjetivo:\n1. Perder peso\n2. Ganar masa muscular"
+                    "\n3. Resistencia\n4. Fuerza")
+_OBJETIVO_MAP = {
+    1: 'perder_peso',
+    2: 'ganar_masa',
+    3: 'resistencia',
+    4: 'fuerza'
+}
+
+
+def print_banner():
+    """Imprime el banner de inicio."""
+    print(_BANNER)
 
 
 def run_gui_mode():
@@ -74,15 +103,7 @@ def run_console_mode():
     # Inicializar controlador
     app_controller = AppController()
     
-    print("\n" + "="*70)
-    print("MENÚ PRINCIPAL")
-    print("="*70)
-    print("1. Crear usuario y generar rutina")
-    print("2. Ver estadísticas del sistema")
-    print("3. Exportar estadísticas")
-    print("4. Reiniciar sistema")
-    print("5. Salir")
-    print("="*70)
+    print(_MENU_PROMPT)
     
     while True:
         try:
@@ -129,27 +150,13 @@ def create_user_and_routine(app_controller: AppController):
         peso = float(input("Peso (kg): "))
         altura = float(input("Altura (m): "))
         
-        print("\nNivel de experiencia:")
-        print("1. Principiante")
-        print("2. Intermedio")
-        print("3. Avanzado")
+        print(_NIVEL_PROMPT)
         nivel_num = int(input("Selecciona (1-3): "))
-        nivel_map = {1: 'principiante', 2: 'intermedio', 3: 'avanzado'}
-        nivel = nivel_map.get(nivel_num, 'intermedio')
+        nivel = _NIVEL_MAP.get(nivel_num, 'intermedio')
         
-        print("\nObjetivo:")
-        print("1. Perder peso")
-        print("2. Ganar masa muscular")
-        print("3. Resistencia")
-        print("4. Fuerza")
+        print(_OBJETIVO_PROMPT)
         objetivo_num = int(input("Selecciona (1-4): "))
-        objetivo_map = {
-            1: 'perder_peso',
-            2: 'ganar_masa',
-            3: 'resistencia',
-            4: 'fuerza'
-        }
-        objetivo = objetivo_map.get(objetivo_num, 'ganar_masa')
+        objetivo = _OBJETIVO_MAP.get(objetivo_num, 'ganar_masa')
         
         dias = int(input("Días de entrenamiento por semana (2-7): "))
         limitaciones = input("Limitaciones físicas (o presiona Enter): ").strip()
@@ -242,6 +249,12 @@ def reset_system(app_controller: AppController):
 
 def main():
     """Función principal."""
+    # Carga/guardado a nivel INFO; trazas de generación y aprendizaje con --debug
+    logging.basicConfig(
+        level=logging.DEBUG if '--debug' in sys.argv else logging.INFO,
+        format='%(message)s'
+    )
+    
     print_banner()
     
     # Verificar argumentos de línea de comandos
@@ -6,16 +6,19 @@
 Modelos del dominio del sistema.
 """
 
-from models.profile import Profile
+from models.profile import Profile, PROFILE_DTYPE
 from models.user import User
 from models.exercise import Exercise
 from models.routine import Routine
+from models.experience import Experience
 from models.learning_system import LearningSystem
 
 __all__ = [
     'Profile',
+    'PROFILE_DTYPE',
     'User',
     'Exercise',
     'Routine',
+    'Experience',
     'LearningSystem'
 ]
@@ -5,14 +5,43 @@ Este modelo representa un ejercicio individual dentro de una rutina,
 con todos sus parámetros (series, repeticiones, descanso, etc.).
 """
 
-from dataclasses import dataclass, field
+import re
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from typing import Dict, Any, Optional
 
 
-@dataclass
+_CARDIO = 'cardio'
+
+_COMPOUND_KEYWORDS = (
+    'press', 'squat', 'sentadilla', 'deadlift', 'peso muerto',
+    'dominadas', 'pull', 'remo', 'fondos', 'prensa'
+)
+
+# Una sola pasada sobre el nombre en lugar de un `in` por palabra clave
+_COMPOUND_RE = re.compile('|'.join(map(re.escape, _COMPOUND_KEYWORDS)))
+
+
+@lru_cache(maxsize=512)
+def _is_compound_name(name_lower: str) -> bool:
+    """
+    Determina si un nombre de ejercicio (en minúsculas) es compuesto.
+    
+    Args:
+        name_lower: Nombre del ejercicio en minúsculas
+        
+    Returns:
+        True si contiene alguna palabra clave de ejercicio compuesto
+    """
+    return _COMPOUND_RE.search(name_lower) is not None
+
+
+@dataclass(frozen=True, slots=True, eq=False)
 class Exercise:
     """
-    Modelo de ejercicio.
+    Modelo de ejercicio (inmutable).
+    
+    Para modificar parámetros se crea una copia con `with_params`.
     
     Attributes:
         ejercicio: Nombre del ejercicio
@@ -33,6 +62,8 @@ class Exercise:
     duracion: Optional[str] = None
     intensidad: Optional[str] = None
     notas: Optional[str] = None
+    _is_cardio: bool = field(default=False, init=False, repr=False)
+    _hash: int = field(default=0, init=False, repr=False)
     
     def __post_init__(self):
         """Valida el ejercicio después de la inicialización."""
@@ -42,6 +73,10 @@ class Exercise:
         if not self.grupo or not self.grupo.strip():
             raise ValueError("El grupo muscular no puede estar vacío")
         
+        # Instancia inmutable: los campos derivados se fijan con object.__setattr__
+        object.__setattr__(self, '_is_cardio', self.grupo.lower() == _CARDIO)
+        object.__setattr__(self, '_hash', hash((self.ejercicio, self.grupo)))
+        
         # Validar que tenga los campos apropiados según el tipo
         if self.is_cardio():
             if not self.duracion:
@@ -63,7 +98,7 @@ class Exercise:
         Returns:
             True si es cardio
         """
-        return self.grupo.lower() == 'cardio'
+        return self._is_cardio
     
     def is_compound(self) -> bool:
         """
@@ -72,13 +107,7 @@ class Exercise:
         Returns:
             True si es compuesto
         """
-        compound_keywords = [
-            'press', 'squat', 'sentadilla', 'deadlift', 'peso muerto',
-            'dominadas', 'pull', 'remo', 'fondos', 'prensa'
-        ]
-        
-        ejercicio_lower = self.ejercicio.lower()
-        return any(keyword in ejercicio_lower for keyword in compound_keywords)
+        return _is_compound_name(self.ejercicio.lower())
     
     def get_type(self) -> str:
         """
@@ -101,25 +130,31 @@ class Exercise:
         Returns:
             Diccionario con todos los campos del ejercicio
         """
-        data = {
-            'ejercicio': self.ejercicio,
-            'grupo': self.grupo
+        return {
+            k: v for k, v in (
+                ('ejercicio', self.ejercicio),
+                ('grupo', self.grupo),
+                ('series', self.series),
+                ('repeticiones', self.repeticiones),
+                ('descanso', self.descanso),
+                ('duracion', self.duracion),
+                ('intensidad', self.intensidad),
+                ('notas', self.notas)
+            )
+            if v is not None and v != ''
         }
+    
+    def with_params(self, **changes) -> 'Exercise':
+        """
+        Crea una copia del ejercicio con parámetros modificados.
         
-        if self.series is not None:
-            data['series'] = self.series
-        if self.repeticiones:
-            data['repeticiones'] = self.repeticiones
-        if self.descanso:
-            data['descanso'] = self.descanso
-        if self.duracion:
-            data['duracion'] = self.duracion
-        if self.intensidad:
-            data['intensidad'] = self.intensidad
-        if self.notas:
-            data['notas'] = self.notas
-        
-        return data
+        Args:
+            **changes: Campos a modificar (series, repeticiones, etc.)
+            
+        Returns:
+            Nueva instancia de Exercise
+        """
+        return replace(self, **changes)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Exercise':
@@ -234,4 +269,4 @@ class Exercise:
     
     def __hash__(self) -> int:
         """Hash del ejercicio para usar en sets."""
-        return hash((self.ejercicio, self.grupo))
\ No newline at end of file
+        return self._hash
\ No newline at end of file
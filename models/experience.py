@@ -0,0 +1,71 @@
+"""
+Modelo de Experiencia.
+
+Este modelo representa una experiencia registrada en el histórico del
+sistema de aprendizaje: el perfil del usuario, la rutina evaluada y el
+feedback que dio sobre ella.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Any, Optional
+
+
+@dataclass(frozen=True, slots=True)
+class Experience:
+    """
+    Experiencia de usuario (inmutable).
+
+    El histórico crece sin límite, por lo que cada registro usa slots en
+    lugar de un diccionario.
+
+    Attributes:
+        perfil: Perfil del usuario serializado (Profile.to_dict)
+        rutina_id: ID de la rutina evaluada
+        rutina_exitosa: Rutina serializada si fue exitosa, None si no
+        satisfaccion: Satisfacción reportada (1-5)
+        comentarios: Comentarios del usuario
+        fecha: Fecha ISO del feedback
+    """
+
+    perfil: Dict[str, Any]
+    rutina_id: Optional[str] = None
+    rutina_exitosa: Optional[Dict[str, Any]] = None
+    satisfaccion: Optional[int] = None
+    comentarios: str = ""
+    fecha: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convierte la experiencia a diccionario.
+
+        Returns:
+            Diccionario con todos los campos de la experiencia
+        """
+        return {
+            'perfil': self.perfil,
+            'rutina_id': self.rutina_id,
+            'rutina_exitosa': self.rutina_exitosa,
+            'satisfaccion': self.satisfaccion,
+            'comentarios': self.comentarios,
+            'fecha': self.fecha
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Experience':
+        """
+        Crea una experiencia desde un diccionario.
+
+        Args:
+            data: Diccionario con datos de la experiencia
+
+        Returns:
+            Instancia de Experience
+        """
+        return cls(
+            perfil=data.get('perfil') or {},
+            rutina_id=data.get('rutina_id'),
+            rutina_exitosa=data.get('rutina_exitosa'),
+            satisfaccion=data.get('satisfaccion'),
+            comentarios=data.get('comentarios', ''),
+            fecha=data.get('fecha', '')
+        )
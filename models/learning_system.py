@@ -6,12 +6,16 @@ incluyendo todas las rutinas generadas, histórico de usuarios y patrones
 identificados.
 """
 
+import heapq
 from dataclasses import dataclass, field
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Mapping, Optional, Set, Tuple
 from datetime import datetime
-from collections import defaultdict
+from collections import Counter, deque
+from random import random as _rand01
+from types import MappingProxyType
 
 from config import AIConfig
+from models.experience import Experience
 
 
 @dataclass
@@ -23,7 +27,7 @@ class LearningSystem:
         rutinas_generadas: Lista de todas las rutinas generadas
         historico_usuarios: Lista con histórico de experiencias
         patrones_exitosos: Patrones identificados que funcionan bien
-        combinaciones_ejercicios: Ejercicios que funcionan bien juntos
+        combinaciones_ejercicios: Uso de ejercicios por (grupo, ejercicio)
         parametros_optimos: Parámetros óptimos por perfil
         generacion: Generación actual del sistema
         tasa_aprendizaje: Velocidad de aprendizaje
@@ -31,16 +35,92 @@ class LearningSystem:
     """
     
     rutinas_generadas: List[Dict[str, Any]] = field(default_factory=list)
-    historico_usuarios: List[Dict[str, Any]] = field(default_factory=list)
+    historico_usuarios: List[Experience] = field(default_factory=list)
     patrones_exitosos: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
-    combinaciones_ejercicios: Dict[str, Dict[str, int]] = field(
-        default_factory=lambda: defaultdict(lambda: defaultdict(int))
-    )
+    combinaciones_ejercicios: Counter = field(default_factory=Counter)
     parametros_optimos: Dict[str, Any] = field(default_factory=dict)
     generacion: int = 0
     tasa_aprendizaje: float = AIConfig.LEARNING_RATE
     factor_exploracion: float = AIConfig.EXPLORATION_FACTOR
     
+    # Contadores incrementales de satisfacción (derivados del histórico)
+    _sat_sum: float = field(default=0.0, init=False, repr=False)
+    _sat_count: int = field(default=0, init=False, repr=False)
+    _success_count: int = field(default=0, init=False, repr=False)
+    
+    # Ventana deslizante de las últimas satisfacciones (para evolucionar)
+    _recent_sat: deque = field(
+        default_factory=lambda: deque(maxlen=10), init=False, repr=False
+    )
+    _recent_sum: float = field(default=0.0, init=False, repr=False)
+    
+    # Caché de ejercicios populares por grupo: grupo -> (top_n, ejercicios)
+    _top_cache: Dict[str, Tuple[int, List[str]]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _top_dirty: Set[str] = field(default_factory=set, init=False, repr=False)
+    
+    # Cantidad de patrones por clave, mantenida al registrar cada patrón
+    _pattern_counts: Dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    
+    # Hay cambios sin guardar (lo activan los métodos que modifican el estado)
+    _dirty: bool = field(default=True, init=False, repr=False)
+    
+    # Estadísticas memoizadas hasta la próxima modificación
+    _stats_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False)
+    
+    def __post_init__(self):
+        """Inicializa los contadores a partir del histórico cargado."""
+        # Aceptar experiencias en formato diccionario (datos antiguos)
+        if any(isinstance(exp, dict) for exp in self.historico_usuarios):
+            self.historico_usuarios = [
+                Experience.from_dict(exp) if isinstance(exp, dict) else exp
+                for exp in self.historico_usuarios
+            ]
+        
+        for experience in self.historico_usuarios:
+            self._count_satisfaction(experience)
+        
+        for experience in self.historico_usuarios[-self._recent_sat.maxlen:]:
+            self._push_recent(experience)
+        
+        for key, patterns in self.patrones_exitosos.items():
+            self._pattern_counts[key] = len(patterns)
+    
+    def _touch(self):
+        """Registra una modificación: hay cambios sin guardar y estadísticas nuevas."""
+        self._dirty = True
+        self._stats_cache = None
+    
+    def _count_satisfaction(self, experience: Experience):
+        """
+        Acumula la satisfacción de una experiencia en los contadores.
+        
+        Args:
+            experience: Experiencia de usuario
+        """
+        sat = experience.satisfaccion
+        if sat:
+            self._sat_sum += sat
+            self._sat_count += 1
+            if sat >= 4:
+                self._success_count += 1
+    
+    def _push_recent(self, experience: Experience):
+        """
+        Agrega una satisfacción a la ventana reciente manteniendo la suma.
+        
+        Args:
+            experience: Experiencia de usuario
+        """
+        sat = experience.satisfaccion
+        if sat is None:
+            sat = 3
+        if len(self._recent_sat) == self._recent_sat.maxlen:
+            self._recent_sum -= self._recent_sat[0]
+        self._recent_sat.append(sat)
+        self._recent_sum += sat
+    
     def add_generated_routine(self, routine_data: Dict[str, Any]):
         """
         Registra una rutina generada.
@@ -49,15 +129,23 @@ class LearningSystem:
             routine_data: Datos de la rutina generada
         """
         self.rutinas_generadas.append(routine_data)
+        self._touch()
     
-    def add_user_experience(self, experience: Dict[str, Any]):
+    def add_user_experience(self, experience: Experience):
         """
         Registra una experiencia de usuario.
         
         Args:
-            experience: Diccionario con perfil, rutina y feedback
+            experience: Experiencia con perfil, rutina y feedback
+                (se acepta también un diccionario equivalente)
         """
+        if isinstance(experience, dict):
+            experience = Experience.from_dict(experience)
+        
         self.historico_usuarios.append(experience)
+        self._count_satisfaction(experience)
+        self._push_recent(experience)
+        self._touch()
         
         # Verificar si debe evolucionar generación
         if len(self.historico_usuarios) % AIConfig.USERS_PER_GENERATION == 0:
@@ -75,6 +163,17 @@ class LearningSystem:
             self.patrones_exitosos[key] = []
         
         self.patrones_exitosos[key].append(pattern)
+        self._pattern_counts[key] = self._pattern_counts.get(key, 0) + 1
+        self._touch()
+    
+    def get_pattern_counts(self) -> Mapping[str, int]:
+        """
+        Obtiene la cantidad de patrones exitosos por clave.
+        
+        Returns:
+            Vista de solo lectura clave -> cantidad de patrones
+        """
+        return MappingProxyType(self._pattern_counts)
     
     def increment_exercise_combination(self, grupo: str, ejercicio: str):
         """
@@ -84,10 +183,9 @@ class LearningSystem:
             grupo: Grupo muscular
             ejercicio: Nombre del ejercicio
         """
-        if grupo not in self.combinaciones_ejercicios:
-            self.combinaciones_ejercicios[grupo] = defaultdict(int)
-        
-        self.combinaciones_ejercicios[grupo][ejercicio] += 1
+        self.combinaciones_ejercicios[(grupo, ejercicio)] += 1
+        self._top_dirty.add(grupo)
+        self._touch()
     
     def get_popular_exercises(self, grupo: str, top_n: int = 5) -> List[str]:
         """
@@ -100,17 +198,29 @@ class LearningSystem:
         Returns:
             Lista de ejercicios más usados
         """
-        if grupo not in self.combinaciones_ejercicios:
+        cached = self._top_cache.get(grupo)
+        if grupo not in self._top_dirty and cached and cached[0] == top_n:
+            return list(cached[1])
+        
+        ejercicios = {
+            ej: count
+            for (g, ej), count in self.combinaciones_ejercicios.items()
+            if g == grupo
+        }
+        
+        if not ejercicios:
             return []
         
-        ejercicios = self.combinaciones_ejercicios[grupo]
-        sorted_exercises = sorted(
-            ejercicios.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
+        if top_n >= len(ejercicios):
+            top = sorted(ejercicios.items(), key=lambda x: x[1], reverse=True)
+        else:
+            top = heapq.nlargest(top_n, ejercicios.items(), key=lambda x: x[1])
         
-        return [ex for ex, _ in sorted_exercises[:top_n]]
+        popular = [ex for ex, _ in top]
+        self._top_cache[grupo] = (top_n, popular)
+        self._top_dirty.discard(grupo)
+        
+        return list(popular)
     
     def evolve_generation(self):
         """
@@ -118,11 +228,11 @@ class LearningSystem:
         Ajusta parámetros de aprendizaje basándose en resultados.
         """
         self.generacion += 1
+        self._touch()
         
         # Analizar satisfacción reciente
-        if len(self.historico_usuarios) >= 10:
-            recent = self.historico_usuarios[-10:]
-            avg_satisfaction = sum(u.get('satisfaccion', 3) for u in recent) / 10
+        if len(self._recent_sat) == self._recent_sat.maxlen:
+            avg_satisfaction = self._recent_sum / len(self._recent_sat)
             
             # Ajustar factor de exploración
             if avg_satisfaction >= 4:
@@ -132,6 +242,36 @@ class LearningSystem:
                 # Si no funciona bien, explorar más
                 self.factor_exploracion = min(0.4, self.factor_exploracion + 0.02)
     
+    def set_exploration_factor(self, value: float) -> bool:
+        """
+        Cambia el factor de exploración registrando el cambio.
+        
+        Args:
+            value: Nuevo factor de exploración
+            
+        Returns:
+            True si el valor cambió
+        """
+        if value == self.factor_exploracion:
+            return False
+        
+        self.factor_exploracion = value
+        self._touch()
+        return True
+    
+    def has_unsaved_changes(self) -> bool:
+        """
+        Indica si el estado cambió desde el último guardado.
+        
+        Returns:
+            True si hay cambios sin guardar
+        """
+        return self._dirty
+    
+    def mark_saved(self):
+        """Marca el estado actual como guardado."""
+        self._dirty = False
+    
     def should_explore(self) -> bool:
         """
         Decide si explorar (probar cosas nuevas) o explotar (usar conocimiento).
@@ -139,8 +279,7 @@ class LearningSystem:
         Returns:
             True si debe explorar
         """
-        import random
-        return random.random() < self.factor_exploracion
+        return _rand01() < self.factor_exploracion
     
     def get_total_users(self) -> int:
         """
@@ -167,19 +306,23 @@ class LearningSystem:
         Returns:
             Satisfacción promedio
         """
-        if not self.historico_usuarios:
+        if not self._sat_count:
             return 0.0
         
-        satisfacciones = [
-            u.get('satisfaccion', 0)
-            for u in self.historico_usuarios
-            if u.get('satisfaccion')
-        ]
+        return self._sat_sum / self._sat_count
+    
+    def get_recent_satisfaction(self) -> Tuple[int, float]:
+        """
+        Obtiene el tamaño y el promedio de la ventana reciente.
         
-        if not satisfacciones:
-            return 0.0
+        Returns:
+            Tupla (experiencias_recientes, satisfacción_promedio)
+        """
+        count = len(self._recent_sat)
+        if not count:
+            return 0, 0.0
         
-        return sum(satisfacciones) / len(satisfacciones)
+        return count, self._recent_sum / count
     
     def get_success_rate(self) -> float:
         """
@@ -191,17 +334,27 @@ class LearningSystem:
         if not self.historico_usuarios:
             return 0.0
         
-        successful = sum(
-            1 for u in self.historico_usuarios
-            if u.get('satisfaccion', 0) >= 4
-        )
-        
-        return successful / len(self.historico_usuarios)
+        return self._success_count / len(self.historico_usuarios)
     
     def get_statistics(self) -> Dict[str, Any]:
         """
         Obtiene estadísticas completas del sistema.
         
+        El diccionario se reutiliza hasta la próxima modificación del
+        sistema, por lo que no debe modificarse.
+        
+        Returns:
+            Diccionario con estadísticas
+        """
+        stats = self._stats_cache
+        if stats is None:
+            stats = self._stats_cache = self._compute_statistics()
+        return stats
+    
+    def _compute_statistics(self) -> Dict[str, Any]:
+        """
+        Calcula las estadísticas a partir de los contadores.
+        
         Returns:
             Diccionario con estadísticas
         """
@@ -226,9 +379,45 @@ class LearningSystem:
         Returns:
             Lista de patrones exitosos
         """
-        key = f"{nivel}_{objetivo}"
+        return self.get_patterns_for_key(f"{nivel}_{objetivo}")
+    
+    def get_patterns_for_key(self, key: str) -> List[Dict[str, Any]]:
+        """
+        Obtiene patrones exitosos a partir de una clave ya construida.
+        
+        Args:
+            key: Clave del patrón (ej: Profile.get_pattern_key())
+            
+        Returns:
+            Lista de patrones exitosos
+        """
         return self.patrones_exitosos.get(key, [])
     
+    def count_patterns_for_profile(self, nivel: str, objetivo: str) -> int:
+        """
+        Cuenta los patrones exitosos de un perfil sin construir listas.
+        
+        Args:
+            nivel: Nivel de experiencia
+            objetivo: Objetivo de entrenamiento
+            
+        Returns:
+            Cantidad de patrones
+        """
+        return self._pattern_counts.get(f"{nivel}_{objetivo}", 0)
+    
+    def count_patterns_for_key(self, key: str) -> int:
+        """
+        Cuenta los patrones exitosos de una clave ya construida.
+        
+        Args:
+            key: Clave del patrón (ej: Profile.get_pattern_key())
+            
+        Returns:
+            Cantidad de patrones
+        """
+        return self._pattern_counts.get(key, 0)
+    
     def has_sufficient_data(self) -> bool:
         """
         Verifica si hay suficientes datos para aprendizaje.
@@ -238,26 +427,41 @@ class LearningSystem:
         """
         return len(self.historico_usuarios) >= AIConfig.MIN_SIMILAR_USERS
     
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self, include_history: bool = True) -> Dict[str, Any]:
         """
         Convierte el sistema de aprendizaje a diccionario.
         
+        Args:
+            include_history: Si es False se omite historico_usuarios
+                (la persistencia lo escribe aparte, registro a registro)
+        
         Returns:
             Diccionario con todo el estado del sistema
         """
-        return {
+        data = {
             'rutinas_generadas': self.rutinas_generadas,
-            'historico_usuarios': self.historico_usuarios,
             'patrones_exitosos': self.patrones_exitosos,
-            'combinaciones_ejercicios': {
-                grupo: dict(ejercicios)
-                for grupo, ejercicios in self.combinaciones_ejercicios.items()
-            },
+            'combinaciones_ejercicios': self._nested_combinations(),
             'parametros_optimos': self.parametros_optimos,
             'generacion': self.generacion,
             'tasa_aprendizaje': self.tasa_aprendizaje,
             'factor_exploracion': self.factor_exploracion
         }
+        if include_history:
+            data['historico_usuarios'] = [exp.to_dict() for exp in self.historico_usuarios]
+        return data
+    
+    def _nested_combinations(self) -> Dict[str, Dict[str, int]]:
+        """
+        Agrupa las combinaciones por grupo muscular para serializar.
+        
+        Returns:
+            Diccionario grupo -> {ejercicio: contador}
+        """
+        nested: Dict[str, Dict[str, int]] = {}
+        for (grupo, ejercicio), count in self.combinaciones_ejercicios.items():
+            nested.setdefault(grupo, {})[ejercicio] = count
+        return nested
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'LearningSystem':
@@ -270,17 +474,21 @@ class LearningSystem:
         Returns:
             Instancia de LearningSystem
         """
-        # Reconstruir combinaciones_ejercicios con defaultdict
-        combinaciones = defaultdict(lambda: defaultdict(int))
+        # Aplanar combinaciones_ejercicios a claves (grupo, ejercicio)
+        combinaciones = Counter()
         for grupo, ejercicios in data.get('combinaciones_ejercicios', {}).items():
-            for ejercicio, count in ejercicios.items():
-                combinaciones[grupo][ejercicio] = count
+            combinaciones.update({
+                (grupo, ejercicio): count
+                for ejercicio, count in ejercicios.items()
+            })
         
         return cls(
             rutinas_generadas=data.get('rutinas_generadas', []),
-            historico_usuarios=data.get('historico_usuarios', []),
+            historico_usuarios=[
+                Experience.from_dict(exp) for exp in data.get('historico_usuarios', [])
+            ],
             patrones_exitosos=data.get('patrones_exitosos', {}),
-            combinaciones_ejercicios=dict(combinaciones),
+            combinaciones_ejercicios=combinaciones,
             parametros_optimos=data.get('parametros_optimos', {}),
             generacion=data.get('generacion', 0),
             tasa_aprendizaje=data.get('tasa_aprendizaje', AIConfig.LEARNING_RATE),
@@ -5,19 +5,62 @@ Este modelo representa el perfil numérico de un usuario utilizado
 por el sistema de IA para generar rutinas personalizadas.
 """
 
+import sys
 from dataclasses import dataclass, field
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Union
 from datetime import datetime
 
-from config import Mappings
-from utils.calculations import calculate_imc
-from utils.validators import (
-    validate_age, validate_weight, validate_height,
-    validate_experience_level, validate_goal, validate_training_days
+import numpy as np
+
+from config import Mappings, ValidationConfig
+from utils.calculations import (
+    calculate_imc, calculate_batch_similarity, calculate_profile_similarity,
+    get_imc_category, get_imc_display_name
 )
+from utils.validators import validate_profile_bulk
+
+
+# Mapeos ligados a nombres de módulo para evitar la búsqueda de atributos
+_LEVEL_MAP = Mappings.LEVEL_STR_TO_NUM
+_GOAL_MAP = Mappings.GOAL_STR_TO_NUM
+
+
+def _initial_table(mapping: Dict[str, int]) -> Dict[str, int]:
+    """
+    Indexa un mapeo por la inicial de cada clave si estas son únicas.
+    
+    Args:
+        mapping: Mapeo string -> número
+        
+    Returns:
+        Tabla inicial -> número, o el mapeo original si hay iniciales repetidas
+    """
+    table = {key[0]: value for key, value in mapping.items()}
+    return table if len(table) == len(mapping) else mapping
+
+
+# Los valores ya están validados, así que basta con su primera letra
+_LEVEL_BY_INITIAL = _initial_table(_LEVEL_MAP)
+_GOAL_BY_INITIAL = _initial_table(_GOAL_MAP)
+_LEVEL_KEY_LEN = 1 if _LEVEL_BY_INITIAL is not _LEVEL_MAP else None
+_GOAL_KEY_LEN = 1 if _GOAL_BY_INITIAL is not _GOAL_MAP else None
 
+# Instancias inmutables: los campos derivados se fijan con object.__setattr__
+_set = object.__setattr__
 
-@dataclass
+# Registro empaquetado de un perfil para operaciones vectorizadas (16 bytes)
+PROFILE_DTYPE = np.dtype([
+    ('edad', 'u1'),
+    ('peso', 'f4'),
+    ('altura', 'f4'),
+    ('imc', 'f4'),
+    ('nivel_num', 'i1'),
+    ('objetivo_num', 'i1'),
+    ('dias', 'i1')
+])
+
+
+@dataclass(frozen=True, slots=True)
 class Profile:
     """
     Perfil numérico de usuario para el sistema de IA.
@@ -26,7 +69,7 @@ class Profile:
         edad: Edad del usuario
         peso: Peso en kilogramos
         altura: Altura en metros
-        imc: Índice de Masa Corporal (calculado)
+        imc: Índice de Masa Corporal (calculado, 2 decimales)
         nivel_num: Nivel de experiencia (numérico: 1-3)
         nivel_str: Nivel de experiencia (string)
         objetivo_num: Objetivo de entrenamiento (numérico: 1-4)
@@ -46,7 +89,22 @@ class Profile:
     imc: float = field(init=False)
     nivel_num: int = field(init=False)
     objetivo_num: int = field(init=False)
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    created_at: Optional[str] = None
+    
+    # Serialización memoizada (el perfil es inmutable)
+    _cached_dict: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False
+    )
+    
+    # Clave de identidad para igualdad y hash
+    _key: tuple = field(default=(), init=False, repr=False)
+    
+    # Nombres para mostrar, calculados una sola vez
+    _level_display: str = field(default='', init=False, repr=False)
+    _goal_display: str = field(default='', init=False, repr=False)
+    
+    # Clave de patrones "nivel_objetivo", internada una sola vez
+    _pattern_key: str = field(default='', init=False, repr=False)
     
     def __post_init__(self):
         """
@@ -55,58 +113,67 @@ class Profile:
         # Validar datos básicos
         self._validate()
         
-        # Calcular IMC
-        self.imc = calculate_imc(self.peso, self.altura)
-        
-        # Mapear nivel a numérico
-        self.nivel_num = Mappings.LEVEL_STR_TO_NUM.get(self.nivel_str, 2)
-        
-        # Mapear objetivo a numérico
-        self.objetivo_num = Mappings.GOAL_STR_TO_NUM.get(self.objetivo_str, 2)
+        self._init_derived()
     
-    def _validate(self):
-        """Valida los datos del perfil."""
-        errors = []
+    def _init_derived(self):
+        """Calcula los campos derivados de los datos básicos."""
+        # Internar los valores categóricos (pocos valores distintos)
+        nivel_str = sys.intern(self.nivel_str)
+        objetivo_str = sys.intern(self.objetivo_str)
+        _set(self, 'nivel_str', nivel_str)
+        _set(self, 'objetivo_str', objetivo_str)
         
-        valid, msg = validate_age(self.edad)
-        if not valid:
-            errors.append(msg)
+        if self.created_at is None:
+            _set(self, 'created_at', datetime.now().isoformat())
         
-        valid, msg = validate_weight(self.peso)
-        if not valid:
-            errors.append(msg)
+        # Calcular IMC (redondeado una sola vez)
+        _set(self, 'imc', round(calculate_imc(self.peso, self.altura), 2))
         
-        valid, msg = validate_height(self.altura)
-        if not valid:
-            errors.append(msg)
+        # Mapear nivel y objetivo a numérico
+        _set(self, 'nivel_num', _LEVEL_BY_INITIAL.get(nivel_str[:_LEVEL_KEY_LEN], 2))
+        _set(self, 'objetivo_num', _GOAL_BY_INITIAL.get(objetivo_str[:_GOAL_KEY_LEN], 2))
         
-        valid, msg = validate_experience_level(self.nivel_str)
-        if not valid:
-            errors.append(msg)
+        _set(self, '_level_display', Mappings.LEVEL_DISPLAY_NAMES.get(
+            nivel_str, nivel_str.title()
+        ))
+        _set(self, '_goal_display', Mappings.GOAL_DISPLAY_NAMES.get(
+            objetivo_str, objetivo_str.replace('_', ' ').title()
+        ))
         
-        valid, msg = validate_goal(self.objetivo_str)
-        if not valid:
-            errors.append(msg)
+        _set(self, '_pattern_key', sys.intern(f"{nivel_str}_{objetivo_str}"))
         
-        valid, msg = validate_training_days(self.dias)
-        if not valid:
-            errors.append(msg)
-        
-        if errors:
-            raise ValueError(f"Errores de validación: {'; '.join(errors)}")
+        _set(self, '_key', (
+            self.edad, self.peso, self.altura,
+            nivel_str, objetivo_str, self.dias
+        ))
+    
+    def _validate(self):
+        """Valida los datos del perfil."""
+        msg = validate_profile_bulk(
+            self.edad, self.peso, self.altura,
+            self.nivel_str, self.objetivo_str, self.dias
+        )
+        if msg:
+            raise ValueError(f"Errores de validación: {msg}")
     
     def to_dict(self) -> Dict[str, Any]:
         """
         Convierte el perfil a diccionario.
         
+        El diccionario se construye una sola vez y se reutiliza en
+        llamadas posteriores, por lo que no debe modificarse.
+        
         Returns:
             Diccionario con todos los campos del perfil
         """
-        return {
+        if self._cached_dict is not None:
+            return self._cached_dict
+        
+        cached = {
             'edad': self.edad,
             'peso': self.peso,
             'altura': self.altura,
-            'imc': round(self.imc, 2),
+            'imc': self.imc,
             'nivel_num': self.nivel_num,
             'nivel_str': self.nivel_str,
             'objetivo_num': self.objetivo_num,
@@ -114,27 +181,99 @@ class Profile:
             'dias': self.dias,
             'created_at': self.created_at
         }
+        _set(self, '_cached_dict', cached)
+        return cached
     
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'Profile':
+    def from_dict(cls, data: Dict[str, Any], trusted: bool = False) -> 'Profile':
         """
         Crea un perfil desde un diccionario.
         
         Args:
             data: Diccionario con datos del perfil
+            trusted: Si es True, los datos provienen de to_dict y se
+                omite la validación
             
         Returns:
             Instancia de Profile
         """
+        if trusted:
+            return cls._from_trusted(data)
+        
         return cls(
             edad=data['edad'],
             peso=data['peso'],
             altura=data['altura'],
             nivel_str=data['nivel_str'],
             objetivo_str=data['objetivo_str'],
-            dias=data['dias']
+            dias=data['dias'],
+            created_at=data.get('created_at')
         )
     
+    @classmethod
+    def _from_trusted(cls, data: Dict[str, Any]) -> 'Profile':
+        """
+        Construye un perfil ya validado sin pasar por __init__.
+        
+        Args:
+            data: Diccionario generado por to_dict
+            
+        Returns:
+            Instancia de Profile
+        """
+        obj = cls.__new__(cls)
+        _set(obj, 'edad', data['edad'])
+        _set(obj, 'peso', data['peso'])
+        _set(obj, 'altura', data['altura'])
+        _set(obj, 'nivel_str', data['nivel_str'])
+        _set(obj, 'objetivo_str', data['objetivo_str'])
+        _set(obj, 'dias', data['dias'])
+        _set(obj, 'created_at', data.get('created_at'))
+        _set(obj, '_cached_dict', None)
+        obj._init_derived()
+        return obj
+    
+    @classmethod
+    def from_records(cls, records: List[Dict[str, Any]]) -> List['Profile']:
+        """
+        Crea muchos perfiles a la vez validando los rangos con NumPy.
+        
+        Si todos los registros son válidos se construyen por la vía
+        confiable; si alguno falla se recurre a from_dict registro a
+        registro para reportar el error habitual.
+        
+        Args:
+            records: Diccionarios con el formato de to_dict
+            
+        Returns:
+            Lista de perfiles en el mismo orden
+        """
+        if not records:
+            return []
+        
+        try:
+            edad = np.array([r['edad'] for r in records], dtype=float)
+            peso = np.array([r['peso'] for r in records], dtype=float)
+            altura = np.array([r['altura'] for r in records], dtype=float)
+            dias = np.array([r['dias'] for r in records], dtype=float)
+        except (TypeError, ValueError):
+            return [cls.from_dict(r) for r in records]
+        
+        valid = (
+            (edad >= ValidationConfig.AGE_MIN) & (edad <= ValidationConfig.AGE_MAX) &
+            (peso >= ValidationConfig.WEIGHT_MIN) & (peso <= ValidationConfig.WEIGHT_MAX) &
+            (altura >= ValidationConfig.HEIGHT_MIN) & (altura <= ValidationConfig.HEIGHT_MAX) &
+            (dias >= ValidationConfig.DAYS_MIN) & (dias <= ValidationConfig.DAYS_MAX)
+        )
+        
+        if not valid.all() or not all(
+            r['nivel_str'] in _LEVEL_MAP and r['objetivo_str'] in _GOAL_MAP
+            for r in records
+        ):
+            return [cls.from_dict(r) for r in records]
+        
+        return [cls._from_trusted(r) for r in records]
+    
     @classmethod
     def from_user_data(cls, user_data: Dict[str, Any]) -> 'Profile':
         """
@@ -162,7 +301,6 @@ class Profile:
         Returns:
             Categoría del IMC
         """
-        from utils.calculations import get_imc_category
         return get_imc_category(self.imc)
     
     def get_imc_display_name(self) -> str:
@@ -172,7 +310,6 @@ class Profile:
         Returns:
             Nombre para mostrar
         """
-        from utils.calculations import get_imc_display_name
         return get_imc_display_name(self.imc)
     
     def get_level_display_name(self) -> str:
@@ -182,7 +319,7 @@ class Profile:
         Returns:
             Nombre para mostrar
         """
-        return Mappings.LEVEL_DISPLAY_NAMES.get(self.nivel_str, self.nivel_str.title())
+        return self._level_display
     
     def get_goal_display_name(self) -> str:
         """
@@ -191,10 +328,16 @@ class Profile:
         Returns:
             Nombre para mostrar
         """
-        return Mappings.GOAL_DISPLAY_NAMES.get(
-            self.objetivo_str, 
-            self.objetivo_str.replace('_', ' ').title()
-        )
+        return self._goal_display
+    
+    def get_pattern_key(self) -> str:
+        """
+        Obtiene la clave de patrones exitosos del perfil.
+        
+        Returns:
+            Clave "nivel_objetivo" (ej: "principiante_ganar_masa")
+        """
+        return self._pattern_key
     
     def __repr__(self) -> str:
         """Representación del perfil."""
@@ -204,18 +347,14 @@ class Profile:
     
     def __eq__(self, other) -> bool:
         """Compara dos perfiles."""
-        if not isinstance(other, Profile):
-            return False
-        
-        return (
-            self.edad == other.edad and
-            self.peso == other.peso and
-            self.altura == other.altura and
-            self.nivel_str == other.nivel_str and
-            self.objetivo_str == other.objetivo_str and
-            self.dias == other.dias
+        return self is other or (
+            isinstance(other, Profile) and self._key == other._key
         )
     
+    def __hash__(self) -> int:
+        """Hash del perfil para usar en sets y como clave de diccionario."""
+        return hash(self._key)
+    
     def calculate_similarity_to(self, other: 'Profile') -> float:
         """
         Calcula la similitud con otro perfil.
@@ -226,5 +365,67 @@ class Profile:
         Returns:
             Similitud entre 0 y 1
         """
-        from utils.calculations import calculate_profile_similarity
-        return calculate_profile_similarity(self.to_dict(), other.to_dict())
\ No newline at end of file
+        return calculate_profile_similarity(self.to_dict(), other.to_dict())
+    
+    def _similarity_row(self) -> tuple:
+        """Valores numéricos usados por la similitud vectorizada."""
+        return (self.edad, self.imc, self.nivel_num, self.dias)
+    
+    @staticmethod
+    def pack(profiles: List['Profile']) -> np.ndarray:
+        """
+        Empaqueta perfiles en un array estructurado compacto.
+        
+        Args:
+            profiles: Perfiles a empaquetar
+            
+        Returns:
+            Array (N,) con dtype PROFILE_DTYPE
+        """
+        return np.array(
+            [(p.edad, p.peso, p.altura, p.imc, p.nivel_num, p.objetivo_num, p.dias)
+             for p in profiles],
+            dtype=PROFILE_DTYPE
+        )
+    
+    def batch_similarity(self, others: Union[List['Profile'], np.ndarray]) -> np.ndarray:
+        """
+        Calcula la similitud con una lista de perfiles en una sola operación.
+        
+        Args:
+            others: Perfiles a comparar, o un array ya empaquetado con pack()
+            
+        Returns:
+            Array con la similitud (0 a 1) frente a cada perfil, en orden
+        """
+        if isinstance(others, np.ndarray):
+            return self._packed_similarity(others)
+        
+        if not others:
+            return np.empty(0)
+        
+        matrix = np.array([p._similarity_row() for p in others], dtype=float)
+        objetivo = self.objetivo_str
+        goal_mismatch = np.fromiter(
+            (p.objetivo_str != objetivo for p in others),
+            dtype=float, count=len(others)
+        )
+        
+        return calculate_batch_similarity(
+            np.array(self._similarity_row(), dtype=float),
+            matrix,
+            goal_mismatch
+        )
+    
+    def _packed_similarity(self, packed: np.ndarray) -> np.ndarray:
+        """Similitud frente a un array con dtype PROFILE_DTYPE."""
+        matrix = np.column_stack((
+            packed['edad'], packed['imc'], packed['nivel_num'], packed['dias']
+        )).astype(float)
+        goal_mismatch = (packed['objetivo_num'] != self.objetivo_num).astype(float)
+        
+        return calculate_batch_similarity(
+            np.array(self._similarity_row(), dtype=float),
+            matrix,
+            goal_mismatch
+        )
@@ -6,7 +6,7 @@ por el sistema de IA, con todos sus días y ejercicios.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional, Set
+from typing import Dict, List, Any, Optional, Set, Tuple
 from datetime import datetime
 
 from models.exercise import Exercise
@@ -38,6 +38,11 @@ class Routine:
     satisfaccion: Optional[int] = None
     comentarios: Optional[str] = None
     
+    # (grupo, ejercicio) de los ejercicios de fuerza, calculado al primer uso
+    _strength_cache: Optional[Tuple[Tuple[str, str], ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
     def __post_init__(self):
         """Valida y genera ID después de la inicialización."""
         if not self.routine_id:
@@ -108,6 +113,26 @@ class Routine:
                     groups.add(exercise.grupo)
         return groups
     
+    def get_strength_exercises(self) -> Tuple[Tuple[str, str], ...]:
+        """
+        Obtiene los ejercicios de fuerza de toda la semana, en orden.
+        
+        El resultado se calcula una sola vez y se reutiliza.
+        
+        Returns:
+            Tupla de pares (grupo, ejercicio), sin cardio
+        """
+        cached = self._strength_cache
+        if cached is None:
+            cached = tuple(
+                (exercise.grupo, exercise.ejercicio)
+                for exercises in self.rutina_semanal.values()
+                for exercise in exercises
+                if not exercise.is_cardio()
+            )
+            self._strength_cache = cached
+        return cached
+    
     def has_cardio(self) -> bool:
         """
         Verifica si la rutina incluye cardio.
@@ -209,18 +234,20 @@ class Routine:
         }
     
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'Routine':
+    def from_dict(cls, data: Dict[str, Any], trusted: bool = False) -> 'Routine':
         """
         Crea una rutina desde un diccionario.
         
         Args:
             data: Diccionario con datos de la rutina
+            trusted: Si es True, el perfil proviene de to_dict y no se
+                vuelve a validar
             
         Returns:
             Instancia de Routine
         """
         # Reconstruir perfil
-        perfil = Profile.from_dict(data['perfil'])
+        perfil = Profile.from_dict(data['perfil'], trusted=trusted)
         
         # Reconstruir ejercicios
         rutina_semanal = {}
@@ -5,6 +5,8 @@ Este modelo representa un usuario del sistema con toda su información
 personal y su perfil de entrenamiento.
 """
 
+import itertools
+import time
 from dataclasses import dataclass, field
 from typing import Dict, Any, Optional
 from datetime import datetime
@@ -13,7 +15,17 @@ from models.profile import Profile
 from utils.validators import validate_name, sanitize_string
 
 
-@dataclass
+# Contador monotónico de IDs, sembrado con los milisegundos del arranque
+_USER_ID_COUNTER = itertools.count(int(time.time() * 1000))
+
+# Valores de limitaciones que equivalen a "sin limitaciones"
+_EMPTY_LIMITS = frozenset({'ninguna', 'ninguno', ''})
+
+# Instancias inmutables: los campos derivados se fijan con object.__setattr__
+_set = object.__setattr__
+
+
+@dataclass(frozen=True, slots=True)
 class User:
     """
     Modelo de usuario del sistema.
@@ -29,9 +41,24 @@ class User:
     nombre: str
     perfil: Profile
     limitaciones: str = "ninguna"
-    fecha_inicio: str = field(default_factory=lambda: datetime.now().isoformat())
+    fecha_inicio: Optional[str] = None
     user_id: Optional[str] = None
     
+    # Serialización memoizada (el usuario es inmutable)
+    _cached_dict: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    # Calculado una vez tras sanitizar las limitaciones
+    _has_limitations: bool = field(
+        default=False, init=False, repr=False, compare=False
+    )
+    
+    # Resumen memoizado para get_profile_summary
+    _summary_cache: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
     def __post_init__(self):
         """Valida y sanitiza datos después de la inicialización."""
         # Validar nombre
@@ -40,55 +67,71 @@ class User:
             raise ValueError(msg)
         
         # Sanitizar nombre y limitaciones
-        self.nombre = sanitize_string(self.nombre, max_length=50)
-        self.limitaciones = sanitize_string(self.limitaciones, max_length=500)
+        nombre = sanitize_string(self.nombre, max_length=50)
+        limitaciones = sanitize_string(self.limitaciones, max_length=500)
+        _set(self, 'nombre', nombre)
+        _set(self, 'limitaciones', limitaciones)
+        _set(self, '_has_limitations', (
+            bool(limitaciones) and
+            limitaciones.lower() not in _EMPTY_LIMITS
+        ))
+        
+        if self.fecha_inicio is None:
+            _set(self, 'fecha_inicio', datetime.now().isoformat())
         
         # Generar ID si no existe
         if not self.user_id:
-            self.user_id = self._generate_user_id()
+            _set(self, 'user_id', self._generate_user_id())
     
     def _generate_user_id(self) -> str:
         """
         Genera un ID único para el usuario.
         
         Returns:
-            ID único basado en timestamp y nombre
+            ID único basado en el nombre y un contador monotónico (hex)
         """
-        timestamp = datetime.now().strftime('%Y%m%d%H%M%S')
-        name_part = self.nombre[:3].upper()
-        return f"USER_{name_part}_{timestamp}"
+        return f"USER_{self.nombre[:3].upper()}_{next(_USER_ID_COUNTER):x}"
     
     def to_dict(self) -> Dict[str, Any]:
         """
         Convierte el usuario a diccionario.
         
+        El diccionario se construye una sola vez y se reutiliza en
+        llamadas posteriores, por lo que no debe modificarse.
+        
         Returns:
             Diccionario con toda la información del usuario
         """
-        return {
-            'user_id': self.user_id,
-            'nombre': self.nombre,
-            'perfil': self.perfil.to_dict(),
-            'limitaciones': self.limitaciones,
-            'fecha_inicio': self.fecha_inicio
-        }
+        cached = self._cached_dict
+        if cached is None:
+            cached = {
+                'user_id': self.user_id,
+                'nombre': self.nombre,
+                'perfil': self.perfil.to_dict(),
+                'limitaciones': self.limitaciones,
+                'fecha_inicio': self.fecha_inicio
+            }
+            _set(self, '_cached_dict', cached)
+        return cached
     
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'User':
+    def from_dict(cls, data: Dict[str, Any], trusted: bool = False) -> 'User':
         """
         Crea un usuario desde un diccionario.
         
         Args:
             data: Diccionario con datos del usuario
+            trusted: Si es True, el perfil proviene de to_dict y no se
+                vuelve a validar
             
         Returns:
             Instancia de User
         """
         return cls(
             nombre=data['nombre'],
-            perfil=Profile.from_dict(data['perfil']),
+            perfil=Profile.from_dict(data['perfil'], trusted=trusted),
             limitaciones=data.get('limitaciones', 'ninguna'),
-            fecha_inicio=data.get('fecha_inicio', datetime.now().isoformat()),
+            fecha_inicio=data.get('fecha_inicio'),
             user_id=data.get('user_id')
         )
     
@@ -109,7 +152,7 @@ class User:
             nombre=form_data['nombre'],
             perfil=profile,
             limitaciones=form_data.get('limitaciones', 'ninguna'),
-            fecha_inicio=form_data.get('fecha_inicio', datetime.now().isoformat())
+            fecha_inicio=form_data.get('fecha_inicio')
         )
     
     def get_profile_summary(self) -> str:
@@ -119,12 +162,17 @@ class User:
         Returns:
             String con resumen del perfil
         """
-        return (
-            f"{self.nombre} - {self.perfil.edad} años - "
-            f"IMC: {self.perfil.imc:.1f} ({self.perfil.get_imc_display_name()}) - "
-            f"{self.perfil.get_level_display_name()} - "
-            f"{self.perfil.get_goal_display_name()}"
-        )
+        summary = self._summary_cache
+        if summary is None:
+            perfil = self.perfil
+            summary = (
+                f"{self.nombre} - {perfil.edad} años - "
+                f"IMC: {perfil.imc:.1f} ({perfil.get_imc_display_name()}) - "
+                f"{perfil.get_level_display_name()} - "
+                f"{perfil.get_goal_display_name()}"
+            )
+            _set(self, '_summary_cache', summary)
+        return summary
     
     def has_limitations(self) -> bool:
         """
@@ -133,10 +181,7 @@ class User:
         Returns:
             True si tiene limitaciones
         """
-        return (
-            self.limitaciones and 
-            self.limitaciones.lower() not in ['ninguna', 'ninguno', '']
-        )
+        return self._has_limitations
     
     def __repr__(self) -> str:
         """Representación del usuario."""
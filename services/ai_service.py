@@ -7,10 +7,15 @@ usando inteligencia artificial y aprendizaje automático.
 PARTE 1: Inicialización y generación principal
 """
 
+import logging
 import random
-from typing import Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Set, Tuple
 from datetime import datetime
 
+import numpy as np
+
 from models.profile import Profile
 from models.exercise import Exercise
 from models.routine import Routine
@@ -20,6 +25,71 @@ from services.inference_service import InferenceService
 from services.learning_service import LearningService
 
 
+logger = logging.getLogger(__name__)
+
+# Claves de los días de la semana, construidas una sola vez
+_DAY_KEYS = tuple(f"Día {i}" for i in range(1, 8))
+
+# Intensidades de cardio por objetivo (se indexan con enteros sorteados)
+_INTENSITIES_LOSS = ('alta', 'HIIT')
+_INTENSITIES_END = ('moderada', 'alta')
+_INTENSITIES_BASE = ('moderada',)
+
+# (duración mínima, duración máxima, intensidades) del cardio por objetivo
+_CARDIO_PLAN_BY_GOAL = {
+    'perder_peso': (20, 30, _INTENSITIES_LOSS),
+    'resistencia': (25, 40, _INTENSITIES_END),
+}
+_CARDIO_PLAN_DEFAULT = (15, 20, _INTENSITIES_BASE)
+
+# Un bit por grupo muscular para comprobar cobertura con operaciones enteras
+_GROUP_TO_BIT = {
+    'pecho': 1, 'espalda': 2, 'piernas': 4,
+    'hombros': 8, 'brazos': 16, 'core': 32, 'cardio': 64
+}
+_MAJOR_GROUPS = ('pecho', 'espalda', 'piernas')
+_MAJOR_MASK = _GROUP_TO_BIT['pecho'] | _GROUP_TO_BIT['espalda'] | _GROUP_TO_BIT['piernas']
+
+
+@dataclass(slots=True)
+class _RoutineSummary:
+    """Métricas de una rutina obtenidas en un único recorrido."""
+    
+    total_days: int = 0
+    total_exercises: int = 0
+    groups: Set[str] = field(default_factory=set)
+    groups_mask: int = 0
+    cardio_days: int = 0
+    low_series: List[Tuple[str, str]] = field(default_factory=list)
+    
+    @property
+    def exercises_per_day(self) -> float:
+        """Promedio de ejercicios por día."""
+        return self.total_exercises / self.total_days if self.total_days else 0
+    
+    @property
+    def complexity(self) -> float:
+        """Score de complejidad (misma fórmula que Routine.get_complexity_score)."""
+        complexity = (
+            (self.exercises_per_day / 7) * 0.4 +
+            (len(self.groups) / 6) * 0.4 +
+            (0.2 if self.cardio_days else 0)
+        )
+        return min(1.0, complexity)
+
+
+@dataclass(frozen=True, slots=True)
+class _ExplorationPlan:
+    """Constantes de exploración precalculadas para (días, nivel, objetivo)."""
+    
+    structure: str
+    params_config: Dict[str, Any]
+    series: int
+    cardio_probability: float
+    # Por día: tupla de (grupo, cantidad, pool de ejercicios)
+    days: Tuple[Tuple[Tuple[str, int, Tuple[str, ...]], ...], ...]
+
+
 class AIService:
     """
     Servicio principal de IA para generación de rutinas.
@@ -41,6 +111,20 @@ class AIService:
         self.learning_system = learning_system
         self.exercise_db = ExerciseDatabase()
         
+        # Generador vectorizado para los parámetros de cada día
+        self._rng = np.random.default_rng()
+        
+        # Tablas de configuración ligadas a la instancia
+        self._params_by_goal = RoutineConfig.PARAMS_BY_GOAL
+        self._series_by_level = RoutineConfig.SERIES_BY_LEVEL
+        self._ex_per_struct = RoutineConfig.EXERCISES_PER_STRUCTURE
+        
+        # Pools de ejercicios por (grupo, es_principiante), construidos una vez
+        self._pools = self._build_exercise_pools(self.exercise_db.EXERCISES)
+        
+        # Planes de exploración especializados por (días, nivel, objetivo)
+        self._exploration_plans: Dict[Tuple[int, str, str], _ExplorationPlan] = {}
+        
         # Inicializar servicios auxiliares
         self.inference_service = InferenceService(learning_system)
         self.learning_service = LearningService(learning_system)
@@ -65,7 +149,50 @@ class AIService:
         Returns:
             Rutina generada
         """
-        print("\n🧠 Generando rutina con IA...")
+        return self.generate_intelligent_routines([profile])[0]
+    
+    def generate_intelligent_routines(self, profiles: List[Profile]) -> List[Routine]:
+        """
+        Genera rutinas para varios perfiles compartiendo los sorteos.
+        
+        Las decisiones de cardio de todas las semanas se sortean en una
+        sola llamada al generador antes de construir cada rutina.
+        
+        Args:
+            profiles: Perfiles de los usuarios
+            
+        Returns:
+            Rutinas generadas, en el mismo orden que los perfiles
+        """
+        if not profiles:
+            return []
+        
+        probabilities = np.array([
+            self._params_by_goal[p.objetivo_str]['cardio_probability']
+            for p in profiles
+        ])
+        cardio_matrix = (
+            self._rng.random((len(profiles), len(_DAY_KEYS))) < probabilities[:, None]
+        ).tolist()
+        
+        return [
+            self._generate_for_profile(profile, cardio_days)
+            for profile, cardio_days in zip(profiles, cardio_matrix)
+        ]
+    
+    def _generate_for_profile(self, profile: Profile,
+                              cardio_days: List[bool]) -> Routine:
+        """
+        Genera y registra la rutina de un perfil.
+        
+        Args:
+            profile: Perfil del usuario
+            cardio_days: Días (por índice) que llevan cardio
+            
+        Returns:
+            Rutina generada
+        """
+        logger.debug("🧠 Generando rutina con IA...")
         
         # Paso 1: Inferir parámetros óptimos
         optimal_params = self.inference_service.infer_optimal_parameters(profile)
@@ -77,15 +204,15 @@ class AIService:
         should_exploit = self.learning_service.should_use_learning_mode(profile)
         
         if should_exploit:
-            print("   → Modo EXPLOTACIÓN: Basándose en conocimiento previo")
-            routine_dict = self._generate_learned_routine(profile)
+            logger.debug("   → Modo EXPLOTACIÓN: Basándose en conocimiento previo")
+            routine_dict = self._generate_learned_routine(profile, cardio_days)
         else:
-            print("   → Modo EXPLORACIÓN: Generando rutina innovadora")
-            routine_dict = self._generate_exploration_routine(profile)
+            logger.debug("   → Modo EXPLORACIÓN: Generando rutina innovadora")
+            routine_dict = self._generate_exploration_routine(profile, cardio_days)
         
         # Paso 4: Aplicar parámetros optimizados
         if optimal_params['confianza'] >= 0.6:
-            print("\n   ✓ Aplicando parámetros optimizados")
+            logger.debug("   ✓ Aplicando parámetros optimizados")
             routine_dict = self._apply_optimal_parameters(routine_dict, optimal_params)
         
         # Paso 5: Crear objeto Routine
@@ -114,8 +241,8 @@ class AIService:
         
         self.learning_system.add_generated_routine(routine_data)
         
-        print(f"\n   🎯 Satisfacción predicha: {prediction['satisfaccion_predicha']}/5")
-        print(f"   🎯 Confianza: {prediction['confianza']*100:.0f}%")
+        logger.debug("   🎯 Satisfacción predicha: %s/5", prediction['satisfaccion_predicha'])
+        logger.debug("   🎯 Confianza: %.0f%%", prediction['confianza'] * 100)
         
         return routine
     
@@ -123,74 +250,137 @@ class AIService:
     # GENERACIÓN EN MODO EXPLORACIÓN
     # ========================================================================
     
-    def _generate_exploration_routine(self, profile: Profile) -> Dict[str, Any]:
+    def _generate_exploration_routine(self, profile: Profile,
+                                      cardio_days: Optional[List[bool]] = None) -> Dict[str, Any]:
         """
         Genera rutina explorando nuevas combinaciones.
         
         Args:
             profile: Perfil del usuario
+            cardio_days: Días con cardio ya sorteados (opcional)
             
         Returns:
             Diccionario con rutina generada
         """
-        # Decidir estructura según días
-        structure = self._decide_structure(profile.dias)
+        plan = self._get_exploration_plan(
+            profile.dias, profile.nivel_str, profile.objetivo_str
+        )
+        structure = plan.structure
+        rng = self._rng
         
-        # Decidir grupos por día según estructura
-        groups_per_day = self._decide_groups_per_day(structure, profile.dias)
+        # Decisión de cardio de toda la semana en un solo sorteo
+        if cardio_days is None:
+            cardio_days = (rng.random(len(plan.days)) < plan.cardio_probability).tolist()
+        else:
+            # El sorteo por lotes cubre la semana completa; solo cuentan
+            # los días que tiene el plan
+            cardio_days = cardio_days[:len(plan.days)]
         
         # Generar ejercicios para cada día
         weekly_routine = {}
-        for day_num, groups in enumerate(groups_per_day, 1):
+        # Posiciones (lista del día, índice) de los ejercicios de fuerza
+        strength_refs = []
+        # Cardio de toda la semana sorteado de una vez
+        cardio_exercises = iter(self._draw_cardio_batch(
+            profile.objetivo_str, sum(cardio_days)
+        ))
+        for day_index, day_plan in enumerate(plan.days):
             day_exercises = []
             
-            for group in groups:
-                num_exercises = self._decide_exercises_per_group(
-                    group, structure, profile.nivel_str
-                )
-                
-                exercises = self._select_innovative_exercises(
-                    group, num_exercises, profile.nivel_str
-                )
-                
+            selections = [
+                (group, list(pool) if count >= len(pool) else
+                 [pool[i] for i in rng.choice(len(pool), size=count, replace=False)])
+                for group, count, pool in day_plan
+            ]
+            
+            # Parámetros de fuerza de todo el día en un solo sorteo
+            strength_params = iter(self._draw_param_batch(
+                sum(len(names) for group, names in selections if group != 'cardio'),
+                plan.params_config, plan.series
+            ))
+            
+            for group, exercises in selections:
                 for exercise_name in exercises:
-                    params = self._generate_experimental_parameters(
-                        profile.objetivo_str, profile.nivel_str, group
-                    )
-                    
                     if group == 'cardio':
+                        params = self._generate_experimental_cardio_parameters()
                         exercise = Exercise.create_cardio_exercise(
                             exercise_name,
                             params['duracion'],
                             params['intensidad']
                         )
                     else:
+                        series, repeticiones, descanso = next(strength_params)
                         exercise = Exercise.create_strength_exercise(
                             exercise_name,
                             group,
-                            params['series'],
-                            params['repeticiones'],
-                            params['descanso']
+                            series,
+                            repeticiones,
+                            descanso
                         )
+                        strength_refs.append((day_exercises, len(day_exercises)))
                     
                     day_exercises.append(exercise)
             
             # Agregar cardio si es necesario
-            if self._needs_cardio(profile.objetivo_str, day_num):
-                cardio_ex = self._generate_cardio_exercise(profile.objetivo_str)
-                day_exercises.append(cardio_ex)
+            if cardio_days[day_index]:
+                day_exercises.append(next(cardio_exercises))
             
-            weekly_routine[f"Día {day_num}"] = day_exercises
+            weekly_routine[_DAY_KEYS[day_index]] = day_exercises
         
         return {
             'rutina_semanal': weekly_routine,
             'estructura': structure,
+            '_strength_exercises': strength_refs,
             'metadatos': {
                 'modo_generacion': 'exploracion',
                 'innovacion_level': 'alta'
             }
         }
     
+    def _get_exploration_plan(self, days: int, level: str,
+                              goal: str) -> _ExplorationPlan:
+        """
+        Obtiene (o construye la primera vez) el plan de exploración.
+        
+        El plan fija estructura, grupos, cantidades, pools y parámetros,
+        de modo que generar una rutina solo requiere los sorteos.
+        
+        Args:
+            days: Días de entrenamiento por semana
+            level: Nivel del usuario
+            goal: Objetivo del usuario
+            
+        Returns:
+            Plan de exploración especializado
+        """
+        key = (days, level, goal)
+        plan = self._exploration_plans.get(key)
+        if plan is not None:
+            return plan
+        
+        structure = self._decide_structure(days)
+        params_config = self._params_by_goal.get(goal)
+        is_beginner = level == 'principiante'
+        empty: Tuple[str, ...] = ()
+        
+        plan = _ExplorationPlan(
+            structure=structure,
+            params_config=params_config,
+            series=self._series_by_level.get(level, 4),
+            cardio_probability=params_config['cardio_probability'],
+            days=tuple(
+                tuple(
+                    (group,
+                     self._decide_exercises_per_group(group, structure, level),
+                     self._pools.get((group, is_beginner), empty))
+                    for group in groups
+                )
+                for groups in self._decide_groups_per_day(structure, days)
+            )
+        )
+        self._exploration_plans[key] = plan
+        return plan
+    
     def _decide_structure(self, days: int) -> str:
         """Decide la estructura de entrenamiento según días disponibles."""
         if days <= 3:
@@ -200,131 +390,177 @@ class AIService:
         else:
             return 'split'
     
-    def _decide_groups_per_day(self, structure: str, days: int) -> List[List[str]]:
-        """Decide qué grupos trabajar cada día según estructura."""
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _decide_groups_per_day(structure: str, days: int) -> Tuple[Tuple[str, ...], ...]:
+        """Decide qué grupos trabajar cada día según estructura (memoizado)."""
         if structure == 'fullbody':
             # Todos los grupos cada día
-            groups = ['pecho', 'espalda', 'piernas', 'hombros', 'brazos']
-            return [groups] * days
+            groups = ('pecho', 'espalda', 'piernas', 'hombros', 'brazos')
+            return (groups,) * days
         
         elif structure == 'upper_lower':
             # Alternar tren superior e inferior
-            return [
-                ['pecho', 'espalda', 'hombros', 'brazos'],
-                ['piernas', 'core'],
-                ['pecho', 'espalda', 'brazos'],
-                ['piernas', 'hombros', 'core']
-            ][:days]
+            return (
+                ('pecho', 'espalda', 'hombros', 'brazos'),
+                ('piernas', 'core'),
+                ('pecho', 'espalda', 'brazos'),
+                ('piernas', 'hombros', 'core')
+            )[:days]
         
         else:  # split
             # Un grupo principal por día
-            base_split = [
-                ['pecho', 'brazos'],
-                ['espalda'],
-                ['piernas'],
-                ['hombros', 'brazos'],
-                ['pecho', 'espalda'],
-                ['piernas', 'core']
-            ]
+            base_split = (
+                ('pecho', 'brazos'),
+                ('espalda',),
+                ('piernas',),
+                ('hombros', 'brazos'),
+                ('pecho', 'espalda'),
+                ('piernas', 'core')
+            )
             return base_split[:days]
     
     def _decide_exercises_per_group(self, group: str, structure: str, 
                                    level: str) -> int:
         """Decide cuántos ejercicios hacer por grupo."""
-        from config import RoutineConfig
-        
         if group == 'cardio':
             return 1
         
-        config = RoutineConfig.EXERCISES_PER_STRUCTURE.get(structure, {})
+        config = self._ex_per_struct.get(structure, {})
         return config.get(level, 2)
     
+    @staticmethod
+    def _build_exercise_pools(exercises: Dict[str, Any]) -> Dict[Tuple[str, bool], Tuple[str, ...]]:
+        """
+        Precalcula los pools de ejercicios de cada grupo.
+        
+        Args:
+            exercises: Base de ejercicios por grupo
+            
+        Returns:
+            Diccionario (grupo, es_principiante) -> tupla de ejercicios
+        """
+        pools = {}
+        for group, available in exercises.items():
+            if isinstance(available, dict):
+                compuestos = tuple(available.get('compuestos', []))
+                # Principiantes: más compuestos; otros: mezclar
+                pools[(group, True)] = compuestos
+                pools[(group, False)] = compuestos + tuple(available.get('aislamiento', []))
+            else:
+                # Lista simple (como cardio o core)
+                pools[(group, True)] = pools[(group, False)] = tuple(available)
+        return pools
+    
     def _select_innovative_exercises(self, group: str, count: int, 
                                     level: str) -> List[str]:
         """Selecciona ejercicios innovadores mezclando tipos."""
-        if group not in self.exercise_db.EXERCISES:
+        pool = self._pools.get((group, level == 'principiante'))
+        if pool is None:
             return []
         
-        available = self.exercise_db.EXERCISES[group]
+        # Si se piden todos, no hace falta sortear
+        if count >= len(pool):
+            return list(pool)
         
-        if isinstance(available, dict):
-            # Mezclar compuestos y aislamiento
-            if level == 'principiante':
-                # Principiantes: más compuestos
-                pool = available.get('compuestos', [])
-            else:
-                # Otros: mezclar
-                pool = (available.get('compuestos', []) + 
-                       available.get('aislamiento', []))
-            
-            return random.sample(pool, min(count, len(pool)))
-        else:
-            # Lista simple (como cardio o core)
-            return random.sample(available, min(count, len(available)))
+        return [pool[i] for i in self._rng.choice(len(pool), size=count, replace=False)]
     
-    def _generate_experimental_parameters(self, objetivo: str, nivel: str, 
-                                         grupo: str) -> Dict[str, Any]:
-        """Genera parámetros experimentales."""
-        from config import RoutineConfig
+    @staticmethod
+    def _generate_experimental_cardio_parameters() -> Dict[str, Any]:
+        """
+        Genera parámetros experimentales para un cardio del plan del día.
         
-        params_config = RoutineConfig.PARAMS_BY_GOAL.get(objetivo)
-        series_config = RoutineConfig.SERIES_BY_LEVEL.get(nivel, 4)
+        Los parámetros de fuerza se sortean por lotes en _draw_param_batch.
+        """
+        return {
+            'duracion': f"{random.randint(15, 30)} min",
+            'intensidad': random.choice(['moderada', 'alta', 'HIIT'])
+        }
+    
+    def _draw_param_batch(self, n: int, params_config: Dict[str, Any],
+                          series: int) -> List[Tuple[int, str, str]]:
+        """
+        Sortea de una vez los parámetros de n ejercicios de fuerza.
         
-        if grupo == 'cardio':
-            return {
-                'duracion': f"{random.randint(15, 30)} min",
-                'intensidad': random.choice(['moderada', 'alta', 'HIIT'])
-            }
+        Args:
+            n: Número de ejercicios
+            params_config: Parámetros del objetivo (PARAMS_BY_GOAL)
+            series: Series según el nivel (SERIES_BY_LEVEL)
+            
+        Returns:
+            Lista de tuplas (series, repeticiones, descanso)
+        """
+        if n <= 0:
+            return []
         
         reps_min = params_config['reps_min']
         reps_max = params_config['reps_max']
         
-        return {
-            'series': series_config,
-            'repeticiones': f"{random.randint(reps_min, reps_min+2)}-{random.randint(reps_max-2, reps_max)}",
-            'descanso': f"{random.randint(params_config['rest_min'], params_config['rest_max'])}s"
-        }
+        rng = self._rng
+        reps_lo = rng.integers(reps_min, reps_min + 3, size=n).tolist()
+        reps_hi = rng.integers(reps_max - 2, reps_max + 1, size=n).tolist()
+        rest = rng.integers(
+            params_config['rest_min'], params_config['rest_max'] + 1, size=n
+        ).tolist()
+        
+        return [
+            (series, f"{lo}-{hi}", f"{r}s")
+            for lo, hi, r in zip(reps_lo, reps_hi, rest)
+        ]
     
-    def _needs_cardio(self, objetivo: str, day_num: int) -> bool:
-        """Decide si agregar cardio según objetivo."""
-        from config import RoutineConfig
+    def _draw_cardio_batch(self, objetivo: str, n: int) -> List[Exercise]:
+        """
+        Sortea de una vez n ejercicios de cardio para un objetivo.
         
-        params = RoutineConfig.PARAMS_BY_GOAL.get(objetivo)
-        probability = params['cardio_probability']
+        Args:
+            objetivo: Objetivo del usuario
+            n: Número de ejercicios de cardio
+            
+        Returns:
+            Lista de ejercicios de cardio
+        """
+        if n <= 0:
+            return []
         
-        return random.random() < probability
-    
-    def _generate_cardio_exercise(self, objetivo: str) -> Exercise:
-        """Genera un ejercicio de cardio."""
         cardio_options = self.exercise_db.EXERCISES['cardio']
-        cardio_name = random.choice(cardio_options)
-        
-        if objetivo == 'perder_peso':
-            duration = f"{random.randint(20, 30)} min"
-            intensity = random.choice(['alta', 'HIIT'])
-        elif objetivo == 'resistencia':
-            duration = f"{random.randint(25, 40)} min"
-            intensity = random.choice(['moderada', 'alta'])
-        else:
-            duration = f"{random.randint(15, 20)} min"
-            intensity = 'moderada'
+        duration_min, duration_max, intensities = _CARDIO_PLAN_BY_GOAL.get(
+            objetivo, _CARDIO_PLAN_DEFAULT
+        )
+        
+        rng = self._rng
+        names = rng.integers(0, len(cardio_options), size=n).tolist()
+        durations = rng.integers(duration_min, duration_max + 1, size=n).tolist()
+        levels = rng.integers(0, len(intensities), size=n).tolist()
         
-        return Exercise.create_cardio_exercise(cardio_name, duration, intensity)
+        return [
+            Exercise.create_cardio_exercise(
+                cardio_options[name], f"{duration} min", intensities[level]
+            )
+            for name, duration, level in zip(names, durations, levels)
+        ]
     
     def _apply_optimal_parameters(self, routine_dict: Dict[str, Any],
                                  optimal_params: Dict[str, Any]) -> Dict[str, Any]:
         """Aplica parámetros optimizados a la rutina."""
-        series = optimal_params['series']
-        reps_min = optimal_params['repeticiones_min']
-        reps_max = optimal_params['repeticiones_max']
-        rest = optimal_params['descanso']
+        # Los mismos valores (y el mismo string de repeticiones) para todos
+        changes = {
+            'series': optimal_params['series'],
+            'repeticiones': (f"{optimal_params['repeticiones_min']}-"
+                             f"{optimal_params['repeticiones_max']}"),
+            'descanso': optimal_params['descanso']
+        }
         
-        for day, exercises in routine_dict['rutina_semanal'].items():
-            for exercise in exercises:
-                if not exercise.is_cardio():
-                    exercise.series = series
-                    exercise.repeticiones = f"{reps_min}-{reps_max}"
-                    exercise.descanso = rest
+        strength_refs = routine_dict.get('_strength_exercises')
+        if strength_refs is not None:
+            # Solo los ejercicios de fuerza registrados al construir la rutina
+            for exercises, index in strength_refs:
+                exercises[index] = exercises[index].with_params(**changes)
+        else:
+            for exercises in routine_dict['rutina_semanal'].values():
+                exercises[:] = [
+                    exercise if exercise.is_cardio() else exercise.with_params(**changes)
+                    for exercise in exercises
+                ]
         
         # Actualizar metadatos
         if 'metadatos' not in routine_dict:
@@ -347,12 +583,14 @@ IMPORTANTE: Este archivo debe agregarse al final de ai_service.py (Parte 1)
     # GENERACIÓN EN MODO APRENDIZAJE (EXPLOTACIÓN)
     # ========================================================================
     
-    def _generate_learned_routine(self, profile: Profile) -> Dict[str, Any]:
+    def _generate_learned_routine(self, profile: Profile,
+                                  cardio_days: Optional[List[bool]] = None) -> Dict[str, Any]:
         """
         Genera rutina basándose en patrones aprendidos.
         
         Args:
             profile: Perfil del usuario
+            cardio_days: Días con cardio ya sorteados (opcional)
             
         Returns:
             Diccionario con rutina generada
@@ -362,7 +600,7 @@ IMPORTANTE: Este archivo debe agregarse al final de ai_service.py (Parte 1)
         
         if not best_practices['tiene_patrones']:
             # No hay patrones, usar exploración
-            return self._generate_exploration_routine(profile)
+            return self._generate_exploration_routine(profile, cardio_days)
         
         # Extraer información de mejores prácticas
         structure = best_practices['estructura_preferida']
@@ -371,10 +609,29 @@ IMPORTANTE: Este archivo debe agregarse al final de ai_service.py (Parte 1)
         # Decidir grupos por día
         groups_per_day = self._decide_groups_per_day(structure, profile.dias)
         
+        # Configuración resuelta una sola vez para toda la semana
+        params_config = self._params_by_goal.get(profile.objetivo_str)
+        series = self._series_by_level.get(profile.nivel_str, 4)
+        
+        # Decisión de cardio de toda la semana en un solo sorteo
+        if cardio_days is None:
+            cardio_days = (
+                self._rng.random(len(groups_per_day)) < params_config['cardio_probability']
+            ).tolist()
+        else:
+            cardio_days = cardio_days[:len(groups_per_day)]
+        
         # Generar rutina usando conocimiento aprendido
         weekly_routine = {}
+        # Posiciones (lista del día, índice) de los ejercicios de fuerza
+        strength_refs = []
+        # Cardio de toda la semana sorteado de una vez
+        cardio_exercises = iter(self._draw_cardio_batch(
+            profile.objetivo_str, sum(cardio_days)
+        ))
         for day_num, groups in enumerate(groups_per_day, 1):
             day_exercises = []
+            selections = []
             
             for group in groups:
                 num_exercises = self._decide_exercises_per_group(
@@ -391,32 +648,39 @@ IMPORTANTE: Este archivo debe agregarse al final de ai_service.py (Parte 1)
                         group, num_exercises, profile.nivel_str
                     )
                 
-                # Generar ejercicios con parámetros
-                for exercise_name in exercises:
-                    params = self._generate_experimental_parameters(
-                        profile.objetivo_str, profile.nivel_str, group
-                    )
-                    
-                    exercise = Exercise.create_strength_exercise(
-                        exercise_name,
-                        group,
-                        params['series'],
-                        params['repeticiones'],
-                        params['descanso']
-                    )
-                    
-                    day_exercises.append(exercise)
+                selections.append((group, exercises))
+            
+            # Generar ejercicios con parámetros sorteados para todo el día
+            strength_params = self._draw_param_batch(
+                sum(len(names) for _, names in selections),
+                params_config, series
+            )
+            names = (
+                (group, name) for group, exercises in selections for name in exercises
+            )
+            for (group, exercise_name), (series, repeticiones, descanso) in zip(
+                    names, strength_params):
+                exercise = Exercise.create_strength_exercise(
+                    exercise_name,
+                    group,
+                    series,
+                    repeticiones,
+                    descanso
+                )
+                
+                strength_refs.append((day_exercises, len(day_exercises)))
+                day_exercises.append(exercise)
             
             # Agregar cardio si es necesario
-            if self._needs_cardio(profile.objetivo_str, day_num):
-                cardio_ex = self._generate_cardio_exercise(profile.objetivo_str)
-                day_exercises.append(cardio_ex)
+            if cardio_days[day_num - 1]:
+                day_exercises.append(next(cardio_exercises))
             
-            weekly_routine[f"Día {day_num}"] = day_exercises
+            weekly_routine[_DAY_KEYS[day_num - 1]] = day_exercises
         
         return {
             'rutina_semanal': weekly_routine,
             'estructura': structure,
+            '_strength_exercises': strength_refs,
             'metadatos': {
                 'modo_generacion': 'aprendizaje',
                 'basado_en': best_practices['cantidad_patrones'],
@@ -457,6 +721,44 @@ IMPORTANTE: Este archivo debe agregarse al final de ai_service.py (Parte 1)
     # ANÁLISIS Y OPTIMIZACIÓN
     # ========================================================================
     
+    @staticmethod
+    def _summarize_routine(routine: Routine) -> _RoutineSummary:
+        """
+        Recorre la semana una sola vez acumulando todas las métricas.
+        
+        Args:
+            routine: Rutina a resumir
+            
+        Returns:
+            Resumen de la rutina
+        """
+        summary = _RoutineSummary(total_days=len(routine.rutina_semanal))
+        groups = summary.groups
+        low_series = summary.low_series
+        group_bit = _GROUP_TO_BIT.get
+        total = 0
+        cardio_days = 0
+        mask = 0
+        
+        for day, exercises in routine.rutina_semanal.items():
+            total += len(exercises)
+            day_has_cardio = False
+            for exercise in exercises:
+                mask |= group_bit(exercise.grupo, 0)
+                if exercise.grupo != 'cardio':
+                    groups.add(exercise.grupo)
+                if exercise.is_cardio():
+                    day_has_cardio = True
+                elif exercise.series is None or exercise.series < 2:
+                    low_series.append((day, exercise.ejercicio))
+            if day_has_cardio:
+                cardio_days += 1
+        
+        summary.total_exercises = total
+        summary.cardio_days = cardio_days
+        summary.groups_mask = mask
+        return summary
+    
     def analyze_routine_effectiveness(self, routine: Routine) -> Dict[str, Any]:
         """
         Analiza la efectividad de una rutina.
@@ -467,21 +769,23 @@ IMPORTANTE: Este archivo debe agregarse al final de ai_service.py (Parte 1)
         Returns:
             Diccionario con análisis
         """
+        summary = self._summarize_routine(routine)
+        groups_worked = summary.groups
+        
         analysis = {
             'tiene_feedback': routine.has_feedback(),
             'es_exitosa': routine.is_successful(),
             'satisfaccion': routine.satisfaccion,
-            'complejidad': round(routine.get_complexity_score(), 2),
-            'dias_totales': routine.get_total_days(),
-            'ejercicios_totales': routine.get_total_exercises(),
-            'ejercicios_por_dia': round(routine.get_exercises_per_day(), 1),
-            'grupos_trabajados': len(routine.get_muscle_groups_worked()),
-            'tiene_cardio': routine.has_cardio(),
-            'frecuencia_cardio': routine.get_cardio_frequency()
+            'complejidad': round(summary.complexity, 2),
+            'dias_totales': summary.total_days,
+            'ejercicios_totales': summary.total_exercises,
+            'ejercicios_por_dia': round(summary.exercises_per_day, 1),
+            'grupos_trabajados': len(groups_worked),
+            'tiene_cardio': summary.cardio_days > 0,
+            'frecuencia_cardio': summary.cardio_days
         }
         
         # Calcular balance muscular
-        groups_worked = routine.get_muscle_groups_worked()
         major_groups = {'pecho', 'espalda', 'piernas', 'hombros'}
         covered_major = major_groups.intersection(groups_worked)
         
@@ -565,37 +869,37 @@ IMPORTANTE: Este archivo debe agregarse al final de ai_service.py (Parte 1)
         Returns:
             Diccionario con reporte completo
         """
-        # Calcular estadísticas de rutinas
-        if routines:
-            satisfactions = [r.satisfaccion for r in routines if r.satisfaccion]
-            avg_satisfaction = sum(satisfactions) / len(satisfactions) if satisfactions else 0
-            successful_count = sum(1 for r in routines if r.is_successful())
-        else:
-            avg_satisfaction = 0
-            successful_count = 0
+        # Satisfacciones registradas (no nulas) en un único arreglo
+        satisfactions = np.fromiter(
+            (r.satisfaccion for r in routines if r.satisfaccion),
+            dtype=np.int8
+        )
+        total_routines = len(routines)
+        feedback_count = sum(1 for r in routines if r.satisfaccion is not None)
+        successful_count = int(np.count_nonzero(satisfactions >= 4))
         
-        # Clasificación
-        user_history = [
-            {'satisfaccion': r.satisfaccion} for r in routines if r.satisfaccion
-        ]
-        classification = self.inference_service.classify_user(
-            user_profile, user_history
+        n = satisfactions.size
+        avg_satisfaction = float(satisfactions.mean()) if n else 0
+        
+        # Clasificación a partir de agregados
+        classification = self.inference_service.classify_user_from_stats(
+            user_profile, n, avg_satisfaction
         )
         
-        # Detectar anomalías
-        anomalies = self.inference_service.detect_anomalies(
-            user_profile, user_history
+        # Detectar anomalías (requiere la secuencia, no solo agregados)
+        anomalies = self.inference_service.detect_anomalies_from_values(
+            user_profile, satisfactions.tolist()
         )
         
         return {
             'perfil': user_profile.to_dict(),
             'clasificacion': classification,
             'estadisticas': {
-                'rutinas_totales': len(routines),
-                'rutinas_con_feedback': len([r for r in routines if r.has_feedback()]),
+                'rutinas_totales': total_routines,
+                'rutinas_con_feedback': feedback_count,
                 'rutinas_exitosas': successful_count,
                 'satisfaccion_promedio': round(avg_satisfaction, 2),
-                'tasa_exito': round(successful_count / len(routines) * 100, 1) if routines else 0
+                'tasa_exito': round(successful_count / total_routines * 100, 1) if total_routines else 0
             },
             'anomalias': anomalies,
             'recomendaciones': classification.get('recomendaciones', [])
@@ -612,32 +916,34 @@ IMPORTANTE: Este archivo debe agregarse al final de ai_service.py (Parte 1)
             Tupla (es_válida, lista_de_problemas)
         """
         problems = []
+        summary = self._summarize_routine(routine)
         
         # Validar que tenga ejercicios
-        if routine.get_total_exercises() == 0:
+        if summary.total_exercises == 0:
             problems.append("La rutina no tiene ejercicios")
         
         # Validar balance muscular
-        groups = routine.get_muscle_groups_worked()
-        major_groups = {'pecho', 'espalda', 'piernas'}
-        missing_major = major_groups - groups
+        missing_mask = _MAJOR_MASK & ~summary.groups_mask
         
-        if missing_major:
+        if missing_mask:
+            missing_major = [
+                group for group in _MAJOR_GROUPS
+                if missing_mask & _GROUP_TO_BIT[group]
+            ]
             problems.append(f"Falta trabajar: {', '.join(missing_major)}")
         
         # Validar complejidad
-        exercises_per_day = routine.get_exercises_per_day()
+        exercises_per_day = summary.exercises_per_day
         if exercises_per_day < 3:
             problems.append("Muy pocos ejercicios por día")
         elif exercises_per_day > 8:
             problems.append("Demasiados ejercicios por día")
         
         # Validar que los ejercicios tengan parámetros correctos
-        for day, exercises in routine.rutina_semanal.items():
-            for exercise in exercises:
-                if not exercise.is_cardio():
-                    if exercise.series is None or exercise.series < 2:
-                        problems.append(f"{day}: {exercise.ejercicio} tiene pocas series")
+        problems.extend(
+            f"{day}: {nombre} tiene pocas series"
+            for day, nombre in summary.low_series
+        )
         
         return (len(problems) == 0, problems)
     
@@ -5,6 +5,8 @@ Este servicio encapsula toda la lógica del motor de inferencia,
 proporcionando predicciones, clasificaciones y detección de anomalías.
 """
 
+import logging
+
 import numpy as np
 from typing import Dict, Any, List, Optional, Tuple
 from collections import defaultdict
@@ -12,10 +14,10 @@ import math
 
 from models.profile import Profile
 from models.routine import Routine
+from models.experience import Experience
 from models.learning_system import LearningSystem
 from config import AIConfig
 from utils.calculations import (
-    calculate_profile_similarity,
     calculate_bayesian_adjustment,
     calculate_confidence_score,
     calculate_average,
@@ -23,6 +25,9 @@ from utils.calculations import (
 )
 
 
+logger = logging.getLogger(__name__)
+
+
 class InferenceService:
     """
     Servicio de inferencia que implementa predicciones y análisis.
@@ -42,6 +47,11 @@ class InferenceService:
             learning_system: Sistema de aprendizaje con datos históricos
         """
         self.learning_system = learning_system
+        # Perfiles del histórico ya empaquetados (crecen con el histórico)
+        self._history_packed = Profile.pack([])
+        self._history_positions: List[int] = []
+        self._history_synced = 0
+        self._history_source: Optional[List[Experience]] = None
         self._initialize_thresholds()
     
     def _initialize_thresholds(self):
@@ -71,7 +81,7 @@ class InferenceService:
         Returns:
             Diccionario con predicción y confianza
         """
-        print("\n🔮 Prediciendo satisfacción...")
+        logger.debug("🔮 Prediciendo satisfacción...")
         
         # Buscar usuarios similares
         similar_users = self._find_similar_users(profile)
@@ -105,9 +115,9 @@ class InferenceService:
             'metodo': 'bayesiano'
         }
         
-        print(f"   ✓ Satisfacción predicha: {result['satisfaccion_predicha']}/5")
-        print(f"   ✓ Confianza: {result['confianza']*100:.0f}%")
-        print(f"   ✓ Recomendación: {'SÍ' if recommend else 'NO'}")
+        logger.debug("   ✓ Satisfacción predicha: %s/5", result['satisfaccion_predicha'])
+        logger.debug("   ✓ Confianza: %.0f%%", result['confianza'] * 100)
+        logger.debug("   ✓ Recomendación: %s", 'SÍ' if recommend else 'NO')
         
         return result
     
@@ -134,30 +144,71 @@ class InferenceService:
         Returns:
             Lista de usuarios similares con sus similitudes
         """
-        similar = []
+        history = self._sync_history_profiles()
+        if not self._history_packed.size:
+            return []
+        
+        # Similitud contra todo el histórico en una sola operación
+        similarities = profile.batch_similarity(self._history_packed)
+        candidates = np.flatnonzero(similarities >= threshold)
+        
+        # Ordenar por similitud (estable: a igualdad, el más antiguo primero)
+        top = candidates[np.argsort(-similarities[candidates], kind='stable')][:10]
+        
+        return [
+            {
+                'usuario': history[self._history_positions[i]],
+                'similitud': float(similarities[i])
+            }
+            for i in top.tolist()
+        ]
+    
+    def _sync_history_profiles(self) -> List[Experience]:
+        """
+        Empaqueta los perfiles de las experiencias nuevas del histórico.
         
-        for user_exp in self.learning_system.historico_usuarios:
-            user_profile_data = user_exp.get('perfil', {})
-            if not user_profile_data:
-                continue
-            
-            try:
-                similarity = calculate_profile_similarity(
-                    profile.to_dict(),
-                    user_profile_data
-                )
-                
-                if similarity >= threshold:
-                    similar.append({
-                        'usuario': user_exp,
-                        'similitud': similarity
-                    })
-            except Exception:
-                continue
+        El histórico solo crece, así que cada perfil se empaqueta una vez;
+        si la lista se reemplaza o se acorta, se reconstruye desde cero.
+        Las experiencias sin perfil o con un perfil inválido se omiten.
         
-        # Ordenar por similitud
-        similar.sort(key=lambda x: x['similitud'], reverse=True)
-        return similar[:10]  # Top 10
+        Returns:
+            Histórico de experiencias actual
+        """
+        history = self.learning_system.historico_usuarios
+        if history is not self._history_source or len(history) < self._history_synced:
+            self._history_packed = Profile.pack([])
+            self._history_positions = []
+            self._history_synced = 0
+            self._history_source = history
+        
+        positions = [
+            position for position in range(self._history_synced, len(history))
+            if history[position].perfil
+        ]
+        records = [history[position].perfil for position in positions]
+        
+        try:
+            # Validación vectorizada de todos los perfiles nuevos
+            new_profiles = Profile.from_records(records)
+        except (KeyError, TypeError, ValueError):
+            # Algún perfil inválido: construirlos uno a uno omitiendo esos
+            new_profiles = []
+            valid_positions = []
+            for position, record in zip(positions, records):
+                try:
+                    new_profiles.append(Profile.from_dict(record))
+                except (KeyError, TypeError, ValueError):
+                    continue
+                valid_positions.append(position)
+            positions = valid_positions
+        
+        self._history_positions.extend(positions)
+        if new_profiles:
+            self._history_packed = np.concatenate(
+                (self._history_packed, Profile.pack(new_profiles))
+            )
+        self._history_synced = len(history)
+        return history
     
     def _analyze_satisfaction_factors(self, profile: Profile,
                                      routine: Optional[Routine],
@@ -168,7 +219,7 @@ class InferenceService:
         # Factor 1: Promedio de similares
         if similar_users:
             satisfactions = [
-                u['usuario'].get('satisfaccion', 3)
+                u['usuario'].satisfaccion or 3
                 for u in similar_users
             ]
             factors['promedio_similares'] = calculate_average(satisfactions)
@@ -190,9 +241,8 @@ class InferenceService:
             factors['ajuste_complejidad'] = 1.0
         
         # Factor 3: Patrones consolidados
-        patterns = self.learning_system.get_patterns_for_profile(
-            profile.nivel_str,
-            profile.objetivo_str
+        patterns = self.learning_system.get_patterns_for_key(
+            profile.get_pattern_key()
         )
         factors['patron_existe'] = len(patterns) > 0
         factors['cantidad_patrones'] = len(patterns)
@@ -215,7 +265,7 @@ class InferenceService:
             return 3.5
         
         # Prior: promedio de usuarios similares
-        satisfactions = [u['usuario'].get('satisfaccion', 3) for u in similar_users]
+        satisfactions = [u['usuario'].satisfaccion or 3 for u in similar_users]
         prior = calculate_average(satisfactions)
         
         # Ajustes basados en factores
@@ -234,7 +284,7 @@ class InferenceService:
             return 0.3
         
         # Calcular desviación estándar
-        satisfactions = [u['usuario'].get('satisfaccion', 3) for u in similar_users]
+        satisfactions = [u['usuario'].satisfaccion or 3 for u in similar_users]
         std_dev = calculate_std_dev(satisfactions) if len(satisfactions) > 1 else 1.0
         
         return calculate_confidence_score(
@@ -257,13 +307,13 @@ class InferenceService:
         Returns:
             Diccionario con parámetros óptimos y confianza
         """
-        print("\n🎯 Infiriendo parámetros óptimos...")
+        logger.debug("🎯 Infiriendo parámetros óptimos...")
         
         # Buscar usuarios similares exitosos
         similar_users = self._find_similar_users(profile, threshold=0.75)
         successful_users = [
             u for u in similar_users
-            if u['usuario'].get('satisfaccion', 0) >= 4
+            if (u['usuario'].satisfaccion or 0) >= 4
         ]
         
         if not successful_users:
@@ -281,10 +331,11 @@ class InferenceService:
         optimal_params['basado_en'] = len(successful_users)
         optimal_params['metodo'] = 'inferencia_datos'
         
-        print(f"   ✓ Series: {optimal_params['series']}")
-        print(f"   ✓ Reps: {optimal_params['repeticiones_min']}-{optimal_params['repeticiones_max']}")
-        print(f"   ✓ Descanso: {optimal_params['descanso']}")
-        print(f"   ✓ Confianza: {optimal_params['confianza']*100:.0f}%")
+        logger.debug("   ✓ Series: %s", optimal_params['series'])
+        logger.debug("   ✓ Reps: %s-%s", optimal_params['repeticiones_min'],
+                     optimal_params['repeticiones_max'])
+        logger.debug("   ✓ Descanso: %s", optimal_params['descanso'])
+        logger.debug("   ✓ Confianza: %.0f%%", optimal_params['confianza'] * 100)
         
         return optimal_params
     
@@ -295,7 +346,7 @@ class InferenceService:
         reps_list = []
         
         for user_data in successful_users:
-            routine_data = user_data['usuario'].get('rutina_exitosa', {})
+            routine_data = user_data['usuario'].rutina_exitosa
             if not routine_data or 'rutina_semanal' not in routine_data:
                 continue
             
@@ -379,7 +430,7 @@ class InferenceService:
     # ========================================================================
     
     def classify_user(self, profile: Profile,
-                     user_history: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+                     user_history: Optional[List[Experience]] = None) -> Dict[str, Any]:
         """
         Clasifica al usuario según experiencia y rendimiento.
         
@@ -390,17 +441,40 @@ class InferenceService:
         Returns:
             Diccionario con clasificación y características
         """
-        print("\n👤 Clasificando usuario...")
-        
         num_experiences = len(user_history) if user_history else 0
         
         # Calcular satisfacción promedio
         if user_history:
-            satisfactions = [exp.get('satisfaccion', 3) for exp in user_history]
+            satisfactions = [exp.satisfaccion or 3 for exp in user_history]
             avg_satisfaction = calculate_average(satisfactions)
         else:
             avg_satisfaction = 0
         
+        return self.classify_user_from_stats(
+            profile, num_experiences, avg_satisfaction
+        )
+    
+    def classify_user_from_stats(self, profile: Profile, n: int,
+                                 mean: float) -> Dict[str, Any]:
+        """
+        Clasifica al usuario a partir de agregados de su histórico.
+        
+        Evita construir un diccionario por experiencia cuando el llamador
+        ya dispone de las satisfacciones en bruto.
+        
+        Args:
+            profile: Perfil del usuario
+            n: Número de experiencias con satisfacción
+            mean: Satisfacción promedio (0 si no hay experiencias)
+            
+        Returns:
+            Diccionario con clasificación y características
+        """
+        logger.debug("👤 Clasificando usuario...")
+        
+        num_experiences = int(n)
+        avg_satisfaction = float(mean) if num_experiences else 0
+        
         # Clasificar por experiencias
         category = self._get_user_category(num_experiences)
         
@@ -418,10 +492,10 @@ class InferenceService:
             )
         }
         
-        print(f"   ✓ Categoría: {category['name'].upper()}")
-        print(f"   ✓ Experiencias: {num_experiences}")
-        print(f"   ✓ Satisfacción promedio: {avg_satisfaction:.2f}/5")
-        print(f"   ✓ Rendimiento: {performance}")
+        logger.debug("   ✓ Categoría: %s", category['name'].upper())
+        logger.debug("   ✓ Experiencias: %d", num_experiences)
+        logger.debug("   ✓ Satisfacción promedio: %.2f/5", avg_satisfaction)
+        logger.debug("   ✓ Rendimiento: %s", performance)
         
         return result
     
@@ -466,7 +540,7 @@ class InferenceService:
     # ========================================================================
     
     def detect_anomalies(self, profile: Profile,
-                        feedback_history: List[Dict[str, Any]]) -> Dict[str, Any]:
+                        feedback_history: List[Experience]) -> Dict[str, Any]:
         """
         Detecta patrones anómalos en el rendimiento.
         
@@ -480,7 +554,25 @@ class InferenceService:
         if not feedback_history or len(feedback_history) < 3:
             return {'anomalias': [], 'estado': 'normal'}
         
-        satisfactions = [f.get('satisfaccion', 3) for f in feedback_history]
+        return self.detect_anomalies_from_values(
+            profile, [f.satisfaccion or 3 for f in feedback_history]
+        )
+    
+    def detect_anomalies_from_values(self, profile: Profile,
+                                     satisfactions: List[int]) -> Dict[str, Any]:
+        """
+        Detecta anomalías a partir de la secuencia de satisfacciones.
+        
+        Args:
+            profile: Perfil del usuario
+            satisfactions: Satisfacciones en orden cronológico
+            
+        Returns:
+            Diccionario con anomalías detectadas
+        """
+        if len(satisfactions) < 3:
+            return {'anomalias': [], 'estado': 'normal'}
+        
         anomalies = []
         
         # Detectar tendencia negativa
@@ -7,17 +7,24 @@ Este servicio maneja todo el aprendizaje del sistema:
 - Evolución del sistema
 """
 
-from typing import Dict, Any, List
+import heapq
+import logging
+from operator import itemgetter
+from typing import Dict, Any, List, Mapping, Optional, Tuple
 from datetime import datetime
-from collections import defaultdict
+from collections import Counter
 
 from models.profile import Profile
 from models.routine import Routine
+from models.experience import Experience
 from models.learning_system import LearningSystem
 from models.user import User
 from config import AIConfig
 
 
+logger = logging.getLogger(__name__)
+
+
 class LearningService:
     """
     Servicio de aprendizaje del sistema.
@@ -52,20 +59,26 @@ class LearningService:
         Returns:
             Diccionario con resultado del procesamiento
         """
-        print("\n🎓 Procesando feedback y aprendiendo...")
+        logger.debug("🎓 Procesando feedback y aprendiendo...")
         
         # Actualizar rutina con feedback
         routine.set_feedback(satisfaction, comments)
         
+        # Marca de tiempo única para la experiencia y el patrón
+        now_iso = datetime.now().isoformat()
+        
+        # Serializar la rutina una sola vez (solo si fue exitosa)
+        routine_data = routine.to_dict() if routine.is_successful() else None
+        
         # Crear experiencia
-        experience = {
-            'perfil': user.perfil.to_dict(),
-            'rutina_id': routine.routine_id,
-            'rutina_exitosa': routine.to_dict() if routine.is_successful() else None,
-            'satisfaccion': satisfaction,
-            'comentarios': comments,
-            'fecha': datetime.now().isoformat()
-        }
+        experience = Experience(
+            perfil=user.perfil.to_dict(),
+            rutina_id=routine.routine_id,
+            rutina_exitosa=routine_data,
+            satisfaccion=satisfaction,
+            comentarios=comments,
+            fecha=now_iso
+        )
         
         # Registrar experiencia
         self.learning_system.add_user_experience(experience)
@@ -80,7 +93,9 @@ class LearningService:
         
         # APRENDIZAJE 1: Actualizar patrones exitosos
         if routine.is_successful():
-            self._update_successful_patterns(user.perfil, routine, satisfaction)
+            self._update_successful_patterns(
+                user.perfil, routine, satisfaction, routine_data, now_iso
+            )
             learning_results['patrones_actualizados'] = True
         
         # APRENDIZAJE 2: Actualizar combinaciones de ejercicios
@@ -97,14 +112,16 @@ class LearningService:
         # La evolución se maneja automáticamente en add_user_experience
         if self.learning_system.generacion > current_gen:
             learning_results['generacion_evolucionada'] = True
-            print(f"   🎉 Sistema evolucionó a Generación {self.learning_system.generacion}")
+            logger.debug("   🎉 Sistema evolucionó a Generación %d", self.learning_system.generacion)
         
-        print("   💾 Conocimiento actualizado")
+        logger.debug("   💾 Conocimiento actualizado")
         
         return learning_results
     
     def _update_successful_patterns(self, profile: Profile, 
-                                   routine: Routine, satisfaction: int):
+                                   routine: Routine, satisfaction: int,
+                                   routine_data: Optional[Dict[str, Any]] = None,
+                                   now_iso: Optional[str] = None):
         """
         Actualiza patrones exitosos.
         
@@ -112,17 +129,19 @@ class LearningService:
             profile: Perfil del usuario
             routine: Rutina exitosa
             satisfaction: Nivel de satisfacción
+            routine_data: Rutina ya serializada (se calcula si falta)
+            now_iso: Fecha ISO del feedback (se toma la actual si falta)
         """
-        pattern_key = f"{profile.nivel_str}_{profile.objetivo_str}"
+        pattern_key = profile.get_pattern_key()
         
         pattern = {
-            'rutina': routine.to_dict(),
+            'rutina': routine_data if routine_data is not None else routine.to_dict(),
             'satisfaccion': satisfaction,
-            'fecha': datetime.now().isoformat()
+            'fecha': now_iso or datetime.now().isoformat()
         }
         
         self.learning_system.add_successful_pattern(pattern_key, pattern)
-        print(f"   ✓ Patrón exitoso guardado para: {pattern_key}")
+        logger.debug("   ✓ Patrón exitoso guardado para: %s", pattern_key)
     
     def _update_exercise_combinations(self, routine: Routine):
         """
@@ -131,15 +150,11 @@ class LearningService:
         Args:
             routine: Rutina exitosa
         """
-        for day, exercises in routine.rutina_semanal.items():
-            for exercise in exercises:
-                if not exercise.is_cardio():
-                    self.learning_system.increment_exercise_combination(
-                        exercise.grupo,
-                        exercise.ejercicio
-                    )
-        
-        print("   ✓ Combinaciones de ejercicios actualizadas")
+        increment = self.learning_system.increment_exercise_combination
+        for grupo, ejercicio in routine.get_strength_exercises():
+            increment(grupo, ejercicio)
+        
+        logger.debug("   ✓ Combinaciones de ejercicios actualizadas")
     
     def _adjust_exploration_factor(self, satisfaction: int, 
                                   routine: Routine) -> bool:
@@ -155,26 +170,22 @@ class LearningService:
         """
         mode = routine.metadatos.get('modo_generacion', 'exploracion')
         
+        learning_system = self.learning_system
+        
         # Si rutina basada en aprendizaje funcionó bien, explorar menos
         if satisfaction >= 4 and mode == 'explotacion':
-            old_factor = self.learning_system.factor_exploracion
-            self.learning_system.factor_exploracion = max(
-                0.1,
-                self.learning_system.factor_exploracion - 0.01
-            )
-            if old_factor != self.learning_system.factor_exploracion:
-                print(f"   ✓ Reduciendo exploración: {self.learning_system.factor_exploracion:.2f}")
+            if learning_system.set_exploration_factor(
+                    max(0.1, learning_system.factor_exploracion - 0.01)):
+                logger.debug("   ✓ Reduciendo exploración: %.2f",
+                             learning_system.factor_exploracion)
                 return True
         
         # Si resultados malos, explorar más
         elif satisfaction <= 2:
-            old_factor = self.learning_system.factor_exploracion
-            self.learning_system.factor_exploracion = min(
-                0.4,
-                self.learning_system.factor_exploracion + 0.02
-            )
-            if old_factor != self.learning_system.factor_exploracion:
-                print(f"   ✓ Aumentando exploración: {self.learning_system.factor_exploracion:.2f}")
+            if learning_system.set_exploration_factor(
+                    min(0.4, learning_system.factor_exploracion + 0.02)):
+                logger.debug("   ✓ Aumentando exploración: %.2f",
+                             learning_system.factor_exploracion)
                 return True
         
         return False
@@ -188,14 +199,10 @@ class LearningService:
         """
         stats = self.learning_system.get_statistics()
         
-        # Analizar tendencias
-        recent_users = self.learning_system.historico_usuarios[-10:] if len(
-            self.learning_system.historico_usuarios) >= 10 else self.learning_system.historico_usuarios
+        # Analizar tendencias (ventana de las últimas 10 experiencias)
+        recent_count, recent_avg = self.learning_system.get_recent_satisfaction()
         
-        if recent_users:
-            recent_satisfactions = [u.get('satisfaccion', 0) for u in recent_users]
-            recent_avg = sum(recent_satisfactions) / len(recent_satisfactions)
-            
+        if recent_count:
             trend = "mejorando" if recent_avg > stats['promedio_satisfaccion'] else "estable"
         else:
             recent_avg = 0
@@ -205,16 +212,13 @@ class LearningService:
             'estadisticas_generales': stats,
             'satisfaccion_reciente': round(recent_avg, 2),
             'tendencia': trend,
-            'usuarios_recientes': len(recent_users),
+            'usuarios_recientes': recent_count,
             'patrones_por_categoria': self._count_patterns_by_category()
         }
     
-    def _count_patterns_by_category(self) -> Dict[str, int]:
-        """Cuenta patrones por categoría."""
-        return {
-            key: len(patterns)
-            for key, patterns in self.learning_system.patrones_exitosos.items()
-        }
+    def _count_patterns_by_category(self) -> Mapping[str, int]:
+        """Cuenta patrones por categoría (contadores incrementales)."""
+        return self.learning_system.get_pattern_counts()
     
     def get_best_practices(self, profile: Profile) -> Dict[str, Any]:
         """
@@ -226,9 +230,8 @@ class LearningService:
         Returns:
             Diccionario con mejores prácticas
         """
-        patterns = self.learning_system.get_patterns_for_profile(
-            profile.nivel_str,
-            profile.objetivo_str
+        patterns = self.learning_system.get_patterns_for_key(
+            profile.get_pattern_key()
         )
         
         if not patterns:
@@ -261,32 +264,30 @@ class LearningService:
         if not structures:
             return 'fullbody'
         
-        return max(set(structures), key=structures.count)
+        return Counter(structures).most_common(1)[0][0]
     
     def _get_popular_exercises_from_patterns(self, 
                                             patterns: List[Dict[str, Any]]) -> Dict[str, List[str]]:
         """Obtiene ejercicios populares de los patrones."""
-        exercise_freq = defaultdict(lambda: defaultdict(int))
+        # Conteo de (grupo, ejercicio) en una sola pasada a nivel de C
+        exercise_freq = Counter(
+            (ex['grupo'], ex['ejercicio'])
+            for pattern in patterns
+            if 'rutina_semanal' in pattern['rutina']
+            for exercises in pattern['rutina']['rutina_semanal'].values()
+            for ex in exercises
+            if ex.get('grupo', 'cardio') != 'cardio'
+        )
         
-        for pattern in patterns:
-            routine_data = pattern['rutina']
-            if 'rutina_semanal' not in routine_data:
-                continue
-            
-            for day, exercises in routine_data['rutina_semanal'].items():
-                for ex in exercises:
-                    if 'grupo' in ex and ex['grupo'] != 'cardio':
-                        exercise_freq[ex['grupo']][ex['ejercicio']] += 1
-        
-        # Top 3 por grupo
-        popular = {}
-        for grupo, exercises in exercise_freq.items():
-            sorted_exercises = sorted(
-                exercises.items(),
-                key=lambda x: x[1],
-                reverse=True
-            )
-            popular[grupo] = [ex for ex, _ in sorted_exercises[:3]]
+        by_group: Dict[str, List[Tuple[str, int]]] = {}
+        for (grupo, ejercicio), count in exercise_freq.items():
+            by_group.setdefault(grupo, []).append((ejercicio, count))
+        
+        # Top 3 por grupo con un heap acotado en lugar de ordenar todo
+        popular = {
+            grupo: [ex for ex, _ in heapq.nlargest(3, exercises, key=itemgetter(1))]
+            for grupo, exercises in by_group.items()
+        }
         
         return popular
     
@@ -300,14 +301,10 @@ class LearningService:
         Returns:
             True si debe usar aprendizaje (tiene suficientes datos)
         """
-        # Verificar si hay patrones para este perfil
-        patterns = self.learning_system.get_patterns_for_profile(
-            profile.nivel_str,
-            profile.objetivo_str
-        )
-        
         # Necesita al menos 3 patrones para confiar en el aprendizaje
-        has_patterns = len(patterns) >= 3
+        has_patterns = self.learning_system.count_patterns_for_key(
+            profile.get_pattern_key()
+        ) >= 3
         
         # Verificar el factor de exploración
         should_explore = self.learning_system.should_explore()
@@ -5,24 +5,55 @@ Este servicio maneja toda la persistencia de datos del sistema,
 incluyendo carga y guardado de datos en JSON.
 """
 
+import hashlib
 import json
+import logging
 import os
-from typing import Dict, Any, Optional
+import shutil
+from typing import Dict, Any, Iterator, Optional
 from datetime import datetime
 from pathlib import Path
 
 from config import DATA_FILE
+from models.experience import Experience
 from models.learning_system import LearningSystem
 
 
+logger = logging.getLogger(__name__)
+
+def _encode_model(obj: Any) -> Dict[str, Any]:
+    """Serializa modelos con to_dict (p. ej. Experience) para el codificador."""
+    to_dict = getattr(obj, 'to_dict', None)
+    if to_dict is None:
+        raise TypeError(f"Objeto no serializable: {type(obj).__name__}")
+    return to_dict()
+
+
+# Tamaño del buffer de escritura para exportaciones grandes
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Codificador compacto reutilizado para los registros JSONL y el archivo principal
+_RECORD_ENCODER = json.JSONEncoder(
+    ensure_ascii=False, separators=(',', ':'), default=_encode_model
+)
+
+
 class PersistenceService:
     """
     Servicio para persistencia de datos.
     
     Maneja la carga y guardado del estado completo del sistema
-    en formato JSON.
+    en formato JSON. Las listas que solo crecen (histórico de usuarios
+    y rutinas generadas) se guardan aparte en JSONL de solo-anexado,
+    de modo que cada guardado escribe únicamente los registros nuevos.
     """
     
+    # Listas del sistema de aprendizaje persistidas en JSONL
+    APPEND_ONLY_KEYS = ('historico_usuarios', 'rutinas_generadas')
+    
+    # Guardados entre backups del archivo principal
+    BACKUP_EVERY = 10
+    
     def __init__(self, data_file: Path = DATA_FILE):
         """
         Inicializa el servicio de persistencia.
@@ -31,6 +62,18 @@ class PersistenceService:
             data_file: Ruta al archivo de datos
         """
         self.data_file = data_file
+        self.jsonl_files = {
+            key: data_file.with_name(f"{data_file.stem}_{key}.jsonl")
+            for key in self.APPEND_ONLY_KEYS
+        }
+        # Registros ya escritos en cada JSONL
+        self._persisted_counts = {key: 0 for key in self.APPEND_ONLY_KEYS}
+        # El primer guardado de la sesión respalda el archivo previo
+        self._saves_since_backup = self.BACKUP_EVERY
+        # Hash del contenido guardado por última vez (para omitir repetidos)
+        self._last_hash: Optional[str] = None
+        # Satisfacción agregada por generación (una entrada por generación)
+        self._metrics_by_generation: Dict[int, Dict[str, Any]] = {}
         self._ensure_data_directory()
     
     def _ensure_data_directory(self):
@@ -49,16 +92,23 @@ class PersistenceService:
             return None
         
         try:
-            with open(self.data_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # Una sola lectura en bytes; json.loads detecta UTF-8 directamente
+            data = json.loads(self.data_file.read_bytes())
             
             learning_data = data.get('learning_system', {})
+            self._last_hash = data.get('content_hash')
+            self._load_generation_metrics(data.get('metricas', {}))
+            self._load_append_only_lists(learning_data)
             learning_system = LearningSystem.from_dict(learning_data)
             
-            print(f"✓ Datos cargados - Generación {learning_system.generacion}")
-            print(f"  • {learning_system.get_total_users()} usuarios")
-            print(f"  • {learning_system.get_total_routines()} rutinas generadas")
-            print(f"  • Satisfacción promedio: {learning_system.get_average_satisfaction():.2f}/5")
+            logger.info(
+                "✓ Datos cargados - Generación %d (%d usuarios, %d rutinas, "
+                "satisfacción %.2f/5)",
+                learning_system.generacion,
+                learning_system.get_total_users(),
+                learning_system.get_total_routines(),
+                learning_system.get_average_satisfaction()
+            )
             
             return learning_system
             
@@ -79,30 +129,154 @@ class PersistenceService:
         Returns:
             True si se guardó exitosamente
         """
+        # Sin cambios desde el último guardado: no serializar nada
+        if not learning_system.has_unsaved_changes() and self.data_file.exists():
+            return True
+        
         try:
-            data = {
-                'learning_system': learning_system.to_dict(),
-                'metricas': self._generate_metrics(learning_system),
-                'last_update': datetime.now().isoformat()
-            }
-            
-            # Crear backup del archivo anterior si existe
-            if self.data_file.exists():
+            # Backup periódico antes de tocar ningún archivo, para que el
+            # JSON principal y los JSONL respaldados sean coherentes
+            if self._saves_since_backup >= self.BACKUP_EVERY and self.data_file.exists():
                 self._create_backup()
+                self._saves_since_backup = 0
+            
+            learning_data = learning_system.to_dict(include_history=False)
+            
+            # Anexar solo los registros nuevos de las listas crecientes
+            # (las experiencias se serializan al escribirlas)
+            self._append_new_records(
+                'historico_usuarios', learning_system.historico_usuarios
+            )
+            self._append_new_records(
+                'rutinas_generadas', learning_data.pop('rutinas_generadas')
+            )
             
-            # Guardar nuevos datos
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            content = _RECORD_ENCODER.encode({
+                'learning_system': learning_data,
+                'metricas': self._generate_metrics(learning_system)
+            })
             
-            print("💾 Datos guardados exitosamente")
+            # Si el contenido no cambió, no hay nada que reescribir
+            content_hash = hashlib.blake2b(
+                content.encode('utf-8'), digest_size=16
+            ).hexdigest()
+            if content_hash == self._last_hash and self.data_file.exists():
+                learning_system.mark_saved()
+                return True
+            
+            # Completar el objeto con la fecha y el hash sin recodificarlo
+            payload = (
+                f'{content[:-1]},"last_update":"{datetime.now().isoformat()}",'
+                f'"content_hash":"{content_hash}"}}'
+            )
+            
+            # Guardar nuevos datos: JSON compacto codificado de una vez
+            # (indent obliga a json a usar el codificador en Python puro),
+            # escrito a un temporal y renombrado de forma atómica
+            tmp_file = self.data_file.with_suffix('.json.tmp')
+            tmp_file.write_text(payload, encoding='utf-8')
+            os.replace(tmp_file, self.data_file)
+            self._saves_since_backup += 1
+            self._last_hash = content_hash
+            learning_system.mark_saved()
+            
+            logger.info("💾 Datos guardados exitosamente")
             return True
             
         except Exception as e:
             print(f"❌ Error al guardar datos: {e}")
             return False
     
+    def _load_append_only_lists(self, learning_data: Dict[str, Any]):
+        """
+        Completa los datos cargados con los registros de los JSONL.
+        
+        Si el JSON principal aún contiene las listas (formato anterior),
+        se usan tal cual y se reescribirán en JSONL en el próximo guardado.
+        
+        Args:
+            learning_data: Datos del sistema leídos del JSON principal
+        """
+        for key, path in self.jsonl_files.items():
+            if key in learning_data:
+                self._persisted_counts[key] = 0
+                continue
+            
+            records = list(self._iter_jsonl(path))
+            learning_data[key] = records
+            self._persisted_counts[key] = len(records)
+    
+    @staticmethod
+    def _iter_jsonl(path: Path) -> Iterator[Dict[str, Any]]:
+        """
+        Recorre un JSONL registro a registro sin cargarlo completo.
+        
+        Args:
+            path: Ruta del archivo JSONL
+            
+        Yields:
+            Cada registro decodificado
+        """
+        if not path.exists():
+            return
+        
+        decode = json.loads
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield decode(line)
+    
+    def iter_experiences(self) -> Iterator[Experience]:
+        """
+        Recorre el histórico de experiencias guardado, bajo demanda.
+        
+        Permite analizar el histórico sin construir el sistema de
+        aprendizaje completo. Solo incluye lo ya persistido.
+        
+        Yields:
+            Cada experiencia de usuario
+        """
+        return map(Experience.from_dict,
+                   self._iter_jsonl(self.jsonl_files['historico_usuarios']))
+    
+    def _append_new_records(self, key: str, records: list):
+        """
+        Escribe en el JSONL los registros aún no persistidos.
+        
+        Args:
+            key: Nombre de la lista
+            records: Lista completa de registros
+        """
+        persisted = self._persisted_counts[key]
+        
+        # Si la lista no es continuación de lo escrito, reescribir completa
+        if persisted > len(records) or (persisted and not self.jsonl_files[key].exists()):
+            persisted = 0
+        
+        mode = 'a' if persisted else 'w'
+        encode = _RECORD_ENCODER.encode
+        with open(self.jsonl_files[key], mode, encoding='utf-8') as f:
+            f.writelines(encode(record) + '\n' for record in records[persisted:])
+        
+        self._persisted_counts[key] = len(records)
+    
+    def _backup_files(self, backup_file: Path) -> Dict[Path, Path]:
+        """
+        Relaciona cada archivo de datos con su copia en un backup.
+        
+        Args:
+            backup_file: JSON principal del backup (backup_<fecha>.json)
+            
+        Returns:
+            Diccionario archivo de datos -> archivo del backup
+        """
+        files = {self.data_file: backup_file}
+        for key, path in self.jsonl_files.items():
+            files[path] = backup_file.with_name(f"{backup_file.stem}_{key}.jsonl")
+        return files
+    
     def _create_backup(self):
-        """Crea un backup del archivo de datos actual."""
+        """Crea un backup del archivo de datos y de sus JSONL de histórico."""
         try:
             backup_dir = self.data_file.parent / 'backups'
             backup_dir.mkdir(exist_ok=True)
@@ -110,9 +284,12 @@ class PersistenceService:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             backup_file = backup_dir / f"backup_{timestamp}.json"
             
-            # Copiar archivo actual a backup
-            import shutil
-            shutil.copy2(self.data_file, backup_file)
+            # Copiar el JSON principal y los JSONL con la misma marca de tiempo
+            for source, target in self._backup_files(backup_file).items():
+                if source.exists():
+                    shutil.copyfile(source, target)
+                elif target.exists():
+                    target.unlink()
             
             # Mantener solo los últimos 5 backups
             self._cleanup_old_backups(backup_dir, keep=5)
@@ -129,12 +306,23 @@ class PersistenceService:
             keep: Número de backups a mantener
         """
         try:
-            backups = sorted(backup_dir.glob('backup_*.json'))
+            # Una sola enumeración del directorio; DirEntry cachea el stat
+            with os.scandir(backup_dir) as it:
+                backups = [
+                    (entry.stat().st_mtime, entry.path)
+                    for entry in it
+                    if entry.name.startswith('backup_') and entry.name.endswith('.json')
+                ]
+            
+            if len(backups) <= keep:
+                return
             
-            # Eliminar backups antiguos
-            if len(backups) > keep:
-                for backup in backups[:-keep]:
-                    backup.unlink()
+            # Eliminar backups antiguos junto con sus JSONL
+            backups.sort()
+            for _, path in backups[:-keep]:
+                for target in self._backup_files(Path(path)).values():
+                    if target.exists():
+                        target.unlink()
                     
         except Exception as e:
             print(f"⚠️  Error al limpiar backups: {e}")
@@ -157,7 +345,10 @@ class PersistenceService:
     
     def _get_satisfaction_by_generation(self, learning_system: LearningSystem) -> list:
         """
-        Obtiene satisfacción promedio por cada feedback.
+        Obtiene la satisfacción promedio agregada por generación.
+        
+        Se guarda una entrada por generación (no una por feedback); la de
+        la generación actual se actualiza con los agregados del sistema.
         
         Args:
             learning_system: Sistema de aprendizaje
@@ -165,14 +356,43 @@ class PersistenceService:
         Returns:
             Lista con satisfacción por generación
         """
+        self._metrics_by_generation[learning_system.generacion] = {
+            'generacion': learning_system.generacion,
+            'satisfaccion': round(learning_system.get_average_satisfaction(), 2),
+            'total_feedback': learning_system.get_total_users()
+        }
         return [
-            {
-                'generacion': learning_system.generacion,
-                'satisfaccion': exp.get('satisfaccion', 0)
-            }
-            for exp in learning_system.historico_usuarios
+            self._metrics_by_generation[gen]
+            for gen in sorted(self._metrics_by_generation)
         ]
     
+    def _load_generation_metrics(self, metrics: Dict[str, Any]):
+        """
+        Recupera la satisfacción por generación guardada previamente.
+        
+        El formato anterior guardaba una entrada por feedback; se agrupa
+        por generación para conservar solo el promedio de cada una.
+        
+        Args:
+            metrics: Sección 'metricas' del archivo principal
+        """
+        grouped: Dict[int, list] = {}
+        for entry in metrics.get('satisfaccion_promedio_por_generacion', []):
+            grouped.setdefault(entry.get('generacion', 0), []).append(entry)
+        
+        self._metrics_by_generation = {}
+        for gen, entries in grouped.items():
+            if len(entries) == 1 and 'total_feedback' in entries[0]:
+                self._metrics_by_generation[gen] = entries[0]
+                continue
+            
+            sats = [entry.get('satisfaccion', 0) for entry in entries]
+            self._metrics_by_generation[gen] = {
+                'generacion': gen,
+                'satisfaccion': round(sum(sats) / len(sats), 2),
+                'total_feedback': len(sats)
+            }
+    
     def export_statistics(self, learning_system: LearningSystem, 
                          output_file: Optional[Path] = None) -> bool:
         """
@@ -195,10 +415,10 @@ class PersistenceService:
                 'details': {
                     'satisfaction_history': [
                         {
-                            'fecha': exp.get('fecha', ''),
-                            'satisfaccion': exp.get('satisfaccion', 0),
-                            'nivel': exp.get('perfil', {}).get('nivel_str', ''),
-                            'objetivo': exp.get('perfil', {}).get('objetivo_str', '')
+                            'fecha': exp.fecha,
+                            'satisfaccion': exp.satisfaccion or 0,
+                            'nivel': exp.perfil.get('nivel_str', ''),
+                            'objetivo': exp.perfil.get('objetivo_str', '')
                         }
                         for exp in learning_system.historico_usuarios
                     ],
@@ -209,8 +429,11 @@ class PersistenceService:
                 }
             }
             
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(stats, f, indent=2, ensure_ascii=False)
+            # Buffer de 1 MiB: los fragmentos del codificador se acumulan
+            # en memoria en lugar de convertirse en una escritura cada uno
+            with open(output_file, 'w', encoding='utf-8',
+                      buffering=_WRITE_BUFFER_SIZE) as f:
+                f.writelines(_RECORD_ENCODER.iterencode(stats))
             
             print(f"📊 Estadísticas exportadas a {output_file}")
             return True
@@ -219,6 +442,41 @@ class PersistenceService:
             print(f"❌ Error al exportar estadísticas: {e}")
             return False
     
+    def restore_backup(self, backup_file: Path) -> bool:
+        """
+        Restaura los datos desde un backup.
+        
+        Copia el JSON principal y los JSONL del backup sobre los archivos de
+        datos; la próxima carga lee de nuevo el histórico completo.
+        
+        Args:
+            backup_file: JSON principal del backup (backup_<fecha>.json)
+            
+        Returns:
+            True si se restauró exitosamente
+        """
+        if not backup_file.exists():
+            print(f"❌ No existe el backup {backup_file}")
+            return False
+        
+        try:
+            for target, source in self._backup_files(backup_file).items():
+                if source.exists():
+                    shutil.copyfile(source, target)
+                elif target.exists():
+                    # Backup sin este JSONL (formato anterior): el histórico
+                    # viene dentro del JSON principal
+                    target.unlink()
+            
+            self._last_hash = None
+            self._persisted_counts = {key: 0 for key in self.APPEND_ONLY_KEYS}
+            print(f"♻️  Datos restaurados desde {backup_file.name}")
+            return True
+            
+        except Exception as e:
+            print(f"❌ Error al restaurar backup: {e}")
+            return False
+    
     def clear_data(self) -> bool:
         """
         Elimina el archivo de datos (reinicia el sistema).
@@ -231,6 +489,13 @@ class PersistenceService:
                 # Crear backup antes de eliminar
                 self._create_backup()
                 self.data_file.unlink()
+                self._last_hash = None
+                self._metrics_by_generation = {}
+                
+                for key, path in self.jsonl_files.items():
+                    if path.exists():
+                        path.unlink()
+                    self._persisted_counts[key] = 0
                 print("🗑️  Datos eliminados (backup creado)")
                 return True
             else:
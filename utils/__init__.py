@@ -10,6 +10,7 @@ from utils.calculations import (
     calculate_imc,
     get_imc_category,
     calculate_profile_similarity,
+    calculate_batch_similarity,
     calculate_average,
     calculate_median,
     calculate_std_dev
@@ -34,6 +35,7 @@ __all__ = [
     'calculate_imc',
     'get_imc_category',
     'calculate_profile_similarity',
+    'calculate_batch_similarity',
     'calculate_average',
     'calculate_median',
     'calculate_std_dev',
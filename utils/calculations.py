@@ -7,6 +7,8 @@ en el sistema: IMC, similitudes, distancias, normalizaciones, etc.
 
 import math
 from typing import Dict, Any, Tuple
+
+import numpy as np
 from config import Mappings, AIConfig
 from utils.constants import IMC_CATEGORIES, IMC_DISPLAY_NAMES, NORMALIZATION_FACTORS
 
@@ -150,6 +152,36 @@ def calculate_profile_similarity(profile1: Dict[str, Any],
         return 0.5
 
 
+# Escalas de [edad, imc, nivel, dias] para la similitud vectorizada
+_SIMILARITY_SCALE = np.array([
+    NORMALIZATION_FACTORS['edad'],
+    NORMALIZATION_FACTORS['imc'],
+    NORMALIZATION_FACTORS['nivel'],
+    NORMALIZATION_FACTORS['dias']
+], dtype=float)
+
+
+def calculate_batch_similarity(reference: np.ndarray, matrix: np.ndarray,
+                               goal_mismatch: np.ndarray) -> np.ndarray:
+    """
+    Calcula la similitud de un perfil contra muchos perfiles a la vez.
+    
+    Aplica la misma métrica que calculate_profile_similarity sobre una
+    matriz de filas [edad, imc, nivel_num, dias].
+    
+    Args:
+        reference: Vector [edad, imc, nivel_num, dias] del perfil de referencia
+        matrix: Matriz (N, 4) con los valores de los demás perfiles
+        goal_mismatch: Vector (N,) con 1.0 si el objetivo difiere, 0.0 si no
+        
+    Returns:
+        Vector (N,) de similitudes entre 0 y 1
+    """
+    diff = (matrix - reference) / _SIMILARITY_SCALE
+    distance = np.sqrt(np.einsum('ij,ij->i', diff, diff) + goal_mismatch)
+    return 1.0 / (1.0 + distance)
+
+
 def calculate_normalized_distance(value1: float, value2: float, 
                                  norm_factor: float) -> float:
     """
@@ -5,7 +5,7 @@ Este módulo contiene todas las funciones de validación de entrada
 utilizadas en el sistema para garantizar integridad de datos.
 """
 
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from config import ValidationConfig, Mappings
 
 
@@ -152,6 +152,82 @@ def validate_name(name: str) -> Tuple[bool, str]:
 # VALIDACIÓN COMPLETA DE PERFIL
 # ============================================================================
 
+# Límites y catálogos ligados a nombres de módulo para la validación en bloque
+_AGE_MIN, _AGE_MAX = ValidationConfig.AGE_MIN, ValidationConfig.AGE_MAX
+_WEIGHT_MIN, _WEIGHT_MAX = ValidationConfig.WEIGHT_MIN, ValidationConfig.WEIGHT_MAX
+_HEIGHT_MIN, _HEIGHT_MAX = ValidationConfig.HEIGHT_MIN, ValidationConfig.HEIGHT_MAX
+_DAYS_MIN, _DAYS_MAX = ValidationConfig.DAYS_MIN, ValidationConfig.DAYS_MAX
+_LEVELS = Mappings.LEVEL_STR_TO_NUM
+_GOALS = Mappings.GOAL_STR_TO_NUM
+
+
+def validate_profile_bulk(edad: Any, peso: Any, altura: Any,
+                          nivel_str: str, objetivo_str: str,
+                          dias: Any) -> Optional[str]:
+    """
+    Valida todos los campos de un perfil en una sola llamada.
+    
+    Produce los mismos mensajes que los validadores individuales, pero
+    realiza las comprobaciones de rango en línea.
+    
+    Args:
+        edad: Edad a validar
+        peso: Peso a validar (kg)
+        altura: Altura a validar (metros)
+        nivel_str: Nivel de experiencia
+        objetivo_str: Objetivo de entrenamiento
+        dias: Días de entrenamiento
+        
+    Returns:
+        Errores unidos por '; ' o None si el perfil es válido
+    """
+    errors = []
+    
+    try:
+        value = int(edad)
+        if value < _AGE_MIN:
+            errors.append(f"La edad debe ser mayor a {_AGE_MIN}")
+        elif value > _AGE_MAX:
+            errors.append(f"La edad debe ser menor a {_AGE_MAX}")
+    except (ValueError, TypeError):
+        errors.append("La edad debe ser un número entero")
+    
+    try:
+        value = float(peso)
+        if value < _WEIGHT_MIN:
+            errors.append(f"El peso debe ser mayor a {_WEIGHT_MIN} kg")
+        elif value > _WEIGHT_MAX:
+            errors.append(f"El peso debe ser menor a {_WEIGHT_MAX} kg")
+    except (ValueError, TypeError):
+        errors.append("El peso debe ser un número")
+    
+    try:
+        value = float(altura)
+        if value < _HEIGHT_MIN:
+            errors.append(f"La altura debe ser mayor a {_HEIGHT_MIN} m")
+        elif value > _HEIGHT_MAX:
+            errors.append(f"La altura debe ser menor a {_HEIGHT_MAX} m")
+    except (ValueError, TypeError):
+        errors.append("La altura debe ser un número")
+    
+    if nivel_str not in _LEVELS:
+        errors.append(f"Nivel debe ser uno de: {', '.join(_LEVELS)}")
+    
+    if objetivo_str not in _GOALS:
+        errors.append(f"Objetivo debe ser uno de: {', '.join(_GOALS)}")
+    
+    try:
+        value = int(dias)
+        if value < _DAYS_MIN:
+            errors.append(f"Los días deben ser al menos {_DAYS_MIN}")
+        elif value > _DAYS_MAX:
+            errors.append(f"Los días no pueden ser más de {_DAYS_MAX}")
+    except (ValueError, TypeError):
+        errors.append("Los días deben ser un número entero")
+    
+    return '; '.join(errors) if errors else None
+
+
 def validate_user_profile(data: Dict[str, Any]) -> Tuple[bool, List[str]]:
     """
     Valida un perfil de usuario completo.
@@ -390,6 +466,12 @@ def is_valid_percentage(value: float) -> bool:
     return 0 <= value <= 100 or 0 <= value <= 1
 
 
+# Tabla de traducción que elimina los caracteres de control C0, DEL y C1
+_CONTROL_CHARS_TABLE = str.maketrans(
+    '', '', ''.join(map(chr, (*range(0x20), *range(0x7F, 0xA0))))
+)
+
+
 def sanitize_string(text: str, max_length: int = 100) -> str:
     """
     Sanitiza un string eliminando caracteres peligrosos y limitando longitud.
@@ -404,14 +486,15 @@ def sanitize_string(text: str, max_length: int = 100) -> str:
     if not text:
         return ""
     
-    # Eliminar caracteres de control
-    sanitized = ''.join(char for char in text if char.isprintable())
+    # Eliminar caracteres de control (el caso habitual no tiene ninguno)
+    sanitized = text
+    if not sanitized.isprintable():
+        sanitized = sanitized.translate(_CONTROL_CHARS_TABLE)
+        if not sanitized.isprintable():
+            sanitized = ''.join(char for char in sanitized if char.isprintable())
     
     # Limitar longitud
-    if len(sanitized) > max_length:
-        sanitized = sanitized[:max_length]
-    
-    return sanitized.strip()
+    return sanitized[:max_length].strip()
 
 
 # ============================================================================
@@ -5,12 +5,29 @@ Este módulo contiene todas las vistas del sistema organizadas
 según el patrón MVC.
 """
 
+import importlib
+
 from views.base_view import BaseView
-from views.welcome_view import WelcomeView
-from views.form_view import FormView
-from views.routine_view import RoutineView
-from views.feedback_view import FeedbackView
-from views.thanks_view import ThanksView
+
+# Las vistas concretas se cargan al primer acceso (PEP 562) para que
+# importar el paquete no arrastre módulos que aún no se muestran
+_LAZY_VIEWS = {
+    'WelcomeView': 'views.welcome_view',
+    'FormView': 'views.form_view',
+    'RoutineView': 'views.routine_view',
+    'FeedbackView': 'views.feedback_view',
+    'ThanksView': 'views.thanks_view'
+}
+
+
+def __getattr__(name):
+    module = _LAZY_VIEWS.get(name)
+    if module is None:
+        raise AttributeError(f"module 'views' has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     'BaseView',
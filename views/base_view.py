@@ -7,9 +7,57 @@ del sistema, proporcionando funcionalidad compartida.
 
 from abc import ABC, abstractmethod
 import tkinter as tk
+from tkinter import messagebox, ttk
+from types import MappingProxyType
 from typing import Dict, Any, Optional, Callable
 
 
+# Colores del tema (compartidos, de solo lectura)
+COLORS = MappingProxyType({
+    'bg_dark': '#1a1a2e',
+    'bg_medium': '#16213e',
+    'bg_light': '#0f3460',
+    'accent': '#00adb5',
+    'text': '#eeeeee',
+    'success': '#06d6a0',
+    'warning': '#ffd93d',
+    'error': '#ef476f'
+})
+
+# Fuentes (compartidas, de solo lectura)
+FONTS = MappingProxyType({
+    'title': ('Helvetica', 18, 'bold'),
+    'subtitle': ('Helvetica', 14, 'bold'),
+    'normal': ('Helvetica', 11),
+    'small': ('Helvetica', 9)
+})
+
+# Fuentes específicas compartidas entre vistas
+FONT_FIELD_LABEL = ('Helvetica', 12)
+FONT_SECTION = ('Helvetica', 12, 'bold')
+FONT_EMPHASIS = ('Helvetica', 13, 'bold')
+FONT_HEADING = ('Helvetica', 16, 'bold')
+FONT_FORM_TITLE = ('Helvetica', 20, 'bold')
+FONT_HERO = ('Helvetica', 24, 'bold')
+
+
+# Diálogos de mensaje por tipo
+_MESSAGE_DIALOGS = {
+    'error': messagebox.showerror,
+    'info': messagebox.showinfo,
+    'warning': messagebox.showwarning
+}
+
+# Nombres de estilos ttk compartidos por todas las vistas
+_TITLE_STYLE = 'Title.TLabel'
+_TEXT_STYLE = 'Text.TLabel'
+_BUTTON_STYLE = 'Accent.TButton'
+_ENTRY_STYLE = 'App.TEntry'
+
+# Alias de las opciones tk clásicas aceptadas por los creadores de labels
+_LABEL_ALIASES = {'bg': 'background', 'fg': 'foreground'}
+
+
 class BaseView(ABC):
     """
     Clase base abstracta para todas las vistas.
@@ -20,6 +68,20 @@ class BaseView(ABC):
     - Utilidades de UI compartidas
     """
     
+    __slots__ = ('parent', 'controller', 'frame', '_scroll')
+    
+    # Estilos a nivel de clase: todas las vistas comparten los mismos objetos
+    COLORS = COLORS
+    FONTS = FONTS
+    colors = COLORS
+    fonts = FONTS
+    
+    # Estilo ttk configurado una sola vez para toda la aplicación
+    _style: Optional[ttk.Style] = None
+    
+    # Estilos de botón derivados: (bg, font, padx, pady) -> nombre
+    _button_styles: Dict[tuple, str] = {}
+    
     def __init__(self, parent: tk.Widget, controller: Any):
         """
         Inicializa la vista base.
@@ -31,26 +93,82 @@ class BaseView(ABC):
         self.parent = parent
         self.controller = controller
         self.frame = None
+        self._scroll = None
         
-        # Colores del tema
-        self.colors = {
-            'bg_dark': '#1a1a2e',
-            'bg_medium': '#16213e',
-            'bg_light': '#0f3460',
-            'accent': '#00adb5',
-            'text': '#eeeeee',
-            'success': '#06d6a0',
-            'warning': '#ffd93d',
-            'error': '#ef476f'
-        }
-        
-        # Fuentes
-        self.fonts = {
-            'title': ('Helvetica', 18, 'bold'),
-            'subtitle': ('Helvetica', 14, 'bold'),
-            'normal': ('Helvetica', 11),
-            'small': ('Helvetica', 9)
-        }
+        if BaseView._style is None:
+            BaseView._init_styles()
+    
+    @staticmethod
+    def _init_styles():
+        """Configura en Tcl los estilos ttk de labels, botones y entradas."""
+        style = ttk.Style()
+        style.theme_use('clam')
+        
+        style.configure(
+            _TITLE_STYLE,
+            font=FONTS['title'],
+            background=COLORS['bg_medium'],
+            foreground=COLORS['accent']
+        )
+        style.configure(
+            _TEXT_STYLE,
+            font=FONTS['normal'],
+            background=COLORS['bg_medium'],
+            foreground=COLORS['text']
+        )
+        style.configure(
+            _BUTTON_STYLE,
+            font=FONTS['subtitle'],
+            background=COLORS['accent'],
+            foreground='#ffffff',
+            padding=(30, 12),
+            borderwidth=0
+        )
+        style.map(
+            _BUTTON_STYLE,
+            background=[('active', COLORS['success'])],
+            foreground=[('active', '#ffffff')]
+        )
+        style.configure(
+            _ENTRY_STYLE,
+            fieldbackground=COLORS['bg_light'],
+            foreground=COLORS['text'],
+            insertcolor=COLORS['text'],
+            borderwidth=0
+        )
+        
+        BaseView._style = style
+    
+    @classmethod
+    def _button_style(cls, bg: Optional[str], font: Optional[tuple],
+                      padx: int, pady: int) -> str:
+        """
+        Obtiene el estilo de botón para una combinación de opciones.
+        
+        Cada combinación se configura en Tcl la primera vez que se usa y
+        hereda del estilo base de botón.
+        
+        Args:
+            bg: Color de fondo (None para el del estilo base)
+            font: Fuente (None para la del estilo base)
+            padx: Relleno horizontal
+            pady: Relleno vertical
+            
+        Returns:
+            Nombre del estilo ttk
+        """
+        key = (bg, font, padx, pady)
+        name = cls._button_styles.get(key)
+        if name is None:
+            name = f"B{len(cls._button_styles)}.{_BUTTON_STYLE}"
+            options = {'padding': (padx, pady)}
+            if bg is not None:
+                options['background'] = bg
+            if font is not None:
+                options['font'] = font
+            cls._style.configure(name, **options)
+            cls._button_styles[key] = name
+        return name
     
     @abstractmethod
     def build(self):
@@ -65,8 +183,12 @@ class BaseView(ABC):
         if self.frame is None:
             self.build()
         
-        # Limpiar el parent
-        self.clear_parent()
+        # Ocultar solo la vista activa del controlador, sin recorrer
+        # todos los hijos del parent
+        current = getattr(self.controller, 'current_view', None)
+        if current is not None and current is not self:
+            current.hide()
+        self.controller.current_view = self
         
         # Mostrar esta vista
         if self.frame:
@@ -77,24 +199,24 @@ class BaseView(ABC):
         if self.frame:
             self.frame.pack_forget()
     
-    def clear_parent(self):
-        """Oculta widgets previos sin destruirlos."""
-        for widget in self.parent.winfo_children():
-            widget.pack_forget()
-
-    
-    def destroy(self):
-        """Destruye la vista."""
+    def dispose(self):
+        """
+        Destruye la vista al cerrar la aplicación.
+        
+        Entre vistas solo se usa hide(): el frame construido se conserva
+        y se vuelve a mostrar sin reconstruirlo.
+        """
         if self.frame:
             self.frame.destroy()
             self.frame = None
+            self._scroll = None
     
     # ========================================================================
     # UTILIDADES DE UI
     # ========================================================================
     
     def create_title_label(self, parent: tk.Widget, text: str, 
-                          **kwargs) -> tk.Label:
+                          **kwargs) -> ttk.Label:
         """
         Crea un label de título.
         
@@ -106,17 +228,11 @@ class BaseView(ABC):
         Returns:
             Label creado
         """
-        defaults = {
-            'font': self.fonts['title'],
-            'bg': self.colors['bg_medium'],
-            'fg': self.colors['accent']
-        }
-        defaults.update(kwargs)
-        
-        return tk.Label(parent, text=text, **defaults)
+        return ttk.Label(parent, text=text, style=_TITLE_STYLE,
+                         **self._label_options(kwargs))
     
     def create_text_label(self, parent: tk.Widget, text: str,
-                         **kwargs) -> tk.Label:
+                         **kwargs) -> ttk.Label:
         """
         Crea un label de texto normal.
         
@@ -128,17 +244,16 @@ class BaseView(ABC):
         Returns:
             Label creado
         """
-        defaults = {
-            'font': self.fonts['normal'],
-            'bg': self.colors['bg_medium'],
-            'fg': self.colors['text']
-        }
-        defaults.update(kwargs)
-        
-        return tk.Label(parent, text=text, **defaults)
+        return ttk.Label(parent, text=text, style=_TEXT_STYLE,
+                         **self._label_options(kwargs))
+    
+    @staticmethod
+    def _label_options(kwargs: dict) -> dict:
+        """Traduce las opciones tk clásicas (bg, fg) a sus nombres ttk."""
+        return {_LABEL_ALIASES.get(key, key): value for key, value in kwargs.items()}
     
     def create_button(self, parent: tk.Widget, text: str,
-                     command: Callable, **kwargs) -> tk.Button:
+                     command: Callable, **kwargs) -> ttk.Button:
         """
         Crea un botón estilizado.
         
@@ -151,22 +266,16 @@ class BaseView(ABC):
         Returns:
             Botón creado
         """
-        defaults = {
-            'font': self.fonts['subtitle'],
-            'bg': self.colors['accent'],
-            'fg': 'white',
-            'activebackground': self.colors['success'],
-            'activeforeground': 'white',
-            'padx': 30,
-            'pady': 12,
-            'border': 0,
-            'cursor': 'hand2'
-        }
-        defaults.update(kwargs)
-        
-        return tk.Button(parent, text=text, command=command, **defaults)
+        style = self._button_style(
+            kwargs.pop('bg', None),
+            kwargs.pop('font', None),
+            kwargs.pop('padx', 30),
+            kwargs.pop('pady', 12)
+        )
+        return ttk.Button(parent, text=text, command=command, style=style,
+                          cursor='hand2', **kwargs)
     
-    def create_entry(self, parent: tk.Widget, **kwargs) -> tk.Entry:
+    def create_entry(self, parent: tk.Widget, **kwargs) -> ttk.Entry:
         """
         Crea un campo de entrada estilizado.
         
@@ -177,17 +286,49 @@ class BaseView(ABC):
         Returns:
             Entry creado
         """
-        defaults = {
-            'font': self.fonts['normal'],
-            'bg': self.colors['bg_light'],
-            'fg': self.colors['text'],
-            'insertbackground': self.colors['text'],
-            'relief': 'flat',
-            'width': 30
-        }
-        defaults.update(kwargs)
-        
-        return tk.Entry(parent, **defaults)
+        options = {'font': FONTS['normal'], 'width': 30, **kwargs}
+        return ttk.Entry(parent, style=_ENTRY_STYLE, **options)
+    
+    def _choice_group(self, parent: tk.Widget, var: tk.Variable,
+                      options: list, pack_opts: dict) -> ttk.Combobox:
+        """
+        Crea un selector desplegable equivalente a un grupo de radio buttons.
+        
+        Un único widget sustituye a un Radiobutton por opción. La variable
+        recibe el valor de la opción elegida.
+        
+        Args:
+            parent: Widget padre
+            var: Variable asociada al grupo
+            options: Lista de tuplas (texto, valor)
+            pack_opts: Opciones de pack del selector
+            
+        Returns:
+            Combobox creado
+        """
+        labels = [text for text, _ in options]
+        values = dict(options)
+        current = var.get()
+        
+        combo = ttk.Combobox(
+            parent,
+            values=labels,
+            state='readonly',
+            font=self.fonts['normal'],
+            width=max(map(len, labels)) + 2
+        )
+        for text, value in options:
+            if value == current:
+                combo.set(text)
+                break
+        
+        combo.bind(
+            '<<ComboboxSelected>>',
+            lambda _event: var.set(values[combo.get()])
+        )
+        combo.pack(**pack_opts)
+        
+        return combo
     
     def create_scrollable_frame(self, parent: tk.Widget) -> tuple:
         """
@@ -213,16 +354,83 @@ class BaseView(ABC):
         
         scrollable_frame = tk.Frame(canvas, bg=self.colors['bg_medium'])
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        # Agrupar los <Configure> de una construcción masiva en un solo
+        # recálculo de bbox, ejecutado cuando Tk queda ocioso
+        pending = []
+        
+        def _update_scrollregion():
+            pending.clear()
+            if canvas.winfo_exists():
+                canvas.configure(scrollregion=canvas.bbox("all"))
+        
+        def _on_configure(_event):
+            if not pending:
+                pending.append(canvas.after_idle(_update_scrollregion))
+        
+        scrollable_frame.bind("<Configure>", _on_configure)
         
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
         
         return canvas, scrollbar, scrollable_frame
     
+    def _build_scroll_frame(self) -> tk.Frame:
+        """
+        Obtiene el contenedor con scroll de la vista, creándolo una sola vez.
+        
+        El triple (canvas, scrollbar, frame interior) se cachea en la
+        vista; en reconstrucciones posteriores solo se vacía el frame
+        interior en lugar de recrear el canvas y sus bindings.
+        
+        Returns:
+            Frame interior donde colocar el contenido
+        """
+        if self._scroll is not None and self._scroll[0].winfo_exists():
+            inner = self._scroll[2]
+            for child in inner.winfo_children():
+                child.destroy()
+            return inner
+        
+        canvas, scrollbar, inner = self.create_scrollable_frame(self.frame)
+        canvas.pack(side="left", fill="both", expand=True, padx=(0, 10))
+        scrollbar.pack(side="right", fill="y")
+        
+        def _on_mousewheel(event):
+            if event.num == 4:
+                step = -1
+            elif event.num == 5:
+                step = 1
+            else:
+                step = -1 if event.delta > 0 else 1
+            canvas.yview_scroll(step, "units")
+        
+        # Rueda del ratón activa solo mientras el puntero está sobre el canvas.
+        # Cada bind_all registra un comando Tcl nuevo en la raíz que
+        # unbind_all no elimina: se guardan y se borran explícitamente
+        wheel_sequences = ("<MouseWheel>", "<Button-4>", "<Button-5>")
+        wheel_commands = []
+        
+        def _bind_wheel(_event):
+            if not wheel_commands:
+                wheel_commands.extend(
+                    canvas.bind_all(sequence, _on_mousewheel)
+                    for sequence in wheel_sequences
+                )
+        
+        def _unbind_wheel(_event):
+            root = canvas._root()
+            for sequence in wheel_sequences:
+                canvas.unbind_all(sequence)
+            for command in wheel_commands:
+                root.deletecommand(command)
+            wheel_commands.clear()
+        
+        canvas.bind("<Enter>", _bind_wheel)
+        canvas.bind("<Leave>", _unbind_wheel)
+        
+        self._scroll = (canvas, scrollbar, inner)
+        return inner
+    
     def create_info_frame(self, parent: tk.Widget, 
                          title: str, content: str) -> tk.Frame:
         """
@@ -271,6 +479,17 @@ class BaseView(ABC):
         if hasattr(self.controller, 'show_view'):
             self.controller.show_view(view_name, **kwargs)
     
+    def _show(self, kind: str, title: str, message: str):
+        """
+        Muestra un diálogo de mensaje del tipo indicado.
+        
+        Args:
+            kind: Tipo de diálogo ('error', 'info' o 'warning')
+            title: Título del diálogo
+            message: Contenido del diálogo
+        """
+        _MESSAGE_DIALOGS[kind](title, message)
+    
     def show_error(self, title: str, message: str):
         """
         Muestra un mensaje de error.
@@ -279,8 +498,7 @@ class BaseView(ABC):
             title: Título del error
             message: Mensaje del error
         """
-        from tkinter import messagebox
-        messagebox.showerror(title, message)
+        self._show('error', title, message)
     
     def show_info(self, title: str, message: str):
         """
@@ -290,8 +508,7 @@ class BaseView(ABC):
             title: Título del mensaje
             message: Contenido del mensaje
         """
-        from tkinter import messagebox
-        messagebox.showinfo(title, message)
+        self._show('info', title, message)
     
     def show_warning(self, title: str, message: str):
         """
@@ -301,5 +518,4 @@ class BaseView(ABC):
             title: Título de la advertencia
             message: Contenido de la advertencia
         """
-        from tkinter import messagebox
-        messagebox.showwarning(title, message)
\ No newline at end of file
+        self._show('warning', title, message)
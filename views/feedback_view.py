@@ -5,7 +5,17 @@ Permite al usuario dar feedback sobre la rutina generada.
 """
 
 import tkinter as tk
-from views.base_view import BaseView
+from views.base_view import BaseView, FONT_EMPHASIS, FONT_HEADING, FONT_SECTION
+
+
+# Escala de satisfacción: (valor, texto)
+_RATINGS = (
+    (1, "😫 Muy difícil"),
+    (2, "😕 Difícil"),
+    (3, "😊 Adecuada"),
+    (4, "😄 Buena"),
+    (5, "🤩 Perfecta")
+)
 
 
 class FeedbackView(BaseView):
@@ -17,6 +27,8 @@ class FeedbackView(BaseView):
     - Comentarios adicionales
     """
     
+    __slots__ = ('user_data', 'routine', 'satisfaccion_var', 'comment_text')
+    
     def __init__(self, parent: tk.Widget, controller, user_data: dict = None, routine: dict = None):
         super().__init__(parent, controller)
         self.user_data = user_data or {}
@@ -26,15 +38,18 @@ class FeedbackView(BaseView):
     
     def build(self):
         """Construye la interfaz de feedback."""
+        c = self.colors
+        bg_m = c['bg_medium']
+        
         self.frame = tk.Frame(
             self.parent,
-            bg=self.colors['bg_dark']
+            bg=c['bg_dark']
         )
         
         # Frame central
         center_frame = tk.Frame(
             self.frame,
-            bg=self.colors['bg_medium'],
+            bg=bg_m,
             padx=50,
             pady=40
         )
@@ -44,7 +59,7 @@ class FeedbackView(BaseView):
         title = self.create_title_label(
             center_frame,
             "💬 TU OPINIÓN AYUDA A LA IA A MEJORAR",
-            font=('Helvetica', 16, 'bold')
+            font=FONT_HEADING
         )
         title.pack(pady=(0, 30))
         
@@ -63,24 +78,37 @@ rutinas cada vez más precisas y personalizadas."""
         question = tk.Label(
             center_frame,
             text="¿Cómo te sientes con esta rutina?",
-            font=('Helvetica', 12, 'bold'),
-            bg=self.colors['bg_medium'],
-            fg=self.colors['text']
+            font=FONT_SECTION,
+            bg=bg_m,
+            fg=c['text']
         )
         question.pack(pady=10)
         
+        # La parte interactiva se crea tras el primer pintado de la vista
+        center_frame.after_idle(self._build_interactive, center_frame)
+    
+    def _build_interactive(self, parent: tk.Widget):
+        """
+        Construye la escala, los comentarios y el botón de envío.
+        
+        Args:
+            parent: Frame central de la vista
+        """
+        if not parent.winfo_exists():
+            return
+        
         # Escala de satisfacción
-        self._build_satisfaction_scale(center_frame)
+        self._build_satisfaction_scale(parent)
         
         # Comentarios
-        self._build_comments_section(center_frame)
+        self._build_comments_section(parent)
         
         # Botón enviar
         submit_btn = self.create_button(
-            center_frame,
+            parent,
             "✅ ENVIAR FEEDBACK",
             command=self._on_submit_clicked,
-            font=('Helvetica', 13, 'bold'),
+            font=FONT_EMPHASIS,
             bg=self.colors['success'],
             padx=40,
             pady=15
@@ -94,37 +122,25 @@ rutinas cada vez más precisas y personalizadas."""
         scale_frame = tk.Frame(parent, bg=self.colors['bg_medium'])
         scale_frame.pack(pady=20)
         
-        ratings = [
-            (1, "😫 Muy difícil", "Demasiado exigente, no pude completarla"),
-            (2, "😕 Difícil", "Muy desafiante, pero terminé"),
-            (3, "😊 Adecuada", "Balance correcto, me sentí bien"),
-            (4, "😄 Buena", "Perfecta para mi nivel, gran rutina"),
-            (5, "🤩 Perfecta", "Exactamente lo que necesitaba, excelente")
-        ]
-        
-        for value, text, description in ratings:
-            rb = tk.Radiobutton(
-                scale_frame,
-                text=text,
-                variable=self.satisfaccion_var,
-                value=value,
-                font=self.fonts['normal'],
-                bg=self.colors['bg_medium'],
-                fg=self.colors['text'],
-                selectcolor=self.colors['bg_light'],
-                activebackground=self.colors['bg_medium'],
-                activeforeground=self.colors['accent']
-            )
-            rb.pack(anchor='w', pady=5)
+        self._choice_group(
+            scale_frame,
+            self.satisfaccion_var,
+            [(text, value) for value, text in _RATINGS],
+            {'anchor': 'w', 'pady': 5}
+        )
     
     def _build_comments_section(self, parent: tk.Widget):
         """Construye la sección de comentarios."""
+        c = self.colors
+        txt = c['text']
+        font = self.fonts['normal']
+        
         comment_label = tk.Label(
             parent,
             text="Comentarios adicionales (opcional):",
-            font=self.fonts['normal'],
-            bg=self.colors['bg_medium'],
-            fg=self.colors['text']
+            font=font,
+            bg=c['bg_medium'],
+            fg=txt
         )
         comment_label.pack(pady=(20, 5))
         
@@ -132,10 +148,10 @@ rutinas cada vez más precisas y personalizadas."""
             parent,
             height=4,
             width=50,
-            font=self.fonts['normal'],
-            bg=self.colors['bg_light'],
-            fg=self.colors['text'],
-            insertbackground=self.colors['text'],
+            font=font,
+            bg=c['bg_light'],
+            fg=txt,
+            insertbackground=txt,
             relief='flat'
         )
         self.comment_text.pack(pady=10)
@@ -143,7 +159,7 @@ rutinas cada vez más precisas y personalizadas."""
     def _on_submit_clicked(self):
         """Maneja el envío del feedback."""
         satisfaccion = self.satisfaccion_var.get()
-        comentarios = self.comment_text.get('1.0', 'end').strip()
+        comentarios = self.comment_text.get('1.0', tk.END).strip()
         
         # Procesar feedback a través del controlador
         success, result = self.controller.submit_feedback(
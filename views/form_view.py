@@ -5,12 +5,23 @@ Formulario para recopilar información del usuario
 antes de generar la rutina.
 """
 
+import functools
 import tkinter as tk
 from tkinter import messagebox
-from datetime import datetime
-from views.base_view import BaseView
+from config import ValidationConfig
+from views.base_view import BaseView, FONT_FIELD_LABEL, FONT_FORM_TITLE
 
 
+# Campos numéricos: (nombre, conversión, mínimo, máximo, mensaje de error)
+_NUMERIC_FIELDS = (
+    ('edad', int, ValidationConfig.AGE_MIN, ValidationConfig.AGE_MAX,
+     "Edad inválida (10-100 años)"),
+    ('peso', float, ValidationConfig.WEIGHT_MIN, ValidationConfig.WEIGHT_MAX,
+     "Peso inválido (30-300 kg)"),
+    ('altura', float, ValidationConfig.HEIGHT_MIN, ValidationConfig.HEIGHT_MAX,
+     "Altura inválida (1.0-2.5 m)"),
+)
+
 class FormView(BaseView):
     """
     Vista del formulario de datos del usuario.
@@ -23,9 +34,53 @@ class FormView(BaseView):
     - Limitaciones físicas
     """
     
+    __slots__ = ('form_vars', '_field_label')
+    
+    # Campos del formulario: (tipo, variable, etiqueta, opciones)
+    FIELDS = (
+        ('text', 'nombre', "Nombre:", {}),
+        ('text', 'edad', "Edad:", {}),
+        ('text', 'peso', "Peso (kg):", {}),
+        ('text', 'altura', "Altura (m):", {}),
+        ('choice', 'nivel', "Nivel de experiencia:", {
+            'options': ['principiante', 'intermedio', 'avanzado'],
+            'default': 'principiante'
+        }),
+        ('choice', 'objetivo', "Objetivo principal:", {
+            'options': [
+                ('Perder peso', 'perder_peso'),
+                ('Ganar masa', 'ganar_masa'),
+                ('Resistencia', 'resistencia'),
+                ('Fuerza', 'fuerza')
+            ],
+            'default': 'ganar_masa'
+        }),
+        ('spinbox', 'dias', "Días disponibles:", {
+            'from_': 2, 'to': 7, 'default': 4
+        }),
+        ('text', 'limitaciones', "Limitaciones (opcional):", {}),
+    )
+    
     def __init__(self, parent: tk.Widget, controller):
         super().__init__(parent, controller)
-        self.form_vars = {}
+        
+        # Todas las claves del formulario desde el inicio: las variables Tk
+        # de los campos de selección se crean una sola vez y se reutilizan;
+        # los campos de texto reciben su Entry al construir la vista
+        self.form_vars = {
+            var_name: (
+                tk.IntVar(value=opts['default']) if kind == 'spinbox'
+                else tk.StringVar(value=opts.get('default') or opts['options'][0])
+                if kind == 'choice'
+                else None
+            )
+            for kind, var_name, _, opts in self.FIELDS
+        }
+        
+        # Creador de etiquetas de campo con la fuente ya ligada
+        self._field_label = functools.partial(
+            self.create_text_label, font=FONT_FIELD_LABEL
+        )
     
     def build(self):
         """Construye la interfaz del formulario."""
@@ -34,17 +89,11 @@ class FormView(BaseView):
             bg=self.colors['bg_dark']
         )
         
-        # Crear frame con scroll
-        canvas, scrollbar, scrollable_frame = self.create_scrollable_frame(
-            self.frame
-        )
-        
-        canvas.pack(side="left", fill="both", expand=True, padx=(0, 10))
-        scrollbar.pack(side="right", fill="y")
-        
-        # Contenido del formulario
+        # Contenido del formulario directamente en el frame de la vista:
+        # con los selectores desplegables el formulario cabe en la ventana
+        # y no necesita el Canvas con scroll
         content_frame = tk.Frame(
-            scrollable_frame,
+            self.frame,
             bg=self.colors['bg_medium'],
             padx=50,
             pady=30
@@ -55,7 +104,7 @@ class FormView(BaseView):
         title = self.create_title_label(
             content_frame,
             "📝 Cuéntame sobre ti",
-            font=('Helvetica', 20, 'bold')
+            font=FONT_FORM_TITLE
         )
         title.grid(row=0, column=0, columnspan=2, pady=(0, 30))
         
@@ -70,7 +119,7 @@ class FormView(BaseView):
             btn_frame,
             "🧠 GENERAR RUTINA CON IA",
             command=self._on_generate_clicked,
-            font=('Helvetica', 14, 'bold'),
+            font=self.fonts['subtitle'],
             padx=40,
             pady=15
         )
@@ -78,179 +127,53 @@ class FormView(BaseView):
     
     def _build_form_fields(self, parent: tk.Widget):
         """
-        Construye los campos del formulario.
+        Construye los campos del formulario en una sola pasada sobre FIELDS.
         
         Args:
             parent: Widget padre
         """
-        row = 1
-        
-        # Campos de texto simples
-        text_fields = [
-            ("Nombre:", "nombre"),
-            ("Edad:", "edad"),
-            ("Peso (kg):", "peso"),
-            ("Altura (m):", "altura"),
-        ]
-        
-        for label_text, var_name in text_fields:
-            self._create_text_field(parent, row, label_text, var_name)
-            row += 1
-        
-        # Nivel de experiencia
-        self._create_radio_field(
-            parent, row,
-            "Nivel de experiencia:",
-            "nivel",
-            ['principiante', 'intermedio', 'avanzado'],
-            default='principiante'
-        )
-        row += 1
-        
-        # Objetivo
-        self._create_radio_field(
-            parent, row,
-            "Objetivo principal:",
-            "objetivo",
-            [
-                ('Perder peso', 'perder_peso'),
-                ('Ganar masa', 'ganar_masa'),
-                ('Resistencia', 'resistencia'),
-                ('Fuerza', 'fuerza')
-            ],
-            default='ganar_masa',
-            vertical=True
-        )
-        row += 1
-        
-        # Días de entrenamiento
-        self._create_spinbox_field(
-            parent, row,
-            "Días disponibles:",
-            "dias",
-            from_=2,
-            to=7,
-            default=4
-        )
-        row += 1
-        
-        # Limitaciones
-        self._create_text_area_field(
-            parent, row,
-            "Limitaciones (opcional):",
-            "limitaciones"
-        )
-    
-    def _create_text_field(self, parent: tk.Widget, row: int,
-                          label_text: str, var_name: str):
-        """Crea un campo de texto."""
-        label = self.create_text_label(
-            parent,
-            label_text,
-            font=('Helvetica', 12)
-        )
-        label.grid(row=row, column=0, sticky='w', pady=10, padx=(0, 20))
-        
-        entry = self.create_entry(parent)
-        entry.grid(row=row, column=1, pady=10)
-        
-        self.form_vars[var_name] = entry
-    
-    def _create_radio_field(self, parent: tk.Widget, row: int,
-                           label_text: str, var_name: str,
-                           options: list, default: str = None,
-                           vertical: bool = False):
-        """Crea un campo con radio buttons."""
-        label = self.create_text_label(
-            parent,
-            label_text,
-            font=('Helvetica', 12)
-        )
-        label.grid(row=row, column=0, sticky='w', pady=10, padx=(0, 20))
-        
-        var = tk.StringVar(value=default or options[0])
+        colors = self.colors
+        fonts = self.fonts
+        form_vars = self.form_vars
         
-        radio_frame = tk.Frame(parent, bg=self.colors['bg_medium'])
-        radio_frame.grid(row=row, column=1, pady=10, sticky='w')
-        
-        for option in options:
-            # Manejar tuplas (texto, valor)
-            if isinstance(option, tuple):
-                text, value = option
-            else:
-                text = option.title()
-                value = option
+        for row, (kind, var_name, label_text, opts) in enumerate(self.FIELDS, 1):
+            label = self._field_label(parent, label_text)
+            label.grid(row=row, column=0, sticky='w', pady=10, padx=(0, 20))
             
-            rb = tk.Radiobutton(
-                radio_frame,
-                text=text,
-                variable=var,
-                value=value,
-                font=self.fonts['normal'],
-                bg=self.colors['bg_medium'],
-                fg=self.colors['text'],
-                selectcolor=self.colors['bg_light'],
-                activebackground=self.colors['bg_medium'],
-                activeforeground=self.colors['accent']
-            )
+            if kind == 'text':
+                widget = self.create_entry(parent)
+                widget.grid(row=row, column=1, pady=10)
+                form_vars[var_name] = widget
             
-            if vertical:
-                rb.pack(anchor='w', pady=2)
-            else:
-                rb.pack(side='left', padx=10)
-        
-        self.form_vars[var_name] = var
-    
-    def _create_spinbox_field(self, parent: tk.Widget, row: int,
-                             label_text: str, var_name: str,
-                             from_: int, to: int, default: int):
-        """Crea un campo spinbox."""
-        label = self.create_text_label(
-            parent,
-            label_text,
-            font=('Helvetica', 12)
-        )
-        label.grid(row=row, column=0, sticky='w', pady=10, padx=(0, 20))
-        
-        var = tk.IntVar(value=default)
-        
-        spinbox = tk.Spinbox(
-            parent,
-            from_=from_,
-            to=to,
-            textvariable=var,
-            font=self.fonts['normal'],
-            bg=self.colors['bg_light'],
-            fg=self.colors['text'],
-            width=28
-        )
-        spinbox.grid(row=row, column=1, pady=10)
-        
-        self.form_vars[var_name] = var
+            elif kind == 'choice':
+                choice_frame = tk.Frame(parent, bg=colors['bg_medium'])
+                choice_frame.grid(row=row, column=1, pady=10, sticky='w')
+                
+                # Un solo desplegable en lugar de un radio button por opción
+                self._choice_group(
+                    choice_frame, form_vars[var_name],
+                    self._option_pairs(opts['options']), {'anchor': 'w'}
+                )
+            
+            elif kind == 'spinbox':
+                tk.Spinbox(
+                    parent,
+                    from_=opts['from_'],
+                    to=opts['to'],
+                    textvariable=form_vars[var_name],
+                    font=fonts['normal'],
+                    bg=colors['bg_light'],
+                    fg=colors['text'],
+                    width=28
+                ).grid(row=row, column=1, pady=10)
     
-    def _create_text_area_field(self, parent: tk.Widget, row: int,
-                               label_text: str, var_name: str):
-        """Crea un campo de texto multilínea."""
-        label = self.create_text_label(
-            parent,
-            label_text,
-            font=('Helvetica', 12)
-        )
-        label.grid(row=row, column=0, sticky='w', pady=10, padx=(0, 20))
-        
-        text_widget = tk.Text(
-            parent,
-            height=3,
-            font=self.fonts['normal'],
-            bg=self.colors['bg_light'],
-            fg=self.colors['text'],
-            insertbackground=self.colors['text'],
-            relief='flat',
-            width=30
-        )
-        text_widget.grid(row=row, column=1, pady=10)
-        
-        self.form_vars[var_name] = text_widget
+    @staticmethod
+    def _option_pairs(options: list) -> list:
+        """Normaliza las opciones a tuplas (texto, valor)."""
+        return [
+            option if isinstance(option, tuple) else (option.title(), option)
+            for option in options
+        ]
     
     def _validate_and_collect_data(self) -> dict:
         """
@@ -259,51 +182,50 @@ class FormView(BaseView):
         Returns:
             Diccionario con los datos o None si hay error
         """
-        try:
-            # Recopilar datos
-            nombre = self.form_vars['nombre'].get().strip()
-            edad = int(self.form_vars['edad'].get())
-            peso = float(self.form_vars['peso'].get())
-            altura = float(self.form_vars['altura'].get())
-            
-            # Validar datos básicos
-            if not nombre:
-                self.show_error("Error", "El nombre es requerido")
-                return None
-            
-            if edad < 10 or edad > 100:
-                self.show_error("Error", "Edad inválida (10-100 años)")
-                return None
-            
-            if peso < 30 or peso > 300:
-                self.show_error("Error", "Peso inválido (30-300 kg)")
+        form_vars = self.form_vars
+        
+        # Leer todos los campos de una línea en una sola pasada
+        raw = {
+            name: widget.get().strip()
+            for name, widget in form_vars.items()
+            if isinstance(widget, tk.Entry)
+        }
+        nombre = raw['nombre']
+        
+        if not nombre:
+            self.show_error("Error", "El nombre es requerido")
+            return None
+        
+        # Una sola pasada sobre la tabla de campos numéricos
+        valores = {}
+        for name, cast, min_val, max_val, error_msg in _NUMERIC_FIELDS:
+            try:
+                value = cast(raw[name])
+            except ValueError:
+                self.show_error(
+                    "Error",
+                    "Por favor, ingresa valores numéricos válidos"
+                )
                 return None
             
-            if altura < 1.0 or altura > 2.5:
-                self.show_error("Error", "Altura inválida (1.0-2.5 m)")
+            if not min_val <= value <= max_val:
+                self.show_error("Error", error_msg)
                 return None
             
-            # Obtener limitaciones
-            limitaciones = self.form_vars['limitaciones'].get('1.0', 'end').strip()
-            
-            return {
-                'nombre': nombre,
-                'edad': edad,
-                'peso': peso,
-                'altura': altura,
-                'nivel_experiencia': self.form_vars['nivel'].get(),
-                'objetivo': self.form_vars['objetivo'].get(),
-                'dias_entrenamiento': self.form_vars['dias'].get(),
-                'limitaciones': limitaciones or 'ninguna',
-                'fecha_inicio': datetime.now().isoformat()
-            }
-            
-        except ValueError:
-            self.show_error(
-                "Error",
-                "Por favor, ingresa valores numéricos válidos"
-            )
-            return None
+            valores[name] = value
+        
+        limitaciones = raw['limitaciones']
+        
+        return {
+            'nombre': nombre,
+            'edad': valores['edad'],
+            'peso': valores['peso'],
+            'altura': valores['altura'],
+            'nivel_experiencia': form_vars['nivel'].get(),
+            'objetivo': form_vars['objetivo'].get(),
+            'dias_entrenamiento': form_vars['dias'].get(),
+            'limitaciones': limitaciones or 'ninguna'
+        }
     
     def _on_generate_clicked(self):
         """Maneja el clic en generar rutina."""
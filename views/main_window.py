@@ -6,13 +6,63 @@ implementando el patrón MVC.
 """
 
 import tkinter as tk
+from tkinter import messagebox
 from typing import Dict, Any, Optional
 
-from views.welcome_view import WelcomeView
-from views.form_view import FormView
-from views.routine_view import RoutineView
-from views.feedback_view import FeedbackView
-from views.thanks_view import ThanksView
+# Las vistas concretas se importan en sus factorías, al mostrarse por
+# primera vez, para no cargarlas antes de la pantalla de bienvenida
+from views.base_view import BaseView, COLORS, FONTS, FONT_FORM_TITLE
+
+
+# Plantilla de las estadísticas del header
+_STATS_HEADER_FMT = (
+    "Generación: {generacion} | "
+    "Usuarios: {total_usuarios} | "
+    "Satisfacción: {promedio_satisfaccion:.2f}/5 | "
+    "Éxito: {tasa_exito:.1f}%"
+)
+
+# Mensajes de estado de la vista de carga
+_LOADING_STATUS_TEXTS = (
+    "🔍 Analizando tu perfil...",
+    "📊 Calculando IMC y métricas...",
+    "🎯 Buscando patrones en usuarios similares...",
+    "💡 Generando combinaciones de ejercicios...",
+    "⚡ Optimizando parámetros de entrenamiento...",
+    "✨ Creando tu rutina personalizada..."
+)
+
+
+class LoadingView(BaseView):
+    """Vista de carga mostrada mientras la IA genera la rutina."""
+    
+    __slots__ = ()
+    
+    def build(self):
+        """Construye la interfaz de carga."""
+        self.frame = tk.Frame(
+            self.parent,
+            bg=self.colors['bg_dark']
+        )
+        
+        center_frame = tk.Frame(
+            self.frame,
+            bg=self.colors['bg_medium'],
+            padx=60,
+            pady=60
+        )
+        center_frame.place(relx=0.5, rely=0.5, anchor='center')
+        
+        loading_label = self.create_title_label(
+            center_frame,
+            "🧠 IA TRABAJANDO...",
+            font=FONT_FORM_TITLE
+        )
+        loading_label.pack(pady=20)
+        
+        for text in _LOADING_STATUS_TEXTS:
+            label = self.create_text_label(center_frame, text)
+            label.pack(pady=5, anchor='w')
 
 
 class MainWindow:
@@ -40,15 +90,6 @@ class MainWindow:
         # Configurar ventana
         self._setup_window()
         
-        # Colores del tema
-        self.colors = {
-            'bg_dark': '#1a1a2e',
-            'bg_medium': '#16213e',
-            'bg_light': '#0f3460',
-            'accent': '#00adb5',
-            'text': '#eeeeee'
-        }
-        
         # Contenedores
         self.header_frame = None
         self.main_container = None
@@ -56,6 +97,20 @@ class MainWindow:
         # Vistas
         self.views: Dict[str, Any] = {}
         self.current_view = None
+        self._current_view_name: Optional[str] = None
+        
+        # Factorías de vistas, construidas una sola vez
+        self._view_factories = {
+            'welcome': self._create_welcome_view,
+            'form': self._create_form_view,
+            'routine': self._create_routine_view,
+            'feedback': self._create_feedback_view,
+            'thanks': self._create_thanks_view,
+            'loading': self._create_loading_view
+        }
+        
+        # Estadísticas memorizadas hasta el próximo cambio de estado
+        self._cached_stats: Optional[Dict[str, Any]] = None
         
         # Datos de sesión
         self.session_data = {
@@ -66,21 +121,30 @@ class MainWindow:
         # Construir UI
         self._build_ui()
         
+        # Liberar las vistas al cerrar la ventana
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        
         # Mostrar vista inicial
         self.show_view('welcome')
     
+    def _on_close(self):
+        """Libera las vistas y cierra la ventana principal."""
+        for view in self.views.values():
+            view.dispose()
+        self.views.clear()
+        self.current_view = None
+        self.root.destroy()
+    
     def _setup_window(self):
         """Configura la ventana principal."""
         self.root.title("🏋️ Sistema de IA Adaptativo - Gimnasio")
-        self.root.geometry("1000x700")
-        self.root.configure(bg='#1a1a2e')
-        
-        # Centrar ventana
-        self.root.update_idletasks()
-        width = self.root.winfo_width()
-        height = self.root.winfo_height()
-        x = (self.root.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.root.winfo_screenheight() // 2) - (height // 2)
+        self.root.configure(bg=COLORS['bg_dark'])
+        
+        # Centrar ventana a partir del tamaño pedido, sin forzar un pase
+        # de layout con update_idletasks
+        width, height = 1000, 700
+        x = (self.root.winfo_screenwidth() - width) // 2
+        y = (self.root.winfo_screenheight() - height) // 2
         self.root.geometry(f'{width}x{height}+{x}+{y}')
     
     def _build_ui(self):
@@ -91,7 +155,7 @@ class MainWindow:
         # Contenedor principal para las vistas
         self.main_container = tk.Frame(
             self.root,
-            bg=self.colors['bg_dark']
+            bg=COLORS['bg_dark']
         )
         self.main_container.pack(fill='both', expand=True, padx=20, pady=20)
         
@@ -102,7 +166,7 @@ class MainWindow:
         """Construye el header de la aplicación."""
         self.header_frame = tk.Frame(
             self.root,
-            bg=self.colors['bg_light'],
+            bg=COLORS['bg_light'],
             height=80
         )
         self.header_frame.pack(fill='x', side='top')
@@ -112,9 +176,9 @@ class MainWindow:
         title = tk.Label(
             self.header_frame,
             text="🏋️ SISTEMA DE IA ADAPTATIVO PARA GIMNASIO",
-            font=('Helvetica', 18, 'bold'),
-            bg=self.colors['bg_light'],
-            fg=self.colors['accent']
+            font=FONTS['title'],
+            bg=COLORS['bg_light'],
+            fg=COLORS['accent']
         )
         title.pack(pady=20)
         
@@ -122,18 +186,37 @@ class MainWindow:
         self.stats_label = tk.Label(
             self.header_frame,
             text="",
-            font=('Helvetica', 9),
-            bg=self.colors['bg_light'],
-            fg=self.colors['text']
+            font=FONTS['small'],
+            bg=COLORS['bg_light'],
+            fg=COLORS['text']
         )
         self.stats_label.pack()
+        self._last_stats_text = ''
         
         self._update_header_stats()
     
-    def _update_header_stats(self):
-        """Actualiza las estadísticas del header."""
-        stats = self.app_controller.get_system_statistics()
-            
+    def _update_header_stats(self, stats: Optional[Dict[str, Any]] = None):
+        """
+        Actualiza las estadísticas del header.
+        
+        Args:
+            stats: Estadísticas ya calculadas (None para consultarlas)
+        """
+        if stats is None:
+            stats = self.get_system_statistics()
+        
+        stats_text = _STATS_HEADER_FMT.format_map(stats)
+        
+        # Solo ir a Tcl cuando el texto cambia
+        if stats_text != self._last_stats_text:
+            self.stats_label.config(text=stats_text)
+            self._last_stats_text = stats_text
+    
+    def _refresh_stats(self):
+        """Descarta las estadísticas memorizadas y actualiza el header."""
+        self._cached_stats = None
+        self._update_header_stats()
+    
     def show_view(self, view_name: str, **kwargs):
         """
         Muestra una vista específica.
@@ -142,12 +225,10 @@ class MainWindow:
             view_name: Nombre de la vista ('welcome', 'form', etc.)
             **kwargs: Datos adicionales para la vista
         """
-        # Actualizar estadísticas del header
-        self._update_header_stats()
-        
-        # Ocultar vista actual
-        if self.current_view:
-            self.current_view.hide()
+        # Ignorar navegaciones repetidas a la vista activa sin datos nuevos
+        # (p. ej. doble clic en un botón)
+        if view_name == self._current_view_name and not kwargs:
+            return
         
         # Obtener o crear la vista
         view = self._get_or_create_view(view_name, **kwargs)
@@ -168,9 +249,9 @@ class MainWindow:
                 elif view_name == 'thanks' and 'satisfaccion' in kwargs:
                     view.set_satisfaccion(kwargs['satisfaccion'])
             
-            # Mostrar vista
+            # Mostrar vista (oculta la vista activa y pasa a serlo)
             view.show()
-            self.current_view = view
+            self._current_view_name = view_name
             
             # Manejar vista de carga (loading)
             if view_name == 'loading':
@@ -187,16 +268,15 @@ class MainWindow:
         Returns:
             Instancia de la vista
         """
-        # Vistas que NO se reutilizan (se crean cada vez)
-        non_reusable = ['loading']
-        
-        if view_name in non_reusable or view_name not in self.views:
+        # Todas las vistas se reutilizan: se ocultan al navegar y se
+        # vuelven a mostrar sin reconstruir sus widgets
+        view = self.views.get(view_name)
+        if view is None:
             view = self._create_view(view_name, **kwargs)
-            if view and view_name not in non_reusable:
+            if view:
                 self.views[view_name] = view
-            return view
         
-        return self.views[view_name]
+        return view
     
     def _create_view(self, view_name: str, **kwargs):
         """
@@ -209,102 +289,84 @@ class MainWindow:
         Returns:
             Instancia de la vista
         """
-        view_map = {
-            'welcome': lambda: WelcomeView(self.main_container, self),
-            'form': lambda: FormView(self.main_container, self),
-            'routine': lambda: RoutineView(
-                self.main_container,
-                self,
-                kwargs.get('user_data'),
-                kwargs.get('routine')
-            ),
-            'feedback': lambda: FeedbackView(
-                self.main_container,
-                self,
-                kwargs.get('user_data'),
-                kwargs.get('routine')
-            ),
-            'thanks': lambda: ThanksView(
-                self.main_container,
-                self,
-                kwargs.get('satisfaccion', 3)
-            ),
-            'loading': lambda: self._create_loading_view(kwargs.get('user_data', {}))
-        }
-        
-        factory = view_map.get(view_name)
-        return factory() if factory else None
+        factory = self._view_factories.get(view_name)
+        return factory(**kwargs) if factory else None
+    
+    def _create_welcome_view(self, **kwargs):
+        """Crea la vista de bienvenida."""
+        from views.welcome_view import WelcomeView
+        return WelcomeView(self.main_container, self)
+    
+    def _create_form_view(self, **kwargs):
+        """Crea la vista del formulario."""
+        from views.form_view import FormView
+        return FormView(self.main_container, self)
     
-    def _create_loading_view(self, user_data: dict):
+    def _create_routine_view(self, **kwargs):
+        """Crea la vista de la rutina."""
+        from views.routine_view import RoutineView
+        return RoutineView(
+            self.main_container,
+            self,
+            kwargs.get('user_data'),
+            kwargs.get('routine')
+        )
+    
+    def _create_feedback_view(self, **kwargs):
+        """Crea la vista de feedback."""
+        from views.feedback_view import FeedbackView
+        return FeedbackView(
+            self.main_container,
+            self,
+            kwargs.get('user_data'),
+            kwargs.get('routine')
+        )
+    
+    def _create_thanks_view(self, **kwargs):
+        """Crea la vista de agradecimiento."""
+        from views.thanks_view import ThanksView
+        return ThanksView(
+            self.main_container,
+            self,
+            kwargs.get('satisfaccion', 3)
+        )
+    
+    def _create_loading_view(self, **kwargs):
+        """Crea la vista de carga."""
+        return LoadingView(self.main_container, self)
+    
+    def _handle_loading_view(self, user_data: dict):
         """
-        Crea una vista de carga temporal.
+        Maneja la vista de carga y genera la rutina.
         
         Args:
             user_data: Datos del usuario
-            
-        Returns:
-            Vista temporal
         """
-        from views.base_view import BaseView
-        
-        class LoadingView(BaseView):
-            def build(self):
-                self.frame = tk.Frame(
-                    self.parent,
-                    bg=self.colors['bg_dark']
-                )
-                
-                center_frame = tk.Frame(
-                    self.frame,
-                    bg=self.colors['bg_medium'],
-                    padx=60,
-                    pady=60
-                )
-                center_frame.place(relx=0.5, rely=0.5, anchor='center')
-                
-                loading_label = self.create_title_label(
-                    center_frame,
-                    "🧠 IA TRABAJANDO...",
-                    font=('Helvetica', 20, 'bold')
-                )
-                loading_label.pack(pady=20)
-                
-                status_texts = [
-                    "🔍 Analizando tu perfil...",
-                    "📊 Calculando IMC y métricas...",
-                    "🎯 Buscando patrones en usuarios similares...",
-                    "💡 Generando combinaciones de ejercicios...",
-                    "⚡ Optimizando parámetros de entrenamiento...",
-                    "✨ Creando tu rutina personalizada..."
-                ]
-                
-                for text in status_texts:
-                    label = self.create_text_label(center_frame, text)
-                    label.pack(pady=5, anchor='w')
-        
-        view = LoadingView(self.main_container, self)
-        
-        # Guardar datos de usuario en sesión
-        self.session_data['user_data'] = user_data
-        
-        return view
+        # Lanzar la generación en cuanto la vista de carga se ha dibujado;
+        # el trabajo corre en segundo plano y se sondea con after()
+        self.root.after_idle(self._generate_routine, user_data)
     
-    def _handle_loading_view(self, user_data: dict):
+    def _generate_routine(self, user_data: dict):
         """
-        Maneja la vista de carga y genera la rutina.
+        Lanza la generación de la rutina en segundo plano.
         
         Args:
             user_data: Datos del usuario
         """
-        # Programar generación de rutina después de mostrar la vista
-        self.root.after(1500, lambda: self._generate_routine(user_data))
+        future = self.app_controller.submit_task(
+            self._run_generation, user_data
+        )
+        self._poll_generation(future, user_data)
     
-    def _generate_routine(self, user_data: dict):
+    def _run_generation(self, user_data: dict) -> tuple:
         """
-        Genera la rutina usando el controlador.
+        Crea el usuario y genera la rutina (se ejecuta fuera del hilo de Tk).
         
         Args:
             user_data: Datos del usuario
+            
+        Returns:
+            Tupla (éxito, usuario, rutina_o_mensaje_error)
         """
         # Obtener controlador de rutinas
         routine_controller = self.app_controller.get_routine_controller()
@@ -313,38 +375,69 @@ class MainWindow:
         success, user_or_error = routine_controller.create_user_from_form(user_data)
         
         if not success:
-            self.show_error("Error", user_or_error)
-            self.show_view('form')
-            return
+            return False, None, user_or_error
         
         user = user_or_error
         
         # Generar rutina
         success, routine_or_error = routine_controller.generate_routine(user)
         
+        return success, user, routine_or_error
+    
+    def _poll_generation(self, future, user_data: dict):
+        """
+        Espera el resultado de la generación sin bloquear la interfaz.
+        
+        Args:
+            future: Future de la tarea de generación
+            user_data: Datos del usuario
+        """
+        if not future.done():
+            self.root.after(50, self._poll_generation, future, user_data)
+            return
+        
+        try:
+            success, user, routine_or_error = future.result()
+        except Exception as e:
+            success, user, routine_or_error = False, None, str(e)
+        
         if not success:
             self.show_error("Error", routine_or_error)
             self.show_view('form')
             return
         
-        routine = routine_or_error
+        self._show_generated_routine(user_data, user, routine_or_error)
+    
+    def _show_generated_routine(self, user_data: dict, user, routine):
+        """
+        Guarda la rutina generada en la sesión y la muestra.
         
-        # Preparar datos para mostrar
-        user_data_with_profile = user_data.copy()
-        user_data_with_profile['perfil'] = user.perfil.to_dict()
+        Args:
+            user_data: Datos del usuario
+            user: Usuario creado
+            routine: Rutina generada
+        """
+        # Preparar datos para mostrar: user_data es el diccionario creado
+        # por el formulario para esta generación, se completa en sitio
+        user_data['perfil'] = user.perfil.to_dict()
         
         routine_dict = routine.to_dict()
         
         # Guardar en sesión
-        self.session_data['user_data'] = user_data_with_profile
-        self.session_data['routine'] = routine_dict
-        self.session_data['user_object'] = user
-        self.session_data['routine_object'] = routine
+        self.session_data.update(
+            user_data=user_data,
+            routine=routine_dict,
+            user_object=user,
+            routine_object=routine
+        )
+        
+        # La generación registra la rutina en el sistema de aprendizaje
+        self._refresh_stats()
         
         # Mostrar rutina
         self.show_view(
             'routine',
-            user_data=user_data_with_profile,
+            user_data=user_data,
             routine=routine_dict
         )
     
@@ -371,23 +464,34 @@ class MainWindow:
         if not user or not routine_obj:
             return False, "Datos de sesión no disponibles"
         
-        return feedback_controller.submit_feedback(
+        result = feedback_controller.submit_feedback(
             user,
             routine_obj,
             satisfaction,
             comments
         )
+        
+        # El feedback modifica el sistema: refrescar las estadísticas
+        if result[0]:
+            self._refresh_stats()
+        
+        return result
     
     def get_system_statistics(self) -> Dict[str, Any]:
         """
         Obtiene estadísticas del sistema.
         
+        Se reutilizan hasta que la generación de una rutina o el envío de
+        feedback modifican el sistema; navegar no vuelve a consultarlas.
+        
         Returns:
             Diccionario con estadísticas
         """
-        return self.app_controller.get_system_statistics()
+        stats = self._cached_stats
+        if stats is None:
+            stats = self._cached_stats = self.app_controller.get_system_statistics()
+        return stats
     
     def show_error(self, title: str, message: str):
         """Muestra un mensaje de error."""
-        from tkinter import messagebox
         messagebox.showerror(title, message)
\ No newline at end of file
@@ -4,8 +4,14 @@ Vista de Rutina.
 Muestra la rutina generada con todos sus detalles.
 """
 
+import bisect
 import tkinter as tk
-from views.base_view import BaseView
+from views.base_view import BaseView, FONT_EMPHASIS
+
+
+# Categorías de IMC: límites superiores (exclusivos) y etiquetas
+_IMC_THRESHOLDS = (18.5, 25, 30)
+_IMC_LABELS = ("Bajo peso", "Peso normal", "Sobrepeso", "Obesidad")
 
 
 class RoutineView(BaseView):
@@ -18,43 +24,52 @@ class RoutineView(BaseView):
     - Botones de acción (feedback, nueva rutina)
     """
     
+    __slots__ = (
+        'user_data', 'routine', '_formatted_days', '_info_text',
+        '_title_label', '_info_label', '_routine_text'
+    )
+    
     def __init__(self, parent: tk.Widget, controller, user_data: dict = None, routine: dict = None):
         super().__init__(parent, controller)
         self.user_data = user_data or {}
         self.routine = routine or {}
+        self._formatted_days = self._format_days(self.routine)
+        self._info_text = self._compose_info_text()
+        
+        # Widgets que set_data actualiza en sitio
+        self._title_label = None
+        self._info_label = None
+        self._routine_text = None
     
     def build(self):
         """Construye la interfaz de la rutina."""
-        self.frame = tk.Frame(
-            self.parent,
-            bg=self.colors['bg_dark']
-        )
+        bg_dark = self.colors['bg_dark']
         
-        # Frame con scroll
-        canvas, scrollbar, scrollable_frame = self.create_scrollable_frame(
-            self.frame
-        )
+        if self.frame is None:
+            self.frame = tk.Frame(
+                self.parent,
+                bg=bg_dark
+            )
         
-        canvas.pack(side="left", fill="both", expand=True, padx=(0, 10))
-        scrollbar.pack(side="right", fill="y")
+        # Frame con scroll
+        scrollable_frame = self._build_scroll_frame()
         
-        # Contenido
+        # Contenido: se llena sin mapear y se empaqueta al final, de modo
+        # que Tk calcula la geometría de todos los días en una sola pasada
         content_frame = tk.Frame(
             scrollable_frame,
-            bg=self.colors['bg_dark'],
+            bg=bg_dark,
             padx=20,
             pady=20
         )
-        content_frame.pack(fill='both', expand=True)
         
         # Título personalizado
-        nombre = self.user_data.get('nombre', 'Usuario').upper()
-        title = self.create_title_label(
+        self._title_label = self.create_title_label(
             content_frame,
-            f"🎯 RUTINA PERSONALIZADA PARA {nombre}",
-            bg=self.colors['bg_dark']
+            self._compose_title(),
+            bg=bg_dark
         )
-        title.pack(pady=(0, 20))
+        self._title_label.pack(pady=(0, 20))
         
         # Análisis del perfil
         self._build_profile_analysis(content_frame)
@@ -64,9 +79,16 @@ class RoutineView(BaseView):
         
         # Botones de acción
         self._build_action_buttons(content_frame)
+        
+        content_frame.pack(fill='both', expand=True)
     
-    def _build_profile_analysis(self, parent: tk.Widget):
-        """Construye la sección de análisis del perfil."""
+    def _compose_title(self) -> str:
+        """Compone el título personalizado de la rutina."""
+        nombre = self.user_data.get('nombre', 'Usuario').upper()
+        return f"🎯 RUTINA PERSONALIZADA PARA {nombre}"
+    
+    def _compose_info_text(self) -> str:
+        """Compone el texto del análisis del perfil."""
         perfil = self.user_data.get('perfil', {})
         metadatos = self.routine.get('metadatos', {})
         
@@ -84,6 +106,10 @@ Edad: {perfil.get('edad')} años | Nivel: {perfil.get('nivel_str', '').title()}
             info_text += f"\n📚 Basado en {metadatos['basado_en']} perfiles similares exitosos"
             info_text += f"\n✅ Nivel de confianza: {metadatos.get('confianza', 0)*100:.0f}%"
         
+        return info_text
+    
+    def _build_profile_analysis(self, parent: tk.Widget):
+        """Construye la sección de análisis del perfil."""
         info_frame = tk.Frame(
             parent,
             bg=self.colors['bg_medium'],
@@ -92,42 +118,98 @@ Edad: {perfil.get('edad')} años | Nivel: {perfil.get('nivel_str', '').title()}
         )
         info_frame.pack(fill='x', pady=(0, 20))
         
-        info_label = self.create_text_label(
+        self._info_label = self.create_text_label(
             info_frame,
-            info_text,
+            self._info_text,
             justify='left'
         )
-        info_label.pack(anchor='w')
+        self._info_label.pack(anchor='w')
     
     def _build_weekly_routine(self, parent: tk.Widget):
-        """Construye la rutina semanal."""
-        rutina_semanal = self.routine.get('rutina_semanal', {})
-        
-        for dia, ejercicios in rutina_semanal.items():
-            dia_frame = tk.Frame(
-                parent,
-                bg=self.colors['bg_medium'],
-                padx=20,
-                pady=15
-            )
-            dia_frame.pack(fill='x', pady=10)
-            
-            # Título del día
-            dia_label = tk.Label(
-                dia_frame,
-                text=f"📅 {dia.upper()}",
-                font=('Helvetica', 13, 'bold'),
-                bg=self.colors['bg_medium'],
-                fg=self.colors['accent']
-            )
-            dia_label.pack(anchor='w', pady=(0, 10))
+        """
+        Construye la rutina semanal como un único widget Text de solo lectura.
+        
+        Args:
+            parent: Widget padre
+        """
+        c = self.colors
+        
+        # El alto del Text se fija en píxeles a través de este contenedor:
+        # height en líneas no cuenta el espaciado ni la fuente de los tags
+        wrapper = tk.Frame(parent, bg=c['bg_medium'])
+        wrapper.pack_propagate(False)
+        wrapper.pack(fill='x', pady=10)
+        
+        text = tk.Text(
+            wrapper,
+            bg=c['bg_medium'],
+            fg=c['text'],
+            font=self.fonts['normal'],
+            padx=20,
+            pady=15,
+            relief='flat',
+            highlightthickness=0,
+            wrap='none',
+            cursor='arrow'
+        )
+        text.tag_configure(
+            'day', font=FONT_EMPHASIS, foreground=c['accent'],
+            spacing1=15, spacing3=5
+        )
+        text.tag_configure('exercise', spacing1=5)
+        text.pack(fill='both', expand=True)
+        
+        self._routine_text = text
+        self._render_weekly_routine()
+    
+    def _render_weekly_routine(self):
+        """Vuelca los días y ejercicios preformateados en el widget Text."""
+        text = self._routine_text
+        chunks = []
+        
+        for dia, lineas in self._formatted_days:
+            chunks += (f"📅 {dia}\n", 'day')
+            for ej_text in lineas:
+                chunks += (ej_text + "\n", 'exercise')
+        
+        text.configure(state='normal')
+        text.delete('1.0', tk.END)
+        if chunks:
+            # Una sola llamada insert con pares (texto, tag)
+            text.insert(tk.END, *chunks)
+        text.configure(state='disabled')
+        
+        # Alto real del contenido (incluye espaciado y fuentes de los tags)
+        # más el relleno y el borde del widget
+        content_height = text.count('1.0', 'end', 'update', 'ypixels')
+        if isinstance(content_height, tuple):
+            content_height = content_height[0]
+        frame_height = 2 * (
+            int(text.cget('pady')) + int(text.cget('borderwidth'))
+            + int(text.cget('highlightthickness'))
+        )
+        text.master.configure(height=max(content_height or 0, 1) + frame_height)
+    
+    @classmethod
+    def _format_days(cls, routine: dict) -> list:
+        """
+        Preformatea los textos de la rutina semanal.
+        
+        Args:
+            routine: Rutina generada
             
-            # Ejercicios del día
-            for idx, ejercicio in enumerate(ejercicios, 1):
-                self._build_exercise_item(dia_frame, idx, ejercicio)
+        Returns:
+            Lista de tuplas (día en mayúsculas, líneas de ejercicios)
+        """
+        return [
+            (dia.upper(), [cls._format_exercise(idx, ej)
+                           for idx, ej in enumerate(ejercicios, 1)])
+            for dia, ejercicios in routine.get('rutina_semanal', {}).items()
+        ]
     
-    def _build_exercise_item(self, parent: tk.Widget, idx: int, ejercicio: dict):
-        """Construye un item de ejercicio."""
+    @staticmethod
+    def _format_exercise(idx: int, ejercicio: dict) -> str:
+        """Formatea el texto de un ejercicio."""
         # Nombre del ejercicio
         ej_text = f"{idx}. {ejercicio['ejercicio']} ({ejercicio['grupo'].title()})"
         
@@ -140,16 +222,13 @@ Edad: {perfil.get('edad')} años | Nivel: {perfil.get('nivel_str', '').title()}
             ej_text += f"\n   Duración: {ejercicio['duracion']} | "
             ej_text += f"Intensidad: {ejercicio['intensidad'].title()}"
         
-        ej_label = self.create_text_label(
-            parent,
-            ej_text,
-            justify='left'
-        )
-        ej_label.pack(anchor='w', pady=5)
+        return ej_text
     
     def _build_action_buttons(self, parent: tk.Widget):
         """Construye los botones de acción."""
-        btn_frame = tk.Frame(parent, bg=self.colors['bg_dark'])
+        c = self.colors
+        
+        btn_frame = tk.Frame(parent, bg=c['bg_dark'])
         btn_frame.pack(pady=30)
         
         # Botón feedback
@@ -157,9 +236,7 @@ Edad: {perfil.get('edad')} años | Nivel: {perfil.get('nivel_str', '').title()}
             btn_frame,
             "💬 DAR FEEDBACK",
             command=self._on_feedback_clicked,
-            bg=self.colors['success'],
-            padx=30,
-            pady=12
+            bg=c['success']
         )
         feedback_btn.pack(side='left', padx=10)
         
@@ -168,22 +245,13 @@ Edad: {perfil.get('edad')} años | Nivel: {perfil.get('nivel_str', '').title()}
             btn_frame,
             "🔄 NUEVA RUTINA",
             command=self._on_new_routine_clicked,
-            bg=self.colors['bg_light'],
-            padx=30,
-            pady=12
+            bg=c['bg_light']
         )
         new_btn.pack(side='left', padx=10)
     
     def _get_imc_category(self, imc: float) -> str:
         """Obtiene la categoría del IMC."""
-        if imc < 18.5:
-            return "Bajo peso"
-        elif imc < 25:
-            return "Peso normal"
-        elif imc < 30:
-            return "Sobrepeso"
-        else:
-            return "Obesidad"
+        return _IMC_LABELS[bisect.bisect_right(_IMC_THRESHOLDS, imc)]
     
     def _on_feedback_clicked(self):
         """Maneja el clic en dar feedback."""
@@ -207,9 +275,15 @@ Edad: {perfil.get('edad')} años | Nivel: {perfil.get('nivel_str', '').title()}
         """
         self.user_data = user_data
         self.routine = routine
+        self._formatted_days = self._format_days(routine)
+        
+        info_text = self._compose_info_text()
+        info_changed = info_text != self._info_text
+        self._info_text = info_text
         
-        # Reconstruir si ya está visible
-        if self.frame and self.frame.winfo_ismapped():
-            self.destroy()
-            self.build()
-            self.show()
\ No newline at end of file
+        # Actualizar en sitio los widgets ya construidos
+        if self.frame is not None:
+            self._title_label.config(text=self._compose_title())
+            if info_changed:
+                self._info_label.config(text=info_text)
+            self._render_weekly_routine()
\ No newline at end of file
@@ -5,7 +5,22 @@ Muestra agradecimiento después del feedback y estadísticas actualizadas.
 """
 
 import tkinter as tk
-from views.base_view import BaseView
+from views.base_view import BaseView, FONT_FORM_TITLE
+
+
+# Plantilla del mensaje de aprendizaje (se rellena con las estadísticas)
+_LEARNING_MESSAGE_FMT = """Tu opinión ha sido procesada y guardada.
+        
+El sistema ha aprendido de tu experiencia y usará
+este conocimiento para mejorar las futuras rutinas.
+
+📊 Estado actual del sistema:
+   • Generación: {generacion}
+   • Total usuarios: {total_usuarios}
+   • Satisfacción promedio: {promedio_satisfaccion:.2f}/5
+   • Tasa de éxito: {tasa_exito:.1f}%
+   
+¡Cada feedback hace que la IA sea más inteligente!"""
 
 
 class ThanksView(BaseView):
@@ -18,9 +33,13 @@ class ThanksView(BaseView):
     - Opciones para continuar
     """
     
+    __slots__ = ('satisfaccion', '_thanks_label', '_message_label')
+    
     def __init__(self, parent: tk.Widget, controller, satisfaccion: int = 3):
         super().__init__(parent, controller)
         self.satisfaccion = satisfaccion
+        self._thanks_label = None
+        self._message_label = None
     
     def build(self):
         """Construye la interfaz de agradecimiento."""
@@ -42,14 +61,14 @@ class ThanksView(BaseView):
         icon = self._get_icon_for_satisfaction()
         
         # Título con icono
-        thanks_label = tk.Label(
+        self._thanks_label = tk.Label(
             center_frame,
             text=f"{icon} ¡GRACIAS POR TU FEEDBACK!",
-            font=('Helvetica', 20, 'bold'),
+            font=FONT_FORM_TITLE,
             bg=self.colors['bg_medium'],
             fg=self.colors['success']
         )
-        thanks_label.pack(pady=20)
+        self._thanks_label.pack(pady=20)
         
         # Mensaje de aprendizaje
         self._build_learning_message(center_frame)
@@ -68,28 +87,18 @@ class ThanksView(BaseView):
     
     def _build_learning_message(self, parent: tk.Widget):
         """Construye el mensaje de aprendizaje."""
-        # Obtener estadísticas actualizadas
-        stats = self.controller.get_system_statistics()
-        
-        message = f"""Tu opinión ha sido procesada y guardada.
-        
-El sistema ha aprendido de tu experiencia y usará
-este conocimiento para mejorar las futuras rutinas.
-
-📊 Estado actual del sistema:
-   • Generación: {stats['generacion']}
-   • Total usuarios: {stats['total_usuarios']}
-   • Satisfacción promedio: {stats['promedio_satisfaccion']:.2f}/5
-   • Tasa de éxito: {stats['tasa_exito']:.1f}%
-   
-¡Cada feedback hace que la IA sea más inteligente!"""
-        
-        message_label = self.create_text_label(
+        self._message_label = self.create_text_label(
             parent,
-            message,
+            self._get_learning_message(),
             justify='center'
         )
-        message_label.pack(pady=20)
+        self._message_label.pack(pady=20)
+    
+    def _get_learning_message(self) -> str:
+        """Compone el mensaje de aprendizaje con las estadísticas actuales."""
+        stats = self.controller.get_system_statistics()
+        
+        return _LEARNING_MESSAGE_FMT.format_map(stats)
     
     def _build_navigation_buttons(self, parent: tk.Widget):
         """Construye los botones de navegación."""
@@ -100,9 +109,7 @@ este conocimiento para mejorar las futuras rutinas.
         home_btn = self.create_button(
             btn_frame,
             "🏠 INICIO",
-            command=self._on_home_clicked,
-            padx=30,
-            pady=12
+            command=self._on_home_clicked
         )
         home_btn.pack(side='left', padx=10)
         
@@ -111,9 +118,7 @@ este conocimiento para mejorar las futuras rutinas.
             btn_frame,
             "➕ NUEVA RUTINA",
             command=self._on_new_routine_clicked,
-            bg=self.colors['bg_light'],
-            padx=30,
-            pady=12
+            bg=self.colors['bg_light']
         )
         new_btn.pack(side='left', padx=10)
     
@@ -134,8 +139,9 @@ este conocimiento para mejorar las futuras rutinas.
         """
         self.satisfaccion = satisfaccion
         
-        # Reconstruir si ya está visible
-        if self.frame and self.frame.winfo_ismapped():
-            self.destroy()
-            self.build()
-            self.show()
\ No newline at end of file
+        # Actualizar los textos sobre los widgets ya construidos
+        if self.frame is not None:
+            self._thanks_label.config(
+                text=f"{self._get_icon_for_satisfaction()} ¡GRACIAS POR TU FEEDBACK!"
+            )
+            self._message_label.config(text=self._get_learning_message())
\ No newline at end of file
@@ -6,7 +6,16 @@ y da la bienvenida al usuario.
 """
 
 import tkinter as tk
-from views.base_view import BaseView
+from views.base_view import BaseView, FONT_HERO
+
+
+# Plantilla de la sección de estadísticas
+_STATS_FMT = """
+🧠 Generación actual del sistema: {generacion}
+👥 Usuarios que han ayudado a entrenar la IA: {total_usuarios}
+📊 Patrones exitosos identificados: {patrones_exitosos}
+🎯 Tasa de satisfacción promedio: {promedio_satisfaccion:.2f}/5
+"""
 
 
 class WelcomeView(BaseView):
@@ -20,6 +29,8 @@ class WelcomeView(BaseView):
     - Botón para comenzar
     """
     
+    __slots__ = ()
+    
     def build(self):
         """Construye la interfaz de bienvenida."""
         self.frame = tk.Frame(
@@ -40,7 +51,7 @@ class WelcomeView(BaseView):
         welcome_label = tk.Label(
             center_frame,
             text="💪 ¡BIENVENIDO!",
-            font=('Helvetica', 24, 'bold'),
+            font=FONT_HERO,
             bg=self.colors['bg_medium'],
             fg=self.colors['accent']
         )
@@ -71,7 +82,7 @@ y genera una rutina completamente personalizada para ti.
             center_frame,
             "COMENZAR →",
             command=self._on_start_clicked,
-            font=('Helvetica', 14, 'bold'),
+            font=self.fonts['subtitle'],
             padx=40,
             pady=15
         )
@@ -87,12 +98,7 @@ y genera una rutina completamente personalizada para ti.
         # Obtener estadísticas del controlador
         stats = self.controller.get_system_statistics()
         
-        stats_text = f"""
-🧠 Generación actual del sistema: {stats['generacion']}
-👥 Usuarios que han ayudado a entrenar la IA: {stats['total_usuarios']}
-📊 Patrones exitosos identificados: {stats['patrones_exitosos']}
-🎯 Tasa de satisfacción promedio: {stats['promedio_satisfaccion']:.2f}/5
-"""
+        stats_text = _STATS_FMT.format_map(stats)
         
         stats_label = self.create_text_label(
             parent,